@@ -2,7 +2,6 @@ package create
 
 import (
 	"fmt"
-	"os"
 	"strings"
 
 	forkliftv1beta1 "github.com/kubev2v/forklift/pkg/apis/forklift/v1beta1"
@@ -11,6 +10,7 @@ import (
 
 	"github.com/yaacov/kubectl-mtv/pkg/cmd/create/hook"
 	"github.com/yaacov/kubectl-mtv/pkg/util/client"
+	"github.com/yaacov/kubectl-mtv/pkg/util/flags"
 )
 
 // NewHookCmd creates the hook creation command
@@ -83,11 +83,11 @@ Examples:
 
 			if strings.HasPrefix(playbook, "@") {
 				filePath := playbook[1:]
-				fileContent, err := os.ReadFile(filePath)
+				fileContent, err := flags.ReadFileArg(filePath)
 				if err != nil {
 					return fmt.Errorf("failed to read playbook file %s: %v", filePath, err)
 				}
-				playbook = string(fileContent)
+				playbook = fileContent
 			}
 
 			if !isAAP {
@@ -2,7 +2,6 @@ package create
 
 import (
 	"fmt"
-	"os"
 	"strings"
 
 	forkliftv1beta1 "github.com/kubev2v/forklift/pkg/apis/forklift/v1beta1"
@@ -12,6 +11,7 @@ import (
 	"github.com/yaacov/kubectl-mtv/pkg/cmd/create/host"
 	"github.com/yaacov/kubectl-mtv/pkg/util/client"
 	"github.com/yaacov/kubectl-mtv/pkg/util/completion"
+	"github.com/yaacov/kubectl-mtv/pkg/util/flags"
 )
 
 // NewHostCmd creates the host creation command
@@ -100,11 +100,11 @@ Examples:
 
 			if strings.HasPrefix(cacert, "@") {
 				filePath := cacert[1:]
-				fileContent, err := os.ReadFile(filePath)
+				fileContent, err := flags.ReadFileArg(filePath)
 				if err != nil {
 					return fmt.Errorf("failed to read CA certificate file %s: %v", filePath, err)
 				}
-				cacert = string(fileContent)
+				cacert = fileContent
 			}
 
 			if !dryRun && outputFormat != "" {
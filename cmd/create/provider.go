@@ -134,11 +134,11 @@ Credentials can be provided directly via flags or through an existing Kubernetes
 			// Check if cacert starts with @ and load from file if so
 			if strings.HasPrefix(cacert, "@") {
 				filePath := cacert[1:]
-				fileContent, err := os.ReadFile(filePath)
+				fileContent, err := flags.ReadFileArg(filePath)
 				if err != nil {
 					return err
 				}
-				cacert = string(fileContent)
+				cacert = fileContent
 			}
 
 			if !dryRun && outputFormat != "" {
@@ -1,16 +1,12 @@
 package delete
 
 import (
-	"errors"
-	"fmt"
-
 	"github.com/spf13/cobra"
 	"k8s.io/cli-runtime/pkg/genericclioptions"
 
 	"github.com/yaacov/kubectl-mtv/pkg/cmd/delete/hook"
 	"github.com/yaacov/kubectl-mtv/pkg/util/client"
 	"github.com/yaacov/kubectl-mtv/pkg/util/completion"
-	"github.com/yaacov/kubectl-mtv/pkg/util/flags"
 )
 
 // NewHookCmd creates the delete hook command
@@ -24,42 +20,10 @@ func NewHookCmd(kubeConfigFlags *genericclioptions.ConfigFlags) *cobra.Command {
 		Args:         cobra.MaximumNArgs(1),
 		SilenceUsage: true,
 		RunE: func(cmd *cobra.Command, args []string) error {
-			if err := flags.ResolveNamesArg(&hookNames, args); err != nil {
-				return err
-			}
-
-			// Validate --all and --name are mutually exclusive
-			if all && len(hookNames) > 0 {
-				return errors.New("cannot use --name with --all")
-			}
-			if !all && len(hookNames) == 0 {
-				return errors.New("either --name or --all is required")
-			}
-
-			// Resolve the appropriate namespace based on context and flags
-			namespace := client.ResolveNamespace(kubeConfigFlags)
-
-			if all {
-				// Get all hook names from the namespace
-				var err error
-				hookNames, err = client.GetAllHookNames(cmd.Context(), kubeConfigFlags, namespace)
-				if err != nil {
-					return fmt.Errorf("failed to get all hook names: %v", err)
-				}
-				if len(hookNames) == 0 {
-					fmt.Printf("No hooks found in namespace %s\n", namespace)
-					return nil
-				}
-			}
-
-			// Loop over each hook name and delete it
-			for _, name := range hookNames {
-				err := hook.Delete(kubeConfigFlags, name, namespace)
-				if err != nil {
-					return err
-				}
-			}
-			return nil
+			return deleteByName(cmd.Context(), kubeConfigFlags, hookNames, args, all, "hook", client.GetAllHookNames,
+				func(name, namespace string) error {
+					return hook.Delete(kubeConfigFlags, name, namespace)
+				})
 		},
 	}
 
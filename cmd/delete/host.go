@@ -1,16 +1,12 @@
 package delete
 
 import (
-	"errors"
-	"fmt"
-
 	"github.com/spf13/cobra"
 	"k8s.io/cli-runtime/pkg/genericclioptions"
 
 	"github.com/yaacov/kubectl-mtv/pkg/cmd/delete/host"
 	"github.com/yaacov/kubectl-mtv/pkg/util/client"
 	"github.com/yaacov/kubectl-mtv/pkg/util/completion"
-	"github.com/yaacov/kubectl-mtv/pkg/util/flags"
 )
 
 // NewHostCmd creates the delete host command
@@ -24,42 +20,10 @@ func NewHostCmd(kubeConfigFlags *genericclioptions.ConfigFlags) *cobra.Command {
 		Args:         cobra.MaximumNArgs(1),
 		SilenceUsage: true,
 		RunE: func(cmd *cobra.Command, args []string) error {
-			if err := flags.ResolveNamesArg(&hostNames, args); err != nil {
-				return err
-			}
-
-			// Validate --all and --name are mutually exclusive
-			if all && len(hostNames) > 0 {
-				return errors.New("cannot use --name with --all")
-			}
-			if !all && len(hostNames) == 0 {
-				return errors.New("either --name or --all is required")
-			}
-
-			// Resolve the appropriate namespace based on context and flags
-			namespace := client.ResolveNamespace(kubeConfigFlags)
-
-			if all {
-				// Get all host names from the namespace
-				var err error
-				hostNames, err = client.GetAllHostNames(cmd.Context(), kubeConfigFlags, namespace)
-				if err != nil {
-					return fmt.Errorf("failed to get all host names: %v", err)
-				}
-				if len(hostNames) == 0 {
-					fmt.Printf("No hosts found in namespace %s\n", namespace)
-					return nil
-				}
-			}
-
-			// Loop over each host name and delete it
-			for _, name := range hostNames {
-				err := host.Delete(kubeConfigFlags, name, namespace)
-				if err != nil {
-					return err
-				}
-			}
-			return nil
+			return deleteByName(cmd.Context(), kubeConfigFlags, hostNames, args, all, "host", client.GetAllHostNames,
+				func(name, namespace string) error {
+					return host.Delete(kubeConfigFlags, name, namespace)
+				})
 		},
 	}
 
@@ -1,16 +1,12 @@
 package delete
 
 import (
-	"errors"
-	"fmt"
-
 	"github.com/spf13/cobra"
 	"k8s.io/cli-runtime/pkg/genericclioptions"
 
 	"github.com/yaacov/kubectl-mtv/pkg/cmd/delete/mapping"
 	"github.com/yaacov/kubectl-mtv/pkg/util/client"
 	"github.com/yaacov/kubectl-mtv/pkg/util/completion"
-	"github.com/yaacov/kubectl-mtv/pkg/util/flags"
 )
 
 // NewMappingCmd creates the mapping deletion command with subcommands
@@ -58,42 +54,10 @@ Ensure no migration plans reference the mapping before deletion.`,
 		Args:         cobra.MaximumNArgs(1),
 		SilenceUsage: true,
 		RunE: func(cmd *cobra.Command, args []string) error {
-			if err := flags.ResolveNamesArg(&mappingNames, args); err != nil {
-				return err
-			}
-
-			// Validate --all and --name are mutually exclusive
-			if all && len(mappingNames) > 0 {
-				return errors.New("cannot use --name with --all")
-			}
-			if !all && len(mappingNames) == 0 {
-				return errors.New("either --name or --all is required")
-			}
-
-			// Resolve the appropriate namespace based on context and flags
-			namespace := client.ResolveNamespace(kubeConfigFlags)
-
-			if all {
-				// Get all network mapping names from the namespace
-				var err error
-				mappingNames, err = client.GetAllNetworkMappingNames(cmd.Context(), kubeConfigFlags, namespace)
-				if err != nil {
-					return fmt.Errorf("failed to get all network mapping names: %v", err)
-				}
-				if len(mappingNames) == 0 {
-					fmt.Printf("No network mappings found in namespace %s\n", namespace)
-					return nil
-				}
-			}
-
-			// Loop over each mapping name and delete it
-			for _, name := range mappingNames {
-				err := mapping.Delete(kubeConfigFlags, name, namespace, "network")
-				if err != nil {
-					return err
-				}
-			}
-			return nil
+			return deleteByName(cmd.Context(), kubeConfigFlags, mappingNames, args, all, "network mapping", client.GetAllNetworkMappingNames,
+				func(name, namespace string) error {
+					return mapping.Delete(kubeConfigFlags, name, namespace, "network")
+				})
 		},
 	}
 
@@ -131,42 +95,10 @@ Ensure no migration plans reference the mapping before deletion.`,
 		Args:         cobra.MaximumNArgs(1),
 		SilenceUsage: true,
 		RunE: func(cmd *cobra.Command, args []string) error {
-			if err := flags.ResolveNamesArg(&mappingNames, args); err != nil {
-				return err
-			}
-
-			// Validate --all and --name are mutually exclusive
-			if all && len(mappingNames) > 0 {
-				return errors.New("cannot use --name with --all")
-			}
-			if !all && len(mappingNames) == 0 {
-				return errors.New("either --name or --all is required")
-			}
-
-			// Resolve the appropriate namespace based on context and flags
-			namespace := client.ResolveNamespace(kubeConfigFlags)
-
-			if all {
-				// Get all storage mapping names from the namespace
-				var err error
-				mappingNames, err = client.GetAllStorageMappingNames(cmd.Context(), kubeConfigFlags, namespace)
-				if err != nil {
-					return fmt.Errorf("failed to get all storage mapping names: %v", err)
-				}
-				if len(mappingNames) == 0 {
-					fmt.Printf("No storage mappings found in namespace %s\n", namespace)
-					return nil
-				}
-			}
-
-			// Loop over each mapping name and delete it
-			for _, name := range mappingNames {
-				err := mapping.Delete(kubeConfigFlags, name, namespace, "storage")
-				if err != nil {
-					return err
-				}
-			}
-			return nil
+			return deleteByName(cmd.Context(), kubeConfigFlags, mappingNames, args, all, "storage mapping", client.GetAllStorageMappingNames,
+				func(name, namespace string) error {
+					return mapping.Delete(kubeConfigFlags, name, namespace, "storage")
+				})
 		},
 	}
 
@@ -0,0 +1,57 @@
+package delete
+
+import (
+	"context"
+	"errors"
+	"fmt"
+
+	"k8s.io/cli-runtime/pkg/genericclioptions"
+
+	"github.com/yaacov/kubectl-mtv/pkg/util/client"
+	"github.com/yaacov/kubectl-mtv/pkg/util/flags"
+)
+
+// listNamesFunc lists the names of all resources of one kind in a namespace
+type listNamesFunc func(ctx context.Context, configFlags *genericclioptions.ConfigFlags, namespace string) ([]string, error)
+
+// deleteByName runs a delete command for resources selected by --name (or a
+// positional name) or --all, calling deleteOne for each selected name.
+// kind is the singular resource description used in messages (e.g. "hook").
+func deleteByName(ctx context.Context, kubeConfigFlags *genericclioptions.ConfigFlags, names, args []string, all bool,
+	kind string, listAll listNamesFunc, deleteOne func(name, namespace string) error) error {
+	if err := flags.ResolveNamesArg(&names, args); err != nil {
+		return err
+	}
+
+	// Validate --all and --name are mutually exclusive
+	if all && len(names) > 0 {
+		return errors.New("cannot use --name with --all")
+	}
+	if !all && len(names) == 0 {
+		return errors.New("either --name or --all is required")
+	}
+
+	// Resolve the appropriate namespace based on context and flags
+	namespace := client.ResolveNamespace(kubeConfigFlags)
+
+	if all {
+		// Get all resource names from the namespace
+		var err error
+		names, err = listAll(ctx, kubeConfigFlags, namespace)
+		if err != nil {
+			return fmt.Errorf("failed to get all %s names: %v", kind, err)
+		}
+		if len(names) == 0 {
+			fmt.Printf("No %ss found in namespace %s\n", kind, namespace)
+			return nil
+		}
+	}
+
+	// Loop over each name and delete it
+	for _, name := range names {
+		if err := deleteOne(name, namespace); err != nil {
+			return err
+		}
+	}
+	return nil
+}
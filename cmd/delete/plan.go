@@ -1,16 +1,12 @@
 package delete
 
 import (
-	"errors"
-	"fmt"
-
 	"github.com/spf13/cobra"
 	"k8s.io/cli-runtime/pkg/genericclioptions"
 
 	"github.com/yaacov/kubectl-mtv/pkg/cmd/delete/plan"
 	"github.com/yaacov/kubectl-mtv/pkg/util/client"
 	"github.com/yaacov/kubectl-mtv/pkg/util/completion"
-	"github.com/yaacov/kubectl-mtv/pkg/util/flags"
 )
 
 // NewPlanCmd creates the plan deletion command
@@ -45,42 +41,10 @@ to also clean up any target VMs created from failed migrations.`,
 		Args:         cobra.MaximumNArgs(1),
 		SilenceUsage: true,
 		RunE: func(cmd *cobra.Command, args []string) error {
-			if err := flags.ResolveNamesArg(&planNames, args); err != nil {
-				return err
-			}
-
-			// Validate --all and --name are mutually exclusive
-			if all && len(planNames) > 0 {
-				return errors.New("cannot use --name with --all")
-			}
-			if !all && len(planNames) == 0 {
-				return errors.New("either --name or --all is required")
-			}
-
-			// Resolve the appropriate namespace based on context and flags
-			namespace := client.ResolveNamespace(kubeConfigFlags)
-
-			if all {
-				// Get all plan names from the namespace
-				var err error
-				planNames, err = client.GetAllPlanNames(cmd.Context(), kubeConfigFlags, namespace)
-				if err != nil {
-					return fmt.Errorf("failed to get all plan names: %v", err)
-				}
-				if len(planNames) == 0 {
-					fmt.Printf("No plans found in namespace %s\n", namespace)
-					return nil
-				}
-			}
-
-			// Loop over each plan name and delete it
-			for _, name := range planNames {
-				err := plan.Delete(cmd.Context(), kubeConfigFlags, name, namespace, skipArchive, cleanAll)
-				if err != nil {
-					return err
-				}
-			}
-			return nil
+			return deleteByName(cmd.Context(), kubeConfigFlags, planNames, args, all, "plan", client.GetAllPlanNames,
+				func(name, namespace string) error {
+					return plan.Delete(cmd.Context(), kubeConfigFlags, name, namespace, skipArchive, cleanAll)
+				})
 		},
 	}
 
@@ -1,16 +1,12 @@
 package delete
 
 import (
-	"errors"
-	"fmt"
-
 	"github.com/spf13/cobra"
 	"k8s.io/cli-runtime/pkg/genericclioptions"
 
 	"github.com/yaacov/kubectl-mtv/pkg/cmd/delete/provider"
 	"github.com/yaacov/kubectl-mtv/pkg/util/client"
 	"github.com/yaacov/kubectl-mtv/pkg/util/completion"
-	"github.com/yaacov/kubectl-mtv/pkg/util/flags"
 )
 
 // NewProviderCmd creates the provider deletion command
@@ -36,42 +32,10 @@ Ensure no migration plans reference the provider before deletion.`,
 		Args:         cobra.MaximumNArgs(1),
 		SilenceUsage: true,
 		RunE: func(cmd *cobra.Command, args []string) error {
-			if err := flags.ResolveNamesArg(&providerNames, args); err != nil {
-				return err
-			}
-
-			// Validate --all and --name are mutually exclusive
-			if all && len(providerNames) > 0 {
-				return errors.New("cannot use --name with --all")
-			}
-			if !all && len(providerNames) == 0 {
-				return errors.New("either --name or --all is required")
-			}
-
-			// Resolve the appropriate namespace based on context and flags
-			namespace := client.ResolveNamespace(kubeConfigFlags)
-
-			if all {
-				// Get all provider names from the namespace
-				var err error
-				providerNames, err = client.GetAllProviderNames(cmd.Context(), kubeConfigFlags, namespace)
-				if err != nil {
-					return fmt.Errorf("failed to get all provider names: %v", err)
-				}
-				if len(providerNames) == 0 {
-					fmt.Printf("No providers found in namespace %s\n", namespace)
-					return nil
-				}
-			}
-
-			// Loop over each provider name and delete it
-			for _, name := range providerNames {
-				err := provider.Delete(kubeConfigFlags, name, namespace)
-				if err != nil {
-					return err
-				}
-			}
-			return nil
+			return deleteByName(cmd.Context(), kubeConfigFlags, providerNames, args, all, "provider", client.GetAllProviderNames,
+				func(name, namespace string) error {
+					return provider.Delete(kubeConfigFlags, name, namespace)
+				})
 		},
 	}
 
@@ -5,6 +5,7 @@ import (
 	"flag"
 	"fmt"
 	"os"
+	"sync"
 
 	"github.com/spf13/cobra"
 	"github.com/spf13/pflag"
@@ -21,6 +22,7 @@ import (
 	"github.com/yaacov/kubectl-mtv/cmd/health"
 	"github.com/yaacov/kubectl-mtv/cmd/help"
 	"github.com/yaacov/kubectl-mtv/cmd/mcpserver"
+	"github.com/yaacov/kubectl-mtv/cmd/mcpworker"
 	"github.com/yaacov/kubectl-mtv/cmd/patch"
 	"github.com/yaacov/kubectl-mtv/cmd/settings"
 	"github.com/yaacov/kubectl-mtv/cmd/start"
@@ -37,6 +39,7 @@ type GlobalConfig struct {
 	AllNamespaces            bool
 	UseUTC                   bool
 	NoColor                  bool
+	CompactJSON              bool
 	InventoryURL             string
 	InventoryInsecureSkipTLS bool
 	KubeConfigFlags          *genericclioptions.ConfigFlags
@@ -134,27 +137,37 @@ func init() {
 	// Export clientVersion to pkg/version for use by other packages
 	pkgversion.ClientVersion = clientVersion
 
-	kubeConfigFlags = genericclioptions.NewConfigFlags(true)
+	rootCmd, kubeConfigFlags, globalConfig = newRootCmd()
+}
+
+// klogInitOnce guards klog flag registration, which panics if done twice.
+// The root command can run more than once per process (see mcp-worker).
+var klogInitOnce sync.Once
+
+// newRootCmd builds the kubectl-mtv command tree with its own flag state.
+func newRootCmd() (*cobra.Command, *genericclioptions.ConfigFlags, *GlobalConfig) {
+	kubeConfigFlags := genericclioptions.NewConfigFlags(true)
 
 	// Initialize global configuration
-	globalConfig = &GlobalConfig{
+	globalConfig := &GlobalConfig{
 		KubeConfigFlags: kubeConfigFlags,
 	}
 
-	rootCmd = &cobra.Command{
+	rootCmd := &cobra.Command{
 		Use:   "kubectl-mtv",
 		Short: "Migration Toolkit for Virtualization CLI",
 		Long: `Migration Toolkit for Virtualization (MTV) CLI.
 Migrate virtual machines from VMware vSphere, oVirt (RHV), OpenStack, and OVA to KubeVirt on OpenShift/Kubernetes.`,
 		PersistentPreRun: func(cmd *cobra.Command, args []string) {
 			// Initialize klog with the verbosity level
-			klog.InitFlags(nil)
+			klogInitOnce.Do(func() { klog.InitFlags(nil) })
 			if err := flag.Set("v", fmt.Sprintf("%d", globalConfig.Verbosity)); err != nil {
 				klog.Warningf("Failed to set klog verbosity: %v", err)
 			}
 
 			// Disable ANSI color output when requested
 			output.SetColorEnabled(!globalConfig.NoColor)
+			output.SetJSONIndentEnabled(!globalConfig.CompactJSON)
 
 			// Log global configuration if verbosity is enabled
 			logDebugf("Global configuration - Verbosity: %d, All Namespaces: %t, NoColor: %t",
@@ -171,6 +184,9 @@ Migrate virtual machines from VMware vSphere, oVirt (RHV), OpenStack, and OVA to
 	rootCmd.PersistentFlags().StringVarP(&globalConfig.InventoryURL, "inventory-url", "i", os.Getenv("MTV_INVENTORY_URL"), "Base URL for the inventory service")
 	rootCmd.PersistentFlags().BoolVar(&globalConfig.InventoryInsecureSkipTLS, "inventory-insecure-skip-tls", os.Getenv("MTV_INVENTORY_INSECURE_SKIP_TLS") == "true", "Skip TLS verification for inventory service connections")
 	rootCmd.PersistentFlags().BoolVar(&globalConfig.NoColor, "no-color", os.Getenv("NO_COLOR") != "", "Disable colored output (also respects NO_COLOR env var)")
+	// --compact-json is set by the MCP server for the commands it runs
+	rootCmd.PersistentFlags().BoolVar(&globalConfig.CompactJSON, "compact-json", false, "Print JSON output without indentation")
+	_ = rootCmd.PersistentFlags().MarkHidden("compact-json")
 
 	// Mark global flags that should appear in AI/MCP tool descriptions.
 	// These are surfaced via the "llm-relevant" pflag annotation, which the help
@@ -206,6 +222,14 @@ Migrate virtual machines from VMware vSphere, oVirt (RHV), OpenStack, and OVA to
 	// Help command - replace default Cobra help with our enhanced version
 	// that supports machine-readable output for MCP server integration
 	rootCmd.SetHelpCommand(help.NewHelpCmd(rootCmd, clientVersion))
+
+	// MCP worker command - hidden helper that runs commands for the MCP server
+	rootCmd.AddCommand(mcpworker.NewMCPWorkerCmd(func() *cobra.Command {
+		root, _, _ := newRootCmd()
+		return root
+	}))
+
+	return rootCmd, kubeConfigFlags, globalConfig
 }
 
 // LLMRelevantAnnotation is the pflag annotation key used to mark flags
@@ -0,0 +1,117 @@
+package mcpserver
+
+import (
+	"context"
+	"io"
+	"strings"
+	"time"
+
+	"github.com/spf13/pflag"
+	"k8s.io/cli-runtime/pkg/genericclioptions"
+
+	"github.com/yaacov/kubectl-mtv/pkg/cmd/archive/plan"
+	cutoverplan "github.com/yaacov/kubectl-mtv/pkg/cmd/cutover/plan"
+	"github.com/yaacov/kubectl-mtv/pkg/mcp/util"
+	"github.com/yaacov/kubectl-mtv/pkg/util/client"
+)
+
+// registerDirectCommands registers the in-process implementations used by
+// --direct-api. Each one is a few API calls on custom resources, where starting
+// a kubectl-mtv process costs far more than the API calls themselves.
+func registerDirectCommands() {
+	util.RegisterDirectCommand("archive/plan", directArchivePlan(true))
+	util.RegisterDirectCommand("unarchive/plan", directArchivePlan(false))
+	util.RegisterDirectCommand("cutover/plan", directCutoverPlan)
+}
+
+// directArchivePlan archives or unarchives the plans named by --name in-process.
+// Any flag other than --name and --namespace (for example --all) is left to
+// the kubectl-mtv process.
+func directArchivePlan(archived bool) util.DirectCommand {
+	return func(ctx context.Context, args []string) (string, bool, error) {
+		fs := pflag.NewFlagSet("direct", pflag.ContinueOnError)
+		fs.SetOutput(io.Discard)
+		names := fs.StringSliceP("name", "M", nil, "")
+		namespace := fs.StringP("namespace", "n", "", "")
+		if err := fs.Parse(args); err != nil || fs.NArg() > 0 || len(*names) == 0 {
+			return "", false, nil
+		}
+
+		configFlags := directConfigFlags(ctx)
+		if *namespace != "" {
+			configFlags.Namespace = namespace
+		}
+		ns := client.ResolveNamespace(configFlags)
+
+		var stdout strings.Builder
+		for _, name := range *names {
+			if err := plan.SetArchived(ctx, configFlags, name, ns, archived); err != nil {
+				return stdout.String(), true, err
+			}
+			stdout.WriteString(plan.ArchivedMessage(name, archived))
+			stdout.WriteByte('\n')
+		}
+		return stdout.String(), true, nil
+	}
+}
+
+// directCutoverPlan sets the cutover time of the plans named by --name
+// in-process. Any flag other than --name, --namespace and --cutover (for
+// example --all), or a cutover time that does not parse, is left to the
+// kubectl-mtv process.
+func directCutoverPlan(ctx context.Context, args []string) (string, bool, error) {
+	fs := pflag.NewFlagSet("direct", pflag.ContinueOnError)
+	fs.SetOutput(io.Discard)
+	names := fs.StringSliceP("name", "M", nil, "")
+	namespace := fs.StringP("namespace", "n", "", "")
+	cutoverStr := fs.StringP("cutover", "c", "", "")
+	if err := fs.Parse(args); err != nil || fs.NArg() > 0 || len(*names) == 0 {
+		return "", false, nil
+	}
+
+	var cutoverTime *time.Time
+	if *cutoverStr != "" {
+		t, err := time.Parse(time.RFC3339, *cutoverStr)
+		if err != nil {
+			return "", false, nil
+		}
+		cutoverTime = &t
+	}
+
+	configFlags := directConfigFlags(ctx)
+	if *namespace != "" {
+		configFlags.Namespace = namespace
+	}
+	ns := client.ResolveNamespace(configFlags)
+
+	var stdout strings.Builder
+	for _, name := range *names {
+		cutover, err := cutoverplan.SetCutover(ctx, configFlags, name, ns, cutoverTime)
+		if err != nil {
+			return stdout.String(), true, err
+		}
+		stdout.WriteString(cutoverplan.CutoverMessage(name, cutover))
+		stdout.WriteByte('\n')
+	}
+	return stdout.String(), true, nil
+}
+
+// directConfigFlags builds client config flags from the request's Kubernetes
+// credentials, matching the flags passed to kubectl-mtv processes.
+func directConfigFlags(ctx context.Context) *genericclioptions.ConfigFlags {
+	creds := util.ResolveKubeCredentials(ctx)
+	configFlags := genericclioptions.NewConfigFlags(true)
+	if creds.Server != "" {
+		configFlags.APIServer = &creds.Server
+	}
+	if creds.Token != "" {
+		configFlags.BearerToken = &creds.Token
+	}
+	if creds.CACert != "" {
+		configFlags.CAFile = &creds.CACert
+	}
+	if creds.InsecureSkipTLS {
+		configFlags.Insecure = &creds.InsecureSkipTLS
+	}
+	return configFlags
+}
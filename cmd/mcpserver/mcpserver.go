@@ -34,6 +34,16 @@ var (
 	kubeCACert       string
 	maxResponseChars int
 	readOnly         bool
+	maxConcurrency   int
+	maxOutputBytes   int
+	readCacheTTL     time.Duration
+	persistentWorker bool
+	workerPoolSize   int
+	directAPI        bool
+	spillDir         string
+	spillThreshold   int
+	spillMaxAge      time.Duration
+	discoveryCache   string
 )
 
 // NewMCPServerCmd creates the mcp-server command
@@ -99,6 +109,34 @@ Manual Claude config: Add to claude_desktop_config.json:
 			// Set max response size (helps small LLMs stay within context window)
 			util.SetMaxResponseChars(maxResponseChars)
 
+			// Stop commands whose output would not fit in memory
+			util.SetMaxOutputBytes(maxOutputBytes)
+
+			// Save large text outputs to files instead of returning them inline
+			util.SetSpillMaxAge(spillMaxAge)
+			util.SetSpillDir(spillDir)
+			util.SetSpillThreshold(spillThreshold)
+
+			// Bound the number of kubectl-mtv subprocesses running at once
+			util.SetMaxConcurrency(maxConcurrency)
+
+			// Answer identical repeated reads from the response cache
+			util.SetReadCacheTTL(readCacheTTL)
+
+			// Optionally run commands in long-lived worker processes
+			if persistentWorker {
+				util.SetPersistentWorker(workerPoolSize)
+				defer util.SetPersistentWorker(0)
+			}
+
+			// Optionally run simple lifecycle commands through the Kubernetes API in-process
+			if directAPI {
+				registerDirectCommands()
+			}
+
+			// Reuse the command schema cached by an earlier start of the same binary
+			discovery.SetSchemaCacheDir(discoveryCache)
+
 			// Set default Kubernetes credentials from CLI flags
 			// These serve as fallback when HTTP headers don't provide credentials
 			util.SetDefaultKubeServer(kubeServer)
@@ -116,6 +154,9 @@ Manual Claude config: Add to claude_desktop_config.json:
 			ctx, cancel := context.WithCancel(context.Background())
 			defer cancel()
 
+			// Prime the binary, kubeconfig and API server connection in the background
+			go util.Warmup(ctx)
+
 			// Setup signal handling for graceful shutdown
 			sigChan := make(chan os.Signal, 1)
 			signal.Notify(sigChan, os.Interrupt, syscall.SIGTERM)
@@ -130,8 +171,10 @@ Manual Claude config: Add to claude_desktop_config.json:
 					return fmt.Errorf("failed to discover commands: %w", err)
 				}
 
+				defs := newToolDefinitions(registry)
+
 				innerHandler := mcp.NewStreamableHTTPHandler(func(req *http.Request) *mcp.Server {
-					server, err := createMCPServerWithRegistry(registry, readOnly)
+					server, err := createMCPServerWithRegistry(registry, defs, readOnly)
 					if err != nil {
 						klog.Errorf("Failed to create server: %v", err)
 						return nil
@@ -242,7 +285,17 @@ Manual Claude config: Add to claude_desktop_config.json:
 	mcpCmd.Flags().BoolVar(&insecureSkipTLS, "insecure-skip-tls-verify", false, "Skip TLS certificate verification for Kubernetes API connections")
 	mcpCmd.Flags().StringVar(&kubeCACert, "certificate-authority", "", "Path to a CA certificate file for Kubernetes API TLS verification")
 	mcpCmd.Flags().IntVar(&maxResponseChars, "max-response-chars", 0, "Max characters for text output (0=unlimited). Helps small LLMs by truncating long responses")
+	mcpCmd.Flags().IntVar(&maxOutputBytes, "max-output-bytes", util.DefaultMaxOutputBytes, "Max stdout size in bytes of a command; larger outputs fail with a request to narrow the command (0=unlimited)")
+	mcpCmd.Flags().StringVar(&spillDir, "spill-dir", "", "Directory to save large outputs to; the response then holds a preview and the file path (empty=disabled)")
+	mcpCmd.Flags().IntVar(&spillThreshold, "spill-threshold", util.DefaultSpillThreshold, "Output size in bytes above which output is saved to --spill-dir")
+	mcpCmd.Flags().DurationVar(&spillMaxAge, "spill-max-age", util.DefaultSpillMaxAge, "Time a file saved to --spill-dir is kept; older files, and the oldest beyond 100 files, are deleted")
 	mcpCmd.Flags().BoolVar(&readOnly, "read-only", false, "Run in read-only mode (disables write operations)")
+	mcpCmd.Flags().IntVar(&maxConcurrency, "max-concurrency", util.DefaultMaxConcurrency, "Max number of kubectl-mtv commands executed concurrently; further tool calls wait for a free slot")
+	mcpCmd.Flags().DurationVar(&readCacheTTL, "read-cache-ttl", util.DefaultReadCacheTTL, "Time a read command's response is reused for identical read calls; writes clear it (0=disabled)")
+	mcpCmd.Flags().StringVar(&discoveryCache, "discovery-cache-dir", discovery.GetSchemaCacheDir(), "Directory for caching the discovered command schema between server starts (empty=disabled)")
+	mcpCmd.Flags().BoolVar(&persistentWorker, "persistent-worker", false, "Run commands in a long-lived kubectl-mtv worker process instead of starting a new process per tool call")
+	mcpCmd.Flags().IntVar(&workerPoolSize, "worker-pool-size", util.DefaultWorkerPoolSize, "Number of persistent worker processes used with --persistent-worker")
+	mcpCmd.Flags().BoolVar(&directAPI, "direct-api", false, "Run archive/unarchive/cutover plan commands through the Kubernetes API in-process instead of starting kubectl-mtv")
 
 	return mcpCmd
 }
@@ -255,29 +308,51 @@ func createMCPServer(readOnlyMode bool) (*mcp.Server, error) {
 	if err != nil {
 		return nil, fmt.Errorf("failed to discover commands: %w", err)
 	}
-	return createMCPServerWithRegistry(registry, readOnlyMode)
+	return createMCPServerWithRegistry(registry, newToolDefinitions(registry), readOnlyMode)
+}
+
+// toolDefinitions holds the server instructions and tool definitions
+// generated from the command registry. Generating them walks the whole
+// command tree, so HTTP mode, which creates a server per request, builds
+// them once and shares them between servers.
+type toolDefinitions struct {
+	instructions string
+	read         *mcp.Tool
+	help         *mcp.Tool
+	write        *mcp.Tool
+}
+
+// newToolDefinitions generates the tool definitions for a registry.
+func newToolDefinitions(registry *discovery.Registry) *toolDefinitions {
+	return &toolDefinitions{
+		instructions: registry.GenerateServerInstructions(),
+		read:         tools.GetMTVReadTool(registry),
+		help:         tools.GetMTVHelpTool(),
+		write:        tools.GetMTVWriteTool(registry),
+	}
 }
 
-// createMCPServerWithRegistry builds an MCP server from a pre-built registry.
-// HTTP mode calls this per-request so that each POST gets its own server
-// instance while reusing the (static) command schema discovered at startup.
+// createMCPServerWithRegistry builds an MCP server from a pre-built registry
+// and its tool definitions. HTTP mode calls this per-request so that each POST
+// gets its own server instance while reusing the (static) command schema and
+// tool definitions built at startup.
 //
 // In HTTP mode, the SDK populates req.Extra.Header on every POST with that
 // request's HTTP headers, giving each tool call fresh auth credentials.
 // In stdio mode, there are no HTTP headers and we fall back to CLI defaults.
-func createMCPServerWithRegistry(registry *discovery.Registry, readOnlyMode bool) (*mcp.Server, error) {
+func createMCPServerWithRegistry(registry *discovery.Registry, defs *toolDefinitions, readOnlyMode bool) (*mcp.Server, error) {
 	server := mcp.NewServer(&mcp.Implementation{
 		Name:    "kubectl-mtv",
 		Version: version.ClientVersion,
 	}, &mcp.ServerOptions{
-		Instructions: registry.GenerateServerInstructions(),
+		Instructions: defs.instructions,
 	})
 
-	tools.AddToolWithCoercion(server, tools.GetMTVReadTool(registry), tools.HandleMTVRead(registry))
-	mcp.AddTool(server, tools.GetMTVHelpTool(), tools.HandleMTVHelp)
+	tools.AddToolWithCoercion(server, defs.read, tools.HandleMTVRead(registry))
+	mcp.AddTool(server, defs.help, tools.HandleMTVHelp)
 
 	if !readOnlyMode {
-		tools.AddToolWithCoercion(server, tools.GetMTVWriteTool(registry), tools.HandleMTVWrite(registry))
+		tools.AddToolWithCoercion(server, defs.write, tools.HandleMTVWrite(registry))
 	} else {
 		klog.V(1).Info("Running in read-only mode - write operations disabled")
 	}
@@ -0,0 +1,43 @@
+package mcpworker
+
+import (
+	"os"
+
+	"github.com/spf13/cobra"
+	"github.com/yaacov/kubectl-mtv/pkg/mcp/worker"
+)
+
+// NewMCPWorkerCmd creates the hidden mcp-worker command.
+//
+// The MCP server starts it as a long-lived child process (see --persistent-worker)
+// and sends it kubectl-mtv command lines over stdin, avoiding a process start
+// per tool call. newRootCmd must return a fresh command tree, so flag values
+// never leak from one command into the next.
+func NewMCPWorkerCmd(newRootCmd func() *cobra.Command) *cobra.Command {
+	return &cobra.Command{
+		Use:          "mcp-worker",
+		Short:        "Run kubectl-mtv commands received on stdin (used by mcp-server)",
+		Hidden:       true,
+		Args:         cobra.NoArgs,
+		SilenceUsage: true,
+		RunE: func(cmd *cobra.Command, args []string) error {
+			// Keep the protocol streams; commands must not read from or write to them
+			in, out := os.Stdin, os.Stdout
+			devNull, err := os.Open(os.DevNull)
+			if err != nil {
+				return err
+			}
+			defer devNull.Close()
+			os.Stdin = devNull
+
+			return worker.Serve(in, out, func(args []string) int {
+				root := newRootCmd()
+				root.SetArgs(args)
+				if err := root.Execute(); err != nil {
+					return 1
+				}
+				return 0
+			})
+		},
+	}
+}
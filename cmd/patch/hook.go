@@ -2,7 +2,6 @@ package patch
 
 import (
 	"fmt"
-	"os"
 	"strings"
 
 	"github.com/spf13/cobra"
@@ -64,11 +63,11 @@ Examples:
 
 			if opts.PlaybookChanged && strings.HasPrefix(opts.Playbook, "@") {
 				filePath := opts.Playbook[1:]
-				fileContent, err := os.ReadFile(filePath)
+				fileContent, err := flags.ReadFileArg(filePath)
 				if err != nil {
 					return fmt.Errorf("failed to read playbook file %s: %v", filePath, err)
 				}
-				opts.Playbook = string(fileContent)
+				opts.Playbook = fileContent
 			}
 
 			return hook.PatchHook(opts)
@@ -47,11 +47,11 @@ func NewProviderCmd(kubeConfigFlags *genericclioptions.ConfigFlags) *cobra.Comma
 			// Check if cacert starts with @ and load from file if so
 			if strings.HasPrefix(opts.CACert, "@") {
 				filePath := opts.CACert[1:]
-				fileContent, err := os.ReadFile(filePath)
+				fileContent, err := flags.ReadFileArg(filePath)
 				if err != nil {
 					return fmt.Errorf("failed to read CA certificate file '%s': %v", filePath, err)
 				}
-				opts.CACert = string(fileContent)
+				opts.CACert = fileContent
 			}
 
 			// Set flag change tracking
@@ -14,6 +14,16 @@ import (
 
 // Archive sets the archived flag on a plan
 func Archive(ctx context.Context, configFlags *genericclioptions.ConfigFlags, planName, namespace string, archived bool) error {
+	if err := SetArchived(ctx, configFlags, planName, namespace, archived); err != nil {
+		return err
+	}
+
+	fmt.Println(ArchivedMessage(planName, archived))
+	return nil
+}
+
+// SetArchived sets the archived flag on a plan without printing anything
+func SetArchived(ctx context.Context, configFlags *genericclioptions.ConfigFlags, planName, namespace string, archived bool) error {
 	c, err := client.GetDynamicClient(configFlags)
 	if err != nil {
 		return fmt.Errorf("failed to get client: %v", err)
@@ -49,11 +59,14 @@ func Archive(ctx context.Context, configFlags *genericclioptions.ConfigFlags, pl
 		return fmt.Errorf("failed to update plan: %v", err)
 	}
 
+	return nil
+}
+
+// ArchivedMessage returns the status line reported after archiving or unarchiving a plan
+func ArchivedMessage(planName string, archived bool) string {
 	action := "archived"
 	if !archived {
 		action = "unarchived"
 	}
-
-	fmt.Printf("Plan '%s' %s\n", planName, action)
-	return nil
+	return fmt.Sprintf("Plan '%s' %s", planName, action)
 }
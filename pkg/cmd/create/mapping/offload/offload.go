@@ -7,7 +7,6 @@ package offload
 import (
 	"context"
 	"fmt"
-	"os"
 	"strings"
 
 	corev1 "k8s.io/api/core/v1"
@@ -15,6 +14,7 @@ import (
 	"k8s.io/cli-runtime/pkg/genericclioptions"
 
 	"github.com/yaacov/kubectl-mtv/pkg/util/client"
+	"github.com/yaacov/kubectl-mtv/pkg/util/flags"
 )
 
 // SecretOptions holds the fields needed to build an offload Secret.
@@ -37,11 +37,11 @@ func BuildSecret(namespace, baseName string, opts SecretOptions, dryRun bool) (*
 	cacert := opts.CACert
 	if strings.HasPrefix(cacert, "@") {
 		filePath := cacert[1:]
-		fileContent, err := os.ReadFile(filePath)
+		fileContent, err := flags.ReadFileArg(filePath)
 		if err != nil {
 			return nil, fmt.Errorf("failed to read CA certificate file %s: %v", filePath, err)
 		}
-		cacert = string(fileContent)
+		cacert = fileContent
 	}
 
 	secretData := map[string][]byte{}
@@ -98,6 +98,39 @@ func createTypedProvider(configFlags *genericclioptions.ConfigFlags, namespace s
 	return createdProvider, nil
 }
 
+// boolSetting returns "true" for an enabled boolean setting, or "" to omit it.
+func boolSetting(enabled bool) string {
+	if enabled {
+		return "true"
+	}
+	return ""
+}
+
+// vddkConfigSetting returns the vddkConfig setting for the VDDK buffer options,
+// or "" if neither is set.
+func vddkConfigSetting(bufSizeIn64K, bufCount int) string {
+	if bufSizeIn64K <= 0 && bufCount <= 0 {
+		return ""
+	}
+
+	var vddkConfig strings.Builder
+
+	// Start with YAML literal block scalar format
+	vddkConfig.WriteString("|")
+
+	if bufSizeIn64K > 0 {
+		vddkConfig.WriteString("\nVixDiskLib.nfcAio.Session.BufSizeIn64K=")
+		vddkConfig.WriteString(strconv.Itoa(bufSizeIn64K))
+	}
+
+	if bufCount > 0 {
+		vddkConfig.WriteString("\nVixDiskLib.nfcAio.Session.BufCount=")
+		vddkConfig.WriteString(strconv.Itoa(bufCount))
+	}
+
+	return vddkConfig.String()
+}
+
 // CreateProvider implements the ProviderCreator interface for VSphere
 func CreateProvider(configFlags *genericclioptions.ConfigFlags, options providerutil.ProviderOptions) (*forkliftv1beta1.Provider, *corev1.Secret, error) {
 	// Validate required fields
@@ -117,50 +150,22 @@ func CreateProvider(configFlags *genericclioptions.ConfigFlags, options provider
 	provider.Spec.Type = &providerTypeValue
 	provider.Spec.URL = options.URL
 
-	// Initialize settings map if any settings are provided
-	if options.VddkInitImage != "" || options.SdkEndpoint != "" || options.UseVddkAioOptimization ||
-		options.VddkBufSizeIn64K > 0 || options.VddkBufCount > 0 || options.EsxiCloneMethod != "" {
-		provider.Spec.Settings = map[string]string{}
-	}
-
-	// Set VDDK init image if provided
-	if options.VddkInitImage != "" {
-		provider.Spec.Settings["vddkInitImage"] = options.VddkInitImage
-	}
-
-	// Set SDK endpoint if provided
-	if options.SdkEndpoint != "" {
-		provider.Spec.Settings["sdkEndpoint"] = options.SdkEndpoint
-	}
-
-	// Set VDDK AIO optimization if enabled
-	if options.UseVddkAioOptimization {
-		provider.Spec.Settings["useVddkAioOptimization"] = "true"
-	}
-
-	// Set VDDK configuration if buffer settings are provided
-	if options.VddkBufSizeIn64K > 0 || options.VddkBufCount > 0 {
-		var vddkConfig strings.Builder
-
-		// Start with YAML literal block scalar format
-		vddkConfig.WriteString("|")
-
-		if options.VddkBufSizeIn64K > 0 {
-			vddkConfig.WriteString("\nVixDiskLib.nfcAio.Session.BufSizeIn64K=")
-			vddkConfig.WriteString(strconv.Itoa(options.VddkBufSizeIn64K))
+	// Set provider settings; options left empty are omitted
+	settings := []struct{ key, value string }{
+		{"vddkInitImage", options.VddkInitImage},
+		{"sdkEndpoint", options.SdkEndpoint},
+		{"useVddkAioOptimization", boolSetting(options.UseVddkAioOptimization)},
+		{"vddkConfig", vddkConfigSetting(options.VddkBufSizeIn64K, options.VddkBufCount)},
+		{"esxiCloneMethod", options.EsxiCloneMethod},
+	}
+	for _, setting := range settings {
+		if setting.value == "" {
+			continue
 		}
-
-		if options.VddkBufCount > 0 {
-			vddkConfig.WriteString("\nVixDiskLib.nfcAio.Session.BufCount=")
-			vddkConfig.WriteString(strconv.Itoa(options.VddkBufCount))
+		if provider.Spec.Settings == nil {
+			provider.Spec.Settings = map[string]string{}
 		}
-
-		provider.Spec.Settings["vddkConfig"] = vddkConfig.String()
-	}
-
-	// Set ESXi clone method if provided
-	if options.EsxiCloneMethod != "" {
-		provider.Spec.Settings["esxiCloneMethod"] = options.EsxiCloneMethod
+		provider.Spec.Settings[setting.key] = setting.value
 	}
 
 	// Create and set the Secret
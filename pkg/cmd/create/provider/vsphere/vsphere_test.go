@@ -0,0 +1,34 @@
+package vsphere
+
+import "testing"
+
+func TestVddkConfigSetting(t *testing.T) {
+	tests := []struct {
+		name         string
+		bufSizeIn64K int
+		bufCount     int
+		want         string
+	}{
+		{name: "unset", want: ""},
+		{name: "buffer size only", bufSizeIn64K: 16, want: "|\nVixDiskLib.nfcAio.Session.BufSizeIn64K=16"},
+		{name: "buffer count only", bufCount: 4, want: "|\nVixDiskLib.nfcAio.Session.BufCount=4"},
+		{name: "both", bufSizeIn64K: 16, bufCount: 4, want: "|\nVixDiskLib.nfcAio.Session.BufSizeIn64K=16\nVixDiskLib.nfcAio.Session.BufCount=4"},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			if got := vddkConfigSetting(tt.bufSizeIn64K, tt.bufCount); got != tt.want {
+				t.Errorf("vddkConfigSetting() = %q, want %q", got, tt.want)
+			}
+		})
+	}
+}
+
+func TestBoolSetting(t *testing.T) {
+	if got := boolSetting(true); got != "true" {
+		t.Errorf("boolSetting(true) = %q, want \"true\"", got)
+	}
+	if got := boolSetting(false); got != "" {
+		t.Errorf("boolSetting(false) = %q, want empty", got)
+	}
+}
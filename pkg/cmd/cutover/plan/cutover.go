@@ -16,29 +16,42 @@ import (
 
 // Cutover sets the cutover time for a warm migration
 func Cutover(configFlags *genericclioptions.ConfigFlags, planName, namespace string, cutoverTime *time.Time) error {
+	cutover, err := SetCutover(context.TODO(), configFlags, planName, namespace, cutoverTime)
+	if err != nil {
+		return err
+	}
+
+	fmt.Println(CutoverMessage(planName, cutover))
+	return nil
+}
+
+// SetCutover sets the cutover time on the running migration of a warm plan
+// without printing anything. A nil cutoverTime means now. It returns the
+// cutover time set, in RFC3339 format.
+func SetCutover(ctx context.Context, configFlags *genericclioptions.ConfigFlags, planName, namespace string, cutoverTime *time.Time) (string, error) {
 	c, err := client.GetDynamicClient(configFlags)
 	if err != nil {
-		return fmt.Errorf("failed to get client: %v", err)
+		return "", fmt.Errorf("failed to get client: %v", err)
 	}
 
 	// Get the plan
-	planObj, err := c.Resource(client.PlansGVR).Namespace(namespace).Get(context.TODO(), planName, metav1.GetOptions{})
+	planObj, err := c.Resource(client.PlansGVR).Namespace(namespace).Get(ctx, planName, metav1.GetOptions{})
 	if err != nil {
-		return fmt.Errorf("failed to get plan '%s': %v", planName, err)
+		return "", fmt.Errorf("failed to get plan '%s': %v", planName, err)
 	}
 
 	// Check if the plan is warm (handles both spec.type and legacy spec.warm)
 	if !planstatus.IsWarmMigration(planObj) {
-		return fmt.Errorf("plan '%s' is not configured for warm migration", planName)
+		return "", fmt.Errorf("plan '%s' is not configured for warm migration", planName)
 	}
 
 	// Find the running migration for this plan
 	runningMigration, _, err := planstatus.GetRunningMigration(c, namespace, planObj, client.MigrationsGVR)
 	if err != nil {
-		return err
+		return "", err
 	}
 	if runningMigration == nil {
-		return fmt.Errorf("no running migration found for plan '%s'", planName)
+		return "", fmt.Errorf("no running migration found for plan '%s'", planName)
 	}
 
 	// If no cutover time provided, use current time
@@ -60,21 +73,25 @@ func Cutover(configFlags *genericclioptions.ConfigFlags, planName, namespace str
 	// Convert the patch to JSON
 	patchBytes, err := json.Marshal(patchObject)
 	if err != nil {
-		return fmt.Errorf("failed to create patch: %v", err)
+		return "", fmt.Errorf("failed to create patch: %v", err)
 	}
 
 	// Apply the patch to the migration
 	_, err = c.Resource(client.MigrationsGVR).Namespace(namespace).Patch(
-		context.TODO(),
+		ctx,
 		runningMigration.GetName(),
 		types.MergePatchType,
 		patchBytes,
 		metav1.PatchOptions{},
 	)
 	if err != nil {
-		return fmt.Errorf("failed to update migration with cutover time: %v", err)
+		return "", fmt.Errorf("failed to update migration with cutover time: %v", err)
 	}
 
-	fmt.Printf("Successfully set cutover time to %s for plan '%s'\n", cutoverTimeRFC3339, planName)
-	return nil
+	return cutoverTimeRFC3339, nil
+}
+
+// CutoverMessage returns the status line reported after setting the cutover time of a plan
+func CutoverMessage(planName, cutover string) string {
+	return fmt.Sprintf("Successfully set cutover time to %s for plan '%s'", cutover, planName)
 }
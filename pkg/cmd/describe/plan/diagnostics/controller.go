@@ -2,8 +2,12 @@ package diagnostics
 
 import (
 	"bufio"
+	"bytes"
 	"context"
+	"io"
 	"strings"
+	"sync"
+	"time"
 
 	corev1 "k8s.io/api/core/v1"
 	metav1 "k8s.io/apimachinery/pkg/apis/meta/v1"
@@ -18,102 +22,152 @@ import (
 func CollectControllerLogs(ctx context.Context, configFlags *genericclioptions.ConfigFlags, clientset *kubernetes.Clientset, planName, planUID string, logLines, showLines int) *ControllerLogAnalysis {
 	operatorNS := client.GetMTVOperatorNamespace(ctx, configFlags)
 
-	pod := findControllerPod(ctx, clientset, operatorNS)
+	podKey := client.ClusterCacheKey(configFlags, operatorNS)
+
+	pod, cached := cachedControllerPod(ctx, clientset, podKey, operatorNS)
 	if pod == nil {
 		return nil
 	}
-
-	containerName := ""
-	for _, c := range pod.Spec.Containers {
-		switch c.Name {
-		case "main", "forklift-controller", "controller":
-			containerName = c.Name
+	stream, err := streamControllerLogs(ctx, clientset, operatorNS, pod, logLines)
+	if err != nil && cached {
+		// The cached pod may have been replaced; look it up again
+		controllerPods.Delete(podKey)
+		if pod, _ = cachedControllerPod(ctx, clientset, podKey, operatorNS); pod == nil {
+			return nil
 		}
+		stream, err = streamControllerLogs(ctx, clientset, operatorNS, pod, logLines)
 	}
-	if containerName == "" && len(pod.Spec.Containers) > 0 {
-		containerName = pod.Spec.Containers[0].Name
-	}
-
-	tailLines := int64(logLines)
-	req := clientset.CoreV1().Pods(operatorNS).GetLogs(pod.Name, &corev1.PodLogOptions{
-		Container: containerName,
-		TailLines: &tailLines,
-	})
-
-	stream, err := req.Stream(ctx)
 	if err != nil {
 		return nil
 	}
 	defer stream.Close()
 
-	var relevantLines []string
-	var rootCauseLines []string
-	var otherErrorLines []string
+	// The controller log is shared by all plans, so only the last showLines
+	// lines of each kind are kept while the log streams in
+	relevantLines := newLineTail(showLines)
+	rootCauseLines := newLineTail(showLines)
+	otherErrorLines := newLineTail(showLines)
 	var errorCount, warnCount int
 
 	scanner := bufio.NewScanner(stream)
 	scanner.Buffer(make([]byte, 0, 64*1024), 1024*1024)
 	for scanner.Scan() {
-		line := scanner.Text()
-		if !matchesPlan(line, planName, planUID) {
+		// Match on the scanner's buffer; only lines about the plan become strings
+		if !matchesPlan(scanner.Bytes(), planName, planUID) {
 			continue
 		}
+		line := scanner.Text()
 
-		relevantLines = append(relevantLines, line)
+		relevantLines.add(line)
 
 		if isIgnoredLine(line) {
 			continue
 		}
 		if isRootCauseLine(line) {
 			errorCount++
-			rootCauseLines = append(rootCauseLines, line)
+			rootCauseLines.add(line)
 		} else if isErrorLine(line) {
 			errorCount++
-			otherErrorLines = append(otherErrorLines, line)
+			otherErrorLines.add(line)
 		} else if isWarnLine(line) {
 			warnCount++
 		}
 	}
 	_ = scanner.Err()
 
-	if len(relevantLines) == 0 {
+	if relevantLines.total == 0 {
 		return nil
 	}
 
 	// Build significant error lines: root-cause first, then other errors (capped)
 	var errorLines []string
-	errorLines = append(errorLines, rootCauseLines...)
+	errorLines = append(errorLines, rootCauseLines.lines()...)
 	remaining := showLines - len(errorLines)
-	if remaining > 0 && len(otherErrorLines) > 0 {
-		if len(otherErrorLines) > remaining {
-			otherErrorLines = otherErrorLines[len(otherErrorLines)-remaining:]
+	if remaining > 0 {
+		others := otherErrorLines.lines()
+		if len(others) > remaining {
+			others = others[len(others)-remaining:]
 		}
-		errorLines = append(errorLines, otherErrorLines...)
-	}
-	if len(errorLines) > showLines {
-		errorLines = errorLines[len(errorLines)-showLines:]
-	}
-
-	// Keep only last N relevant lines for tail display
-	if len(relevantLines) > showLines {
-		relevantLines = relevantLines[len(relevantLines)-showLines:]
+		errorLines = append(errorLines, others...)
 	}
 
 	return &ControllerLogAnalysis{
-		LogTail:    relevantLines,
+		LogTail:    relevantLines.lines(),
 		ErrorLines: errorLines,
 		ErrorCount: errorCount,
 		WarnCount:  warnCount,
 	}
 }
 
-func findControllerPod(ctx context.Context, clientset *kubernetes.Clientset, namespace string) *corev1.Pod {
-	selectors := []string{
-		"app=forklift,control-plane=controller-manager",
-		"app.kubernetes.io/name=forklift-controller",
+// controllerPodTTL is how long a found controller pod is reused. The pod
+// changes only when the controller restarts, and finding it takes up to
+// three pod lists.
+const controllerPodTTL = 10 * time.Second
+
+type controllerPodEntry struct {
+	pod     *corev1.Pod
+	expires time.Time
+}
+
+// controllerPods caches found controller pods by client.ClusterCacheKey, so a
+// pod found with one identity is not reused by another.
+var controllerPods sync.Map
+
+// cachedControllerPod returns the controller pod of namespace, from the cache
+// when a recent lookup found it. cached reports whether it came from the cache.
+// An empty key disables the cache.
+func cachedControllerPod(ctx context.Context, clientset *kubernetes.Clientset, key, namespace string) (pod *corev1.Pod, cached bool) {
+	if key == "" {
+		return findControllerPod(ctx, clientset, namespace), false
+	}
+	if v, ok := controllerPods.Load(key); ok {
+		entry := v.(controllerPodEntry)
+		if time.Now().Before(entry.expires) {
+			return entry.pod, true
+		}
+		controllerPods.Delete(key)
+	}
+
+	pod = findControllerPod(ctx, clientset, namespace)
+	if pod != nil {
+		controllerPods.Store(key, controllerPodEntry{pod: pod, expires: time.Now().Add(controllerPodTTL)})
+	}
+	return pod, false
+}
+
+// streamControllerLogs opens the last logLines lines of the controller container's log.
+func streamControllerLogs(ctx context.Context, clientset *kubernetes.Clientset, namespace string, pod *corev1.Pod, logLines int) (io.ReadCloser, error) {
+	containerName := ""
+	for _, c := range pod.Spec.Containers {
+		switch c.Name {
+		case "main", "forklift-controller", "controller":
+			containerName = c.Name
+		}
+	}
+	if containerName == "" && len(pod.Spec.Containers) > 0 {
+		containerName = pod.Spec.Containers[0].Name
 	}
 
-	for _, sel := range selectors {
+	tailLines := int64(logLines)
+	return clientset.CoreV1().Pods(namespace).GetLogs(pod.Name, &corev1.PodLogOptions{
+		Container: containerName,
+		TailLines: &tailLines,
+	}).Stream(ctx)
+}
+
+// controllerPodSelectors are the label selectors tried, in order, to find the
+// controller pod.
+var controllerPodSelectors = []string{
+	"app=forklift,control-plane=controller-manager",
+	"app.kubernetes.io/name=forklift-controller",
+}
+
+// controllerPodNamePrefix identifies the controller pod by name when no
+// selector matches.
+const controllerPodNamePrefix = "forklift-controller"
+
+func findControllerPod(ctx context.Context, clientset *kubernetes.Clientset, namespace string) *corev1.Pod {
+	for _, sel := range controllerPodSelectors {
 		pods, err := clientset.CoreV1().Pods(namespace).List(ctx, metav1.ListOptions{
 			LabelSelector: sel,
 		})
@@ -127,26 +181,62 @@ func findControllerPod(ctx context.Context, clientset *kubernetes.Clientset, nam
 		}
 	}
 
-	// Fallback: find by name prefix
-	allPods, err := clientset.CoreV1().Pods(namespace).List(ctx, metav1.ListOptions{})
+	// Fallback: find a running pod by name prefix; the API server filters out
+	// pods that are not running, so completed and failed pods are not transferred
+	runningPods, err := clientset.CoreV1().Pods(namespace).List(ctx, metav1.ListOptions{
+		FieldSelector: "status.phase=" + string(corev1.PodRunning),
+	})
 	if err != nil {
 		return nil
 	}
-	for i := range allPods.Items {
-		if strings.HasPrefix(allPods.Items[i].Name, "forklift-controller") &&
-			allPods.Items[i].Status.Phase == corev1.PodRunning {
-			return &allPods.Items[i]
+	for i := range runningPods.Items {
+		if strings.HasPrefix(runningPods.Items[i].Name, controllerPodNamePrefix) {
+			return &runningPods.Items[i]
 		}
 	}
 	return nil
 }
 
-func matchesPlan(line, planName, planUID string) bool {
-	if planName != "" && strings.Contains(line, planName) {
+func matchesPlan(line []byte, planName, planUID string) bool {
+	if planName != "" && bytes.Contains(line, []byte(planName)) {
 		return true
 	}
-	if planUID != "" && strings.Contains(line, planUID) {
+	if planUID != "" && bytes.Contains(line, []byte(planUID)) {
 		return true
 	}
 	return false
 }
+
+// lineTail keeps the last lines added to it, up to a fixed capacity.
+type lineTail struct {
+	buf   []string
+	next  int // index the next line is written to once buf is full
+	total int // number of lines added
+}
+
+func newLineTail(capacity int) *lineTail {
+	return &lineTail{buf: make([]string, 0, max(capacity, 0))}
+}
+
+func (t *lineTail) add(line string) {
+	t.total++
+	if cap(t.buf) == 0 {
+		return
+	}
+	if len(t.buf) < cap(t.buf) {
+		t.buf = append(t.buf, line)
+		return
+	}
+	t.buf[t.next] = line
+	t.next = (t.next + 1) % len(t.buf)
+}
+
+// lines returns the kept lines, oldest first.
+func (t *lineTail) lines() []string {
+	if len(t.buf) == 0 {
+		return nil
+	}
+	out := make([]string, 0, len(t.buf))
+	out = append(out, t.buf[t.next:]...)
+	return append(out, t.buf[:t.next]...)
+}
@@ -12,9 +12,9 @@ import (
 	"github.com/yaacov/kubectl-mtv/pkg/util/client"
 )
 
-// CollectConversions lists Conversion CRs associated with the plan and extracts
-// phase, message, and pod references. Results are sorted newest-first by creation timestamp.
-func CollectConversions(ctx context.Context, dynClient dynamic.Interface, namespace, planName, vmID string) []ConversionInfo {
+// ListConversions lists the Conversion CRs of a plan (all VMs), sorted
+// newest-first by creation timestamp.
+func ListConversions(ctx context.Context, dynClient dynamic.Interface, namespace, planName string) []unstructured.Unstructured {
 	selector := fmt.Sprintf("plan-name=%s", planName)
 
 	convList, err := dynClient.Resource(client.ConversionsGVR).Namespace(namespace).List(ctx, metav1.ListOptions{
@@ -28,9 +28,14 @@ func CollectConversions(ctx context.Context, dynClient dynamic.Interface, namesp
 	sort.Slice(convList.Items, func(i, j int) bool {
 		return convList.Items[i].GetCreationTimestamp().Time.After(convList.Items[j].GetCreationTimestamp().Time)
 	})
+	return convList.Items
+}
 
+// CollectConversions extracts phase, message, and pod references from the
+// conversions of vmID (all conversions when vmID is empty), keeping their order.
+func CollectConversions(conversions []unstructured.Unstructured, vmID string) []ConversionInfo {
 	var results []ConversionInfo
-	for _, conv := range convList.Items {
+	for _, conv := range conversions {
 		// If vmID filter is provided, check if this conversion matches
 		if vmID != "" {
 			specVMID, _, _ := unstructured.NestedString(conv.Object, "spec", "vm", "id")
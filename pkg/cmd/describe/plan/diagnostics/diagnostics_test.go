@@ -1,7 +1,12 @@
 package diagnostics
 
 import (
+	"strings"
 	"testing"
+
+	corev1 "k8s.io/api/core/v1"
+	metav1 "k8s.io/apimachinery/pkg/apis/meta/v1"
+	"k8s.io/apimachinery/pkg/apis/meta/v1/unstructured"
 )
 
 func TestExtractVMErrors_NoErrors(t *testing.T) {
@@ -291,3 +296,82 @@ func TestAppendIfNew(t *testing.T) {
 		t.Errorf("expected 3 pods (new added), got %d", len(result))
 	}
 }
+
+func TestCollectEvents(t *testing.T) {
+	pvcs := []corev1.PersistentVolumeClaim{
+		{ObjectMeta: metav1.ObjectMeta{Name: "pvc-a", Labels: map[string]string{"vmID": "vm-1"}}},
+		{ObjectMeta: metav1.ObjectMeta{Name: "pvc-b", Labels: map[string]string{"vmID": "vm-2"}}},
+	}
+	event := func(object, reason, eventType string) corev1.Event {
+		return corev1.Event{
+			InvolvedObject: corev1.ObjectReference{Kind: "PersistentVolumeClaim", Name: object},
+			Reason:         reason,
+			Type:           eventType,
+		}
+	}
+	events := []corev1.Event{
+		event("pvc-a", "ProvisioningFailed", "Warning"),
+		event("pvc-a", "ProvisioningFailed", "Warning"), // duplicate
+		event("pvc-b", "ProvisioningFailed", "Warning"), // other VM
+		event("pod-1", "Pulled", "Normal"),              // not relevant
+		event("pod-1", "BackOff", "Warning"),
+	}
+
+	got := CollectEvents([]string{"pod-1"}, pvcNamesForVM(pvcs, "vm-1"), events)
+	if len(got) != 2 {
+		t.Fatalf("expected 2 events, got %d: %+v", len(got), got)
+	}
+	objects := map[string]bool{}
+	for _, e := range got {
+		objects[e.Object] = true
+	}
+	if !objects["PersistentVolumeClaim/pvc-a"] || !objects["PersistentVolumeClaim/pod-1"] {
+		t.Errorf("unexpected events: %+v", got)
+	}
+
+	if names := pvcNamesForVM(pvcs, ""); len(names) != 2 {
+		t.Errorf("pvcNamesForVM() without a VM ID should return all PVCs, got %v", names)
+	}
+}
+
+func TestMigrationObjectNames(t *testing.T) {
+	pods := []corev1.Pod{
+		{ObjectMeta: metav1.ObjectMeta{Name: "pod-1"}},
+		{ObjectMeta: metav1.ObjectMeta{Name: "virt-v2v-1"}},
+	}
+	pvcs := []corev1.PersistentVolumeClaim{
+		{ObjectMeta: metav1.ObjectMeta{Name: "pvc-a"}},
+	}
+	conversions := []unstructured.Unstructured{
+		{Object: map[string]interface{}{"status": map[string]interface{}{"pod": map[string]interface{}{"name": "virt-v2v-1"}}}},
+		{Object: map[string]interface{}{"status": map[string]interface{}{"pod": map[string]interface{}{"name": "virt-v2v-2"}}}},
+		{Object: map[string]interface{}{}},
+	}
+
+	got := strings.Join(migrationObjectNames(pods, pvcs, conversions), ",")
+	if want := "pod-1,virt-v2v-1,pvc-a,virt-v2v-2"; got != want {
+		t.Errorf("migrationObjectNames() = %q, want %q", got, want)
+	}
+}
+
+func TestLineTail(t *testing.T) {
+	tail := newLineTail(3)
+	if got := tail.lines(); len(got) != 0 {
+		t.Errorf("empty tail lines() = %v", got)
+	}
+	for _, line := range []string{"a", "b", "c", "d", "e"} {
+		tail.add(line)
+	}
+	if got := strings.Join(tail.lines(), ","); got != "c,d,e" {
+		t.Errorf("lines() = %q, want %q", got, "c,d,e")
+	}
+	if tail.total != 5 {
+		t.Errorf("total = %d, want 5", tail.total)
+	}
+
+	none := newLineTail(0)
+	none.add("a")
+	if got := none.lines(); len(got) != 0 || none.total != 1 {
+		t.Errorf("zero-capacity tail lines() = %v, total = %d", got, none.total)
+	}
+}
@@ -4,8 +4,10 @@ import (
 	"context"
 	"fmt"
 	"sort"
+	"sync"
 	"time"
 
+	corev1 "k8s.io/api/core/v1"
 	metav1 "k8s.io/apimachinery/pkg/apis/meta/v1"
 	"k8s.io/client-go/kubernetes"
 )
@@ -18,50 +20,42 @@ type eventEntryWithTime struct {
 }
 
 // CollectEvents gathers Kubernetes events for all resources (pods, PVCs) associated
-// with a migration. It uses label-based discovery to find PVC names, then queries
-// events by involvedObject.name for both pods and PVCs.
-func CollectEvents(ctx context.Context, clientset *kubernetes.Clientset, namespace, planUID, migrationUID, vmID string, podNames []string) []EventEntry {
-	// Discover PVC names via labels
-	pvcNames := discoverPVCNames(ctx, clientset, namespace, planUID, migrationUID, vmID)
-
-	// Combine all object names for event queries
-	allNames := make([]string, 0, len(podNames)+len(pvcNames))
-	allNames = append(allNames, podNames...)
-	allNames = append(allNames, pvcNames...)
+// with a migration VM. It keeps the events (listed once for all VMs by
+// ListObjectEvents) whose involvedObject.name is one of the pods or PVCs.
+func CollectEvents(podNames, pvcNames []string, events []corev1.Event) []EventEntry {
+	// Combine all object names for event matching
+	names := make(map[string]bool, len(podNames)+len(pvcNames))
+	for _, name := range podNames {
+		names[name] = true
+	}
+	for _, name := range pvcNames {
+		names[name] = true
+	}
 
 	seen := make(map[string]bool)
 	var collected []eventEntryWithTime
 
-	for _, name := range allNames {
-		events, err := clientset.CoreV1().Events(namespace).List(ctx, metav1.ListOptions{
-			FieldSelector: fmt.Sprintf("involvedObject.name=%s", name),
-		})
-		if err != nil || len(events.Items) == 0 {
+	for _, ev := range events {
+		if !names[ev.InvolvedObject.Name] || !isRelevantEvent(ev.Type, ev.Reason) {
 			continue
 		}
 
-		for _, ev := range events.Items {
-			if !isRelevantEvent(ev.Type, ev.Reason) {
-				continue
-			}
-
-			key := fmt.Sprintf("%s/%s/%s", ev.Reason, ev.InvolvedObject.Name, ev.Message)
-			if seen[key] {
-				continue
-			}
-			seen[key] = true
-
-			collected = append(collected, eventEntryWithTime{
-				entry: EventEntry{
-					Type:    ev.Type,
-					Reason:  ev.Reason,
-					Object:  fmt.Sprintf("%s/%s", ev.InvolvedObject.Kind, ev.InvolvedObject.Name),
-					Message: truncate(ev.Message, 120),
-					Age:     formatAge(ev.LastTimestamp.Time),
-				},
-				timestamp: ev.LastTimestamp.Time,
-			})
+		key := fmt.Sprintf("%s/%s/%s", ev.Reason, ev.InvolvedObject.Name, ev.Message)
+		if seen[key] {
+			continue
 		}
+		seen[key] = true
+
+		collected = append(collected, eventEntryWithTime{
+			entry: EventEntry{
+				Type:    ev.Type,
+				Reason:  ev.Reason,
+				Object:  fmt.Sprintf("%s/%s", ev.InvolvedObject.Kind, ev.InvolvedObject.Name),
+				Message: truncate(ev.Message, 120),
+				Age:     formatAge(ev.LastTimestamp.Time),
+			},
+			timestamp: ev.LastTimestamp.Time,
+		})
 	}
 
 	sort.Slice(collected, func(i, j int) bool {
@@ -75,38 +69,96 @@ func CollectEvents(ctx context.Context, clientset *kubernetes.Clientset, namespa
 	return entries
 }
 
-func discoverPVCNames(ctx context.Context, clientset *kubernetes.Clientset, namespace, planUID, migrationUID, vmID string) []string {
-	selector := fmt.Sprintf("plan=%s,migration=%s", planUID, migrationUID)
-	if vmID != "" {
-		selector += fmt.Sprintf(",vmID=%s", vmID)
+// maxObjectEventLists is the largest number of objects whose events
+// ListObjectEvents lists one by one. A few field-selected lists are cheaper
+// than downloading every event of a busy shared namespace; for larger
+// migrations one namespace-wide list beats a call per object.
+const maxObjectEventLists = 16
+
+// ListObjectEvents lists the events of the named objects in a namespace, for
+// CollectEvents calls of all VMs. Up to maxObjectEventLists objects are
+// queried by involvedObject.name, concurrently; above that the namespace
+// events are listed once. Objects whose events cannot be listed are skipped.
+func ListObjectEvents(ctx context.Context, clientset *kubernetes.Clientset, namespace string, names []string) []corev1.Event {
+	if len(names) > maxObjectEventLists {
+		return ListNamespaceEvents(ctx, clientset, namespace)
 	}
 
-	pvcs, err := clientset.CoreV1().PersistentVolumeClaims(namespace).List(ctx, metav1.ListOptions{
-		LabelSelector: selector,
-	})
-	if err != nil || len(pvcs.Items) == 0 {
+	results := make([][]corev1.Event, len(names))
+	var wg sync.WaitGroup
+	for i, name := range names {
+		wg.Add(1)
+		go func(i int, name string) {
+			defer wg.Done()
+			list, err := clientset.CoreV1().Events(namespace).List(ctx, metav1.ListOptions{
+				FieldSelector: fmt.Sprintf("involvedObject.name=%s", name),
+			})
+			if err == nil {
+				results[i] = list.Items
+			}
+		}(i, name)
+	}
+	wg.Wait()
+
+	var events []corev1.Event
+	for _, items := range results {
+		events = append(events, items...)
+	}
+	return events
+}
+
+// ListNamespaceEvents lists the events of a namespace once, for CollectEvents
+// calls of all VMs. It returns nil when the events cannot be listed.
+func ListNamespaceEvents(ctx context.Context, clientset *kubernetes.Clientset, namespace string) []corev1.Event {
+	list, err := clientset.CoreV1().Events(namespace).List(ctx, metav1.ListOptions{})
+	if err != nil {
+		return nil
+	}
+	return list.Items
+}
+
+// migrationSelector returns the label selector of the resources (pods, PVCs)
+// that a migration of a plan creates for all its VMs.
+func migrationSelector(planUID, migrationUID string) string {
+	return "plan=" + planUID + ",migration=" + migrationUID
+}
+
+// ListMigrationPVCs lists the PVCs matching a migration selector once, for the
+// PVC lookups of all VMs. It returns nil when the PVCs cannot be listed.
+func ListMigrationPVCs(ctx context.Context, clientset *kubernetes.Clientset, namespace, selector string) []corev1.PersistentVolumeClaim {
+	list, err := clientset.CoreV1().PersistentVolumeClaims(namespace).List(ctx, metav1.ListOptions{LabelSelector: selector})
+	if err != nil {
 		return nil
 	}
+	return list.Items
+}
 
-	names := make([]string, 0, len(pvcs.Items))
-	for _, pvc := range pvcs.Items {
-		names = append(names, pvc.Name)
+// pvcNamesForVM returns the names of the PVCs labeled with vmID (all PVCs when
+// vmID is empty).
+func pvcNamesForVM(pvcs []corev1.PersistentVolumeClaim, vmID string) []string {
+	var names []string
+	for _, pvc := range pvcs {
+		if vmID == "" || pvc.Labels["vmID"] == vmID {
+			names = append(names, pvc.Name)
+		}
 	}
 	return names
 }
 
+// relevantNormalReasons are the reasons of Normal events kept in the report.
+var relevantNormalReasons = map[string]bool{
+	"Started":                true,
+	"FailedScheduling":       true,
+	"Evicted":                true,
+	"ProvisioningFailed":     true,
+	"ProvisioningSucceeded":  true,
+	"SuccessfulAttachVolume": true,
+}
+
 func isRelevantEvent(eventType, reason string) bool {
 	if eventType == "Warning" {
 		return true
 	}
-	relevantNormalReasons := map[string]bool{
-		"Started":                true,
-		"FailedScheduling":       true,
-		"Evicted":                true,
-		"ProvisioningFailed":     true,
-		"ProvisioningSucceeded":  true,
-		"SuccessfulAttachVolume": true,
-	}
 	return relevantNormalReasons[reason]
 }
 
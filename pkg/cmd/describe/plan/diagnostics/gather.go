@@ -2,15 +2,30 @@ package diagnostics
 
 import (
 	"context"
+	"sync"
+	"time"
 
+	corev1 "k8s.io/api/core/v1"
 	metav1 "k8s.io/apimachinery/pkg/apis/meta/v1"
 	"k8s.io/apimachinery/pkg/apis/meta/v1/unstructured"
 	"k8s.io/cli-runtime/pkg/genericclioptions"
 	"k8s.io/client-go/dynamic"
+	"k8s.io/client-go/kubernetes"
 
 	"github.com/yaacov/kubectl-mtv/pkg/util/client"
 )
 
+// gatherTimeout bounds the time spent collecting a diagnostics report. Calls
+// still running at the deadline are canceled and the report is built from
+// what was collected; interrupted pod log scans are marked as incomplete.
+// It stays well below the MCP server's 2 minute command timeout, so the
+// partial report is printed before the server would kill the command.
+const gatherTimeout = 90 * time.Second
+
+// listTimeout bounds each of the listings shared by all VMs, so one slow
+// listing leaves its part of the report empty instead of stalling the rest.
+const listTimeout = 30 * time.Second
+
 // GatherDiagnostics collects diagnostics from all sources for the given plan and migration.
 func GatherDiagnostics(ctx context.Context, configFlags *genericclioptions.ConfigFlags, dynClient dynamic.Interface, plan *unstructured.Unstructured, migration *unstructured.Unstructured, targetNS string, logLines, showLines int) (*DiagnosticsReport, error) {
 	clientset, err := client.GetKubernetesClientset(configFlags)
@@ -18,6 +33,9 @@ func GatherDiagnostics(ctx context.Context, configFlags *genericclioptions.Confi
 		return nil, err
 	}
 
+	ctx, cancel := context.WithTimeout(ctx, gatherTimeout)
+	defer cancel()
+
 	if logLines <= 0 {
 		logLines = defaultLogTailLines
 	}
@@ -54,14 +72,19 @@ func GatherDiagnostics(ctx context.Context, configFlags *genericclioptions.Confi
 		RequestedShowLines: showLines,
 	}
 
+	// Controller logs (filtered by plan name/UID, with error analysis). Reading
+	// the log is the slowest call, so it runs while everything else is collected.
+	controllerLogs := make(chan *ControllerLogAnalysis, 1)
+	go func() {
+		controllerLogs <- CollectControllerLogs(ctx, configFlags, clientset, planName, planUID, logLines, showLines)
+	}()
+
 	// Config context
 	report.Config = CollectConfigContext(ctx, configFlags, dynClient, plan)
 
-	// Controller logs (filtered by plan name/UID, with error analysis)
-	report.ControllerLogs = CollectControllerLogs(ctx, configFlags, clientset, planName, planUID, logLines, showLines)
-
 	// If no migration exists, return early with just config + controller logs
 	if migration == nil {
+		report.ControllerLogs = <-controllerLogs
 		return report, nil
 	}
 
@@ -69,60 +92,142 @@ func GatherDiagnostics(ctx context.Context, configFlags *genericclioptions.Confi
 	cutover, _, _ := unstructured.NestedString(migration.Object, "spec", "cutover")
 	report.CutoverTime = cutover
 
-	// Extract per-VM diagnostics from migration status
+	// The resources of all VMs are listed once, concurrently, and split per VM.
 	vms, _, _ := unstructured.NestedSlice(migration.Object, "status", "vms")
-	for _, v := range vms {
+	var conversions []unstructured.Unstructured
+	var events []corev1.Event
+	var pods []corev1.Pod
+	var pvcs []corev1.PersistentVolumeClaim
+	if len(vms) > 0 {
+		listCtx, cancelLists := context.WithTimeout(ctx, listTimeout)
+		var lists sync.WaitGroup
+		if localTarget {
+			selector := migrationSelector(planUID, migrationUID)
+			lists.Add(2)
+			go func() {
+				defer lists.Done()
+				pods = ListMigrationPods(listCtx, clientset, targetNS, selector)
+			}()
+			go func() {
+				defer lists.Done()
+				pvcs = ListMigrationPVCs(listCtx, clientset, targetNS, selector)
+			}()
+		}
+		conversions = ListConversions(listCtx, dynClient, planNS, planName)
+		lists.Wait()
+		cancelLists()
+
+		// Events are listed for the objects found above, so a small plan in
+		// a busy namespace does not download every unrelated event
+		if localTarget {
+			eventsCtx, cancelEvents := context.WithTimeout(ctx, listTimeout)
+			events = ListObjectEvents(eventsCtx, clientset, targetNS, migrationObjectNames(pods, pvcs, conversions))
+			cancelEvents()
+		}
+	}
+
+	// Extract per-VM diagnostics from migration status. Each VM needs several
+	// API calls (logs of its pods), so VMs are collected concurrently and kept
+	// in migration status order.
+	vmDiags := make([]*VMDiagnostics, len(vms))
+	slots := make(chan struct{}, maxParallelVMs)
+	var wg sync.WaitGroup
+	for i, v := range vms {
 		vmStatus, ok := v.(map[string]interface{})
 		if !ok {
 			continue
 		}
+		wg.Add(1)
+		slots <- struct{}{}
+		go func(i int, vmStatus map[string]interface{}) {
+			defer wg.Done()
+			defer func() { <-slots }()
+			vmDiag := collectVMDiagnostics(ctx, clientset, vmStatus, conversions, events, pods, pvcs, planNS, targetNS, localTarget, logLines, showLines)
+			vmDiags[i] = &vmDiag
+		}(i, vmStatus)
+	}
+	wg.Wait()
 
-		vmName, _, _ := unstructured.NestedString(vmStatus, "name")
-		vmID, _, _ := unstructured.NestedString(vmStatus, "id")
-		vmPhase, _, _ := unstructured.NestedString(vmStatus, "phase")
-
-		vmDiag := VMDiagnostics{
-			Name:  vmName,
-			ID:    vmID,
-			Phase: vmPhase,
+	for _, vmDiag := range vmDiags {
+		if vmDiag != nil {
+			report.VMs = append(report.VMs, *vmDiag)
 		}
+	}
 
-		// VM errors (always available from migration CR status)
-		vmDiag.Error, vmDiag.Conditions, vmDiag.StepErrors = ExtractVMErrors(vmStatus)
+	report.ControllerLogs = <-controllerLogs
+	return report, nil
+}
 
-		// Conversion CRs (in the plan namespace, always on local cluster)
-		conversions := CollectConversions(ctx, dynClient, planNS, planName, vmID)
-		if len(conversions) > 0 {
-			vmDiag.Conversion = &conversions[0]
+// migrationObjectNames returns the names of the objects whose events are
+// reported: the migration pods and PVCs, and the conversion pods.
+func migrationObjectNames(pods []corev1.Pod, pvcs []corev1.PersistentVolumeClaim, conversions []unstructured.Unstructured) []string {
+	seen := make(map[string]bool)
+	var names []string
+	add := func(name string) {
+		if name != "" && !seen[name] {
+			seen[name] = true
+			names = append(names, name)
 		}
+	}
+	for _, pod := range pods {
+		add(pod.Name)
+	}
+	for _, pvc := range pvcs {
+		add(pvc.Name)
+	}
+	for _, conv := range CollectConversions(conversions, "") {
+		add(conv.PodName)
+	}
+	return names
+}
 
-		// Pods and events require access to the target cluster
-		if localTarget {
-			vmDiag.Pods = CollectPodDiagnostics(ctx, clientset, targetNS, planUID, migrationUID, vmID, logLines, showLines)
-
-			// If conversion references a pod, collect its logs
-			if vmDiag.Conversion != nil && vmDiag.Conversion.PodName != "" {
-				convPod := CollectPodDiagnosticsByName(ctx, clientset, targetNS, vmDiag.Conversion.PodName, logLines, showLines)
-				if convPod == nil && targetNS != planNS {
-					convPod = CollectPodDiagnosticsByName(ctx, clientset, planNS, vmDiag.Conversion.PodName, logLines, showLines)
-				}
-				if convPod != nil {
-					vmDiag.Pods = appendIfNew(vmDiag.Pods, *convPod)
-				}
-			}
+// maxParallelVMs bounds how many VMs GatherDiagnostics collects at once.
+const maxParallelVMs = 8
 
-			// Events (collect for all discovered pods + PVCs)
-			podNames := make([]string, 0, len(vmDiag.Pods))
-			for _, p := range vmDiag.Pods {
-				podNames = append(podNames, p.Name)
+// collectVMDiagnostics collects diagnostics for one VM of a migration.
+func collectVMDiagnostics(ctx context.Context, clientset *kubernetes.Clientset, vmStatus map[string]interface{}, conversions []unstructured.Unstructured, events []corev1.Event, pods []corev1.Pod, pvcs []corev1.PersistentVolumeClaim, planNS, targetNS string, localTarget bool, logLines, showLines int) VMDiagnostics {
+	vmName, _, _ := unstructured.NestedString(vmStatus, "name")
+	vmID, _, _ := unstructured.NestedString(vmStatus, "id")
+	vmPhase, _, _ := unstructured.NestedString(vmStatus, "phase")
+
+	vmDiag := VMDiagnostics{
+		Name:  vmName,
+		ID:    vmID,
+		Phase: vmPhase,
+	}
+
+	// VM errors (always available from migration CR status)
+	vmDiag.Error, vmDiag.Conditions, vmDiag.StepErrors = ExtractVMErrors(vmStatus)
+
+	// Conversion CRs (in the plan namespace, always on local cluster)
+	if vmConversions := CollectConversions(conversions, vmID); len(vmConversions) > 0 {
+		vmDiag.Conversion = &vmConversions[0]
+	}
+
+	// Pods and events require access to the target cluster
+	if localTarget {
+		vmDiag.Pods = CollectPodDiagnostics(ctx, clientset, pods, vmID, logLines, showLines)
+
+		// If conversion references a pod, collect its logs
+		if vmDiag.Conversion != nil && vmDiag.Conversion.PodName != "" {
+			convPod := CollectPodDiagnosticsByName(ctx, clientset, targetNS, vmDiag.Conversion.PodName, logLines, showLines)
+			if convPod == nil && targetNS != planNS {
+				convPod = CollectPodDiagnosticsByName(ctx, clientset, planNS, vmDiag.Conversion.PodName, logLines, showLines)
+			}
+			if convPod != nil {
+				vmDiag.Pods = appendIfNew(vmDiag.Pods, *convPod)
 			}
-			vmDiag.Events = CollectEvents(ctx, clientset, targetNS, planUID, migrationUID, vmID, podNames)
 		}
 
-		report.VMs = append(report.VMs, vmDiag)
+		// Events (collect for all discovered pods + PVCs)
+		podNames := make([]string, 0, len(vmDiag.Pods))
+		for _, p := range vmDiag.Pods {
+			podNames = append(podNames, p.Name)
+		}
+		vmDiag.Events = CollectEvents(podNames, pvcNamesForVM(pvcs, vmID), events)
 	}
 
-	return report, nil
+	return vmDiag
 }
 
 // isLocalTarget checks whether the plan's destination provider is the local cluster.
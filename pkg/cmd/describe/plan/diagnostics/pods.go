@@ -19,23 +19,25 @@ const MaxLogTailLines = 10000
 // MaxShowLines is the maximum number of log lines that can be displayed per container.
 const MaxShowLines = 500
 
-// CollectPodDiagnostics lists pods matching the plan/migration labels and collects logs.
-func CollectPodDiagnostics(ctx context.Context, clientset *kubernetes.Clientset, namespace, planUID, migrationUID, vmID string, logLines, showLines int) []PodDiagnostics {
-	selector := fmt.Sprintf("plan=%s,migration=%s", planUID, migrationUID)
-	if vmID != "" {
-		selector += fmt.Sprintf(",vmID=%s", vmID)
-	}
-
-	pods, err := clientset.CoreV1().Pods(namespace).List(ctx, metav1.ListOptions{
-		LabelSelector: selector,
-	})
-	if err != nil || len(pods.Items) == 0 {
+// ListMigrationPods lists the pods matching a migration selector (all VMs,
+// see migrationSelector), so they are fetched in one call instead of once per VM.
+func ListMigrationPods(ctx context.Context, clientset *kubernetes.Clientset, namespace, selector string) []corev1.Pod {
+	list, err := clientset.CoreV1().Pods(namespace).List(ctx, metav1.ListOptions{LabelSelector: selector})
+	if err != nil {
 		return nil
 	}
+	return list.Items
+}
 
+// CollectPodDiagnostics collects logs for the migration pods labeled with vmID
+// (all pods when vmID is empty).
+func CollectPodDiagnostics(ctx context.Context, clientset *kubernetes.Clientset, pods []corev1.Pod, vmID string, logLines, showLines int) []PodDiagnostics {
 	var results []PodDiagnostics
-	for i := range pods.Items {
-		pod := &pods.Items[i]
+	for i := range pods {
+		pod := &pods[i]
+		if vmID != "" && pod.Labels["vmID"] != vmID {
+			continue
+		}
 		diag := buildPodDiagnostics(ctx, clientset, pod, logLines, showLines)
 		results = append(results, diag)
 	}
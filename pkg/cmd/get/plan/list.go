@@ -92,6 +92,9 @@ func ListPlans(ctx context.Context, configFlags *genericclioptions.ConfigFlags,
 		return fmt.Errorf("unsupported output format: %s. Supported formats: table, json, yaml, markdown", outputFormat)
 	}
 
+	// List the migrations once for all plans, instead of once per plan
+	migrations, migrationsErr := c.Resource(client.MigrationsGVR).Namespace(namespace).List(ctx, metav1.ListOptions{})
+
 	// Create printer items
 	items := []map[string]interface{}{}
 	for _, p := range plans.Items {
@@ -107,7 +110,12 @@ func ListPlans(ctx context.Context, configFlags *genericclioptions.ConfigFlags,
 		}
 
 		// Get plan details (ready, running migration, status)
-		planDetails, _ := status.GetPlanDetails(c, namespace, &p, client.MigrationsGVR)
+		var planDetails status.PlanDetails
+		if migrationsErr == nil {
+			planDetails, _ = status.GetPlanDetailsFromMigrations(migrations.Items, &p)
+		} else {
+			planDetails, _ = status.GetPlanDetails(c, namespace, &p, client.MigrationsGVR)
+		}
 
 		// Format the VM migration status
 		var vmStatus string
@@ -58,12 +58,6 @@ func GetRunningMigration(
 	plan *unstructured.Unstructured,
 	migrationsGVR schema.GroupVersionResource,
 ) (*unstructured.Unstructured, *unstructured.Unstructured, error) {
-	// Get the plan UID
-	planUID, found, err := unstructured.NestedString(plan.Object, "metadata", "uid")
-	if !found || err != nil {
-		return nil, nil, fmt.Errorf("failed to get plan UID: %v", err)
-	}
-
 	// Get all migrations in the namespace
 	migrationList, err := client.Resource(migrationsGVR).
 		Namespace(namespace).
@@ -72,12 +66,24 @@ func GetRunningMigration(
 		return nil, nil, fmt.Errorf("failed to list migrations: %v", err)
 	}
 
+	return FindRunningMigration(migrationList.Items, plan)
+}
+
+// FindRunningMigration is GetRunningMigration for migrations that were already
+// listed, so callers handling many plans list the migrations only once.
+func FindRunningMigration(migrations []unstructured.Unstructured, plan *unstructured.Unstructured) (*unstructured.Unstructured, *unstructured.Unstructured, error) {
+	// Get the plan UID
+	planUID, found, err := unstructured.NestedString(plan.Object, "metadata", "uid")
+	if !found || err != nil {
+		return nil, nil, fmt.Errorf("failed to get plan UID: %v", err)
+	}
+
 	var latestMigration *unstructured.Unstructured
 	var latestTimestamp metav1.Time
 
 	// Check each migration
-	for i := range migrationList.Items {
-		migration := &migrationList.Items[i]
+	for i := range migrations {
+		migration := &migrations[i]
 		// Check if this migration references our plan
 		planRef, found, _ := unstructured.NestedMap(migration.Object, "spec", "plan")
 		if !found {
@@ -329,6 +335,22 @@ func GetPlanDetails(
 	plan *unstructured.Unstructured,
 	migrationsGVR schema.GroupVersionResource,
 ) (PlanDetails, error) {
+	return planDetails(plan, func() (*unstructured.Unstructured, *unstructured.Unstructured, error) {
+		return GetRunningMigration(client, namespace, plan, migrationsGVR)
+	})
+}
+
+// GetPlanDetailsFromMigrations is GetPlanDetails for migrations that were
+// already listed, so a listing of many plans lists the migrations only once.
+func GetPlanDetailsFromMigrations(migrations []unstructured.Unstructured, plan *unstructured.Unstructured) (PlanDetails, error) {
+	return planDetails(plan, func() (*unstructured.Unstructured, *unstructured.Unstructured, error) {
+		return FindRunningMigration(migrations, plan)
+	})
+}
+
+// planDetails builds the details of a plan, using findMigration to get its
+// running and latest migrations.
+func planDetails(plan *unstructured.Unstructured, findMigration func() (*unstructured.Unstructured, *unstructured.Unstructured, error)) (PlanDetails, error) {
 	details := PlanDetails{}
 
 	// Get if plan is ready
@@ -339,7 +361,7 @@ func GetPlanDetails(
 	details.IsReady = ready
 
 	// Get if plan has running migration
-	runningMigration, latestMigration, err := GetRunningMigration(client, namespace, plan, migrationsGVR)
+	runningMigration, latestMigration, err := findMigration()
 	if err != nil {
 		return details, err
 	}
@@ -164,7 +164,13 @@ func analyzeLogLine(line string, analysis *LogAnalysis) {
 
 // extractStructuredLevel pulls the "level" value from a JSON-structured log line.
 // Returns empty string if the line is not valid JSON or has no "level" field.
+// Lines that do not start with '{' cannot be JSON objects and are not decoded.
 func extractStructuredLevel(line string) string {
+	trimmed := strings.TrimLeft(line, " \t")
+	if trimmed == "" || trimmed[0] != '{' {
+		return ""
+	}
+
 	var entry structuredLogLine
 	if err := json.Unmarshal([]byte(line), &entry); err != nil || entry.Level == "" {
 		return ""
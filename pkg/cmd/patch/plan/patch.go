@@ -206,13 +206,6 @@ func PatchPlan(opts PatchPlanOptions) error {
 		planUpdated = true
 	}
 
-	// Update use compatibility mode if flag was changed
-	if opts.UseCompatibilityModeChanged {
-		patchSpec["useCompatibilityMode"] = opts.UseCompatibilityMode
-		klog.V(2).Infof("Updated use compatibility mode to %t", opts.UseCompatibilityMode)
-		planUpdated = true
-	}
-
 	// Update target affinity if provided (using karl-interpreter)
 	if opts.TargetAffinity != "" {
 		interpreter := karl.NewKARLInterpreter()
@@ -329,41 +322,6 @@ func PatchPlan(opts PatchPlanOptions) error {
 		planUpdated = true // Mark plan as updated since we've applied a patch
 	}
 
-	// Update target namespace if provided
-	if opts.TargetNamespace != "" {
-		patchSpec["targetNamespace"] = opts.TargetNamespace
-		klog.V(2).Infof("Updated target namespace to '%s'", opts.TargetNamespace)
-		planUpdated = true
-	}
-
-	// Update target power state if provided
-	if opts.TargetPowerState != "" {
-		patchSpec["targetPowerState"] = opts.TargetPowerState
-		klog.V(2).Infof("Updated target power state to '%s'", opts.TargetPowerState)
-		planUpdated = true
-	}
-
-	// Update conversion temporary storage class if provided
-	if opts.ConversionTempStorageClass != "" {
-		patchSpec["conversionTempStorageClass"] = opts.ConversionTempStorageClass
-		klog.V(2).Infof("Updated conversion temp storage class to '%s'", opts.ConversionTempStorageClass)
-		planUpdated = true
-	}
-
-	// Update conversion temporary storage size if provided
-	if opts.ConversionTempStorageSize != "" {
-		patchSpec["conversionTempStorageSize"] = opts.ConversionTempStorageSize
-		klog.V(2).Infof("Updated conversion temp storage size to '%s'", opts.ConversionTempStorageSize)
-		planUpdated = true
-	}
-
-	// Update skip zone node selector if flag was changed
-	if opts.SkipZoneNodeSelectorChanged {
-		patchSpec["skipZoneNodeSelector"] = opts.SkipZoneNodeSelector
-		klog.V(2).Infof("Updated skip zone node selector to %t", opts.SkipZoneNodeSelector)
-		planUpdated = true
-	}
-
 	// Update customization scripts if provided
 	if opts.CustomizationScripts != "" {
 		scriptsNamespace, scriptsName, err := flags.ParseResourceRef(opts.CustomizationScripts, opts.Namespace)
@@ -381,90 +339,6 @@ func PatchPlan(opts PatchPlanOptions) error {
 		planUpdated = true
 	}
 
-	// Update virt-v2v image if provided
-	if opts.VirtV2vImage != "" {
-		patchSpec["virtV2vImage"] = opts.VirtV2vImage
-		klog.V(2).Infof("Updated virt-v2v image to '%s'", opts.VirtV2vImage)
-		planUpdated = true
-	}
-
-	// Update xfs compatibility if flag was changed
-	if opts.XfsCompatibilityChanged {
-		patchSpec["xfsCompatibility"] = opts.XfsCompatibility
-		klog.V(2).Infof("Updated xfs compatibility to %t", opts.XfsCompatibility)
-		planUpdated = true
-	}
-
-	// Update description if provided
-	if opts.Description != "" {
-		patchSpec["description"] = opts.Description
-		klog.V(2).Infof("Updated description to '%s'", opts.Description)
-		planUpdated = true
-	}
-
-	// Update preserve cluster CPU model if flag was changed
-	if opts.PreserveClusterCPUModelChanged {
-		patchSpec["preserveClusterCpuModel"] = opts.PreserveClusterCPUModel
-		klog.V(2).Infof("Updated preserve cluster CPU model to %t", opts.PreserveClusterCPUModel)
-		planUpdated = true
-	}
-
-	// Update preserve static IPs if flag was changed
-	if opts.PreserveStaticIPsChanged {
-		patchSpec["preserveStaticIPs"] = opts.PreserveStaticIPs
-		klog.V(2).Infof("Updated preserve static IPs to %t", opts.PreserveStaticIPs)
-		planUpdated = true
-	}
-
-	// Update PVC name template if provided
-	if opts.PVCNameTemplate != "" {
-		patchSpec["pvcNameTemplate"] = opts.PVCNameTemplate
-		klog.V(2).Infof("Updated PVC name template to '%s'", opts.PVCNameTemplate)
-		planUpdated = true
-	}
-
-	// Update volume name template if provided
-	if opts.VolumeNameTemplate != "" {
-		patchSpec["volumeNameTemplate"] = opts.VolumeNameTemplate
-		klog.V(2).Infof("Updated volume name template to '%s'", opts.VolumeNameTemplate)
-		planUpdated = true
-	}
-
-	// Update network name template if provided
-	if opts.NetworkNameTemplate != "" {
-		patchSpec["networkNameTemplate"] = opts.NetworkNameTemplate
-		klog.V(2).Infof("Updated network name template to '%s'", opts.NetworkNameTemplate)
-		planUpdated = true
-	}
-
-	// Update migrate shared disks if flag was changed
-	if opts.MigrateSharedDisksChanged {
-		patchSpec["migrateSharedDisks"] = opts.MigrateSharedDisks
-		klog.V(2).Infof("Updated migrate shared disks to %t", opts.MigrateSharedDisks)
-		planUpdated = true
-	}
-
-	// Update archived if flag was changed
-	if opts.ArchivedChanged {
-		patchSpec["archived"] = opts.Archived
-		klog.V(2).Infof("Updated archived to %t", opts.Archived)
-		planUpdated = true
-	}
-
-	// Update PVC name template use generate name if flag was changed
-	if opts.PVCNameTemplateUseGenerateNameChanged {
-		patchSpec["pvcNameTemplateUseGenerateName"] = opts.PVCNameTemplateUseGenerateName
-		klog.V(2).Infof("Updated PVC name template use generate name to %t", opts.PVCNameTemplateUseGenerateName)
-		planUpdated = true
-	}
-
-	// Update delete guest conversion pod if flag was changed
-	if opts.DeleteGuestConversionPodChanged {
-		patchSpec["deleteGuestConversionPod"] = opts.DeleteGuestConversionPod
-		klog.V(2).Infof("Updated delete guest conversion pod to %t", opts.DeleteGuestConversionPod)
-		planUpdated = true
-	}
-
 	// Update delete VM on fail migration if flag was changed
 	if opts.DeleteVmOnFailMigrationChanged {
 		switch strings.ToLower(opts.DeleteVmOnFailMigration) {
@@ -481,34 +355,6 @@ func PatchPlan(opts PatchPlanOptions) error {
 		}
 	}
 
-	// Update skip guest conversion if flag was changed
-	if opts.SkipGuestConversionChanged {
-		patchSpec["skipGuestConversion"] = opts.SkipGuestConversion
-		klog.V(2).Infof("Updated skip guest conversion to %t", opts.SkipGuestConversion)
-		planUpdated = true
-	}
-
-	// Update warm migration if flag was changed
-	if opts.WarmChanged {
-		patchSpec["warm"] = opts.Warm
-		klog.V(2).Infof("Updated warm migration to %t", opts.Warm)
-		planUpdated = true
-	}
-
-	// Update run preflight inspection if flag was changed
-	if opts.RunPreflightInspectionChanged {
-		patchSpec["runPreflightInspection"] = opts.RunPreflightInspection
-		klog.V(2).Infof("Updated run preflight inspection to %t", opts.RunPreflightInspection)
-		planUpdated = true
-	}
-
-	// Update RDM as LUN if flag was changed
-	if opts.RDMAsLunChanged {
-		patchSpec["rdmAsLun"] = opts.RDMAsLun
-		klog.V(2).Infof("Updated RDM as LUN to %t", opts.RDMAsLun)
-		planUpdated = true
-	}
-
 	// Update service account if flag was changed
 	if opts.ServiceAccountChanged {
 		if opts.ServiceAccount != "" {
@@ -539,6 +385,56 @@ func PatchPlan(opts PatchPlanOptions) error {
 		planUpdated = true
 	}
 
+	// Update string fields that were provided
+	for _, field := range []struct {
+		key   string
+		value string
+	}{
+		{"targetNamespace", opts.TargetNamespace},
+		{"targetPowerState", opts.TargetPowerState},
+		{"conversionTempStorageClass", opts.ConversionTempStorageClass},
+		{"conversionTempStorageSize", opts.ConversionTempStorageSize},
+		{"virtV2vImage", opts.VirtV2vImage},
+		{"description", opts.Description},
+		{"pvcNameTemplate", opts.PVCNameTemplate},
+		{"volumeNameTemplate", opts.VolumeNameTemplate},
+		{"networkNameTemplate", opts.NetworkNameTemplate},
+	} {
+		if field.value != "" {
+			patchSpec[field.key] = field.value
+			klog.V(2).Infof("Updated %s to '%s'", field.key, field.value)
+			planUpdated = true
+		}
+	}
+
+	// Update boolean fields whose flags were changed; this runs after the
+	// migration type, so an explicit --warm overrides the warm value it implies
+	for _, field := range []struct {
+		key     string
+		value   bool
+		changed bool
+	}{
+		{"useCompatibilityMode", opts.UseCompatibilityMode, opts.UseCompatibilityModeChanged},
+		{"skipZoneNodeSelector", opts.SkipZoneNodeSelector, opts.SkipZoneNodeSelectorChanged},
+		{"xfsCompatibility", opts.XfsCompatibility, opts.XfsCompatibilityChanged},
+		{"preserveClusterCpuModel", opts.PreserveClusterCPUModel, opts.PreserveClusterCPUModelChanged},
+		{"preserveStaticIPs", opts.PreserveStaticIPs, opts.PreserveStaticIPsChanged},
+		{"migrateSharedDisks", opts.MigrateSharedDisks, opts.MigrateSharedDisksChanged},
+		{"archived", opts.Archived, opts.ArchivedChanged},
+		{"pvcNameTemplateUseGenerateName", opts.PVCNameTemplateUseGenerateName, opts.PVCNameTemplateUseGenerateNameChanged},
+		{"deleteGuestConversionPod", opts.DeleteGuestConversionPod, opts.DeleteGuestConversionPodChanged},
+		{"skipGuestConversion", opts.SkipGuestConversion, opts.SkipGuestConversionChanged},
+		{"warm", opts.Warm, opts.WarmChanged},
+		{"runPreflightInspection", opts.RunPreflightInspection, opts.RunPreflightInspectionChanged},
+		{"rdmAsLun", opts.RDMAsLun, opts.RDMAsLunChanged},
+	} {
+		if field.changed {
+			patchSpec[field.key] = field.value
+			klog.V(2).Infof("Updated %s to %t", field.key, field.value)
+			planUpdated = true
+		}
+	}
+
 	// Early return if no changes were made
 	if !planUpdated {
 		fmt.Printf("plan/%s unchanged (no updates specified)\n", opts.Name)
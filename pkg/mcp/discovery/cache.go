@@ -0,0 +1,77 @@
+package discovery
+
+import (
+	"crypto/sha256"
+	"encoding/hex"
+	"fmt"
+	"os"
+	"path/filepath"
+)
+
+// schemaCacheDir is the directory where help --machine output is cached
+// between server starts. Empty disables the cache.
+var schemaCacheDir = defaultSchemaCacheDir()
+
+// defaultSchemaCacheDir returns the per-user cache directory for kubectl-mtv,
+// or "" if the platform has none.
+func defaultSchemaCacheDir() string {
+	dir, err := os.UserCacheDir()
+	if err != nil {
+		return ""
+	}
+	return filepath.Join(dir, "kubectl-mtv")
+}
+
+// SetSchemaCacheDir sets the directory used to cache the command schema.
+// An empty string disables the cache.
+func SetSchemaCacheDir(dir string) {
+	schemaCacheDir = dir
+}
+
+// GetSchemaCacheDir returns the directory used to cache the command schema.
+func GetSchemaCacheDir() string {
+	return schemaCacheDir
+}
+
+// schemaCachePath returns the cache file for the schema of the given executable.
+// The file name is derived from the executable's path, size and modification
+// time, so a rebuilt or upgraded binary never reads a stale schema.
+// It returns false when caching is disabled or the executable cannot be stat'ed.
+func schemaCachePath(exe string) (string, bool) {
+	if schemaCacheDir == "" {
+		return "", false
+	}
+	info, err := os.Stat(exe)
+	if err != nil {
+		return "", false
+	}
+
+	h := sha256.New()
+	fmt.Fprintf(h, "%s\x00%d\x00%d", exe, info.Size(), info.ModTime().UnixNano())
+	name := "help-machine-" + hex.EncodeToString(h.Sum(nil))[:16] + ".json"
+	return filepath.Join(schemaCacheDir, name), true
+}
+
+// writeSchemaCache stores help --machine output at path. The file is written
+// under a temporary name and renamed, so concurrent server starts never read
+// a partial file. Errors are ignored: the cache is only an optimization.
+func writeSchemaCache(path string, data []byte) {
+	dir := filepath.Dir(path)
+	if err := os.MkdirAll(dir, 0o700); err != nil {
+		return
+	}
+	f, err := os.CreateTemp(dir, ".help-machine-*")
+	if err != nil {
+		return
+	}
+	_, err = f.Write(data)
+	if closeErr := f.Close(); err == nil {
+		err = closeErr
+	}
+	if err == nil {
+		err = os.Rename(f.Name(), path)
+	}
+	if err != nil {
+		_ = os.Remove(f.Name())
+	}
+}
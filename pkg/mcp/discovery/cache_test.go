@@ -0,0 +1,72 @@
+package discovery
+
+import (
+	"os"
+	"path/filepath"
+	"testing"
+	"time"
+)
+
+func TestSchemaCachePath(t *testing.T) {
+	orig := schemaCacheDir
+	defer func() { schemaCacheDir = orig }()
+
+	dir := t.TempDir()
+	exe := filepath.Join(dir, "kubectl-mtv")
+	if err := os.WriteFile(exe, []byte("binary v1"), 0o755); err != nil {
+		t.Fatal(err)
+	}
+
+	SetSchemaCacheDir(filepath.Join(dir, "cache"))
+	path, ok := schemaCachePath(exe)
+	if !ok {
+		t.Fatal("expected cacheable executable")
+	}
+	if filepath.Dir(path) != filepath.Join(dir, "cache") {
+		t.Errorf("cache file %s should be in the cache directory", path)
+	}
+	if again, _ := schemaCachePath(exe); again != path {
+		t.Errorf("same binary should map to the same cache file: %s != %s", again, path)
+	}
+
+	// A rebuilt binary gets a new cache file
+	if err := os.WriteFile(exe, []byte("binary v2, rebuilt"), 0o755); err != nil {
+		t.Fatal(err)
+	}
+	if err := os.Chtimes(exe, time.Now(), time.Now().Add(time.Hour)); err != nil {
+		t.Fatal(err)
+	}
+	if rebuilt, _ := schemaCachePath(exe); rebuilt == path {
+		t.Error("rebuilt binary should map to a different cache file")
+	}
+
+	if _, ok := schemaCachePath(filepath.Join(dir, "missing")); ok {
+		t.Error("missing executable should not be cacheable")
+	}
+
+	SetSchemaCacheDir("")
+	if _, ok := schemaCachePath(exe); ok {
+		t.Error("cache should be disabled with an empty directory")
+	}
+}
+
+func TestWriteSchemaCache(t *testing.T) {
+	path := filepath.Join(t.TempDir(), "nested", "help-machine-test.json")
+	data := []byte(`{"commands":[]}`)
+
+	writeSchemaCache(path, data)
+
+	got, err := os.ReadFile(path)
+	if err != nil {
+		t.Fatalf("cache file not written: %v", err)
+	}
+	if string(got) != string(data) {
+		t.Errorf("cache content = %s, want %s", got, data)
+	}
+
+	// No temporary files are left behind
+	entries, _ := os.ReadDir(filepath.Dir(path))
+	if len(entries) != 1 {
+		t.Errorf("expected only the cache file, got %d entries", len(entries))
+	}
+}
@@ -9,6 +9,8 @@ import (
 	"sort"
 	"strings"
 	"time"
+
+	"github.com/yaacov/kubectl-mtv/pkg/mcp/util"
 )
 
 // Registry holds discovered kubectl-mtv commands organized by read/write access.
@@ -44,20 +46,31 @@ type Registry struct {
 
 // NewRegistry creates a new registry by calling kubectl-mtv help --machine.
 // This single call returns the complete command schema as JSON.
-// It uses os.Executable() to call the same binary that is running the MCP server,
+// It uses the running executable (util.SelfExePath) to call the same binary that is running the MCP server,
 // ensuring the help schema always matches the server's code (avoids version mismatch
 // when a different kubectl-mtv version is installed in PATH).
+//
+// The output is cached on disk per binary (see SetSchemaCacheDir), so later
+// server starts with the same binary skip the help --machine call.
 func NewRegistry(ctx context.Context) (*Registry, error) {
+	// Use the current executable to ensure help matches the running server;
+	// the path is resolved once and shared with command execution
+	self := util.SelfExePath()
+
+	cachePath, cacheable := schemaCachePath(self)
+	if cacheable {
+		if data, err := os.ReadFile(cachePath); err == nil {
+			var schema HelpSchema
+			if err := json.Unmarshal(data, &schema); err == nil && len(schema.Commands) > 0 {
+				return newRegistryFromSchema(&schema), nil
+			}
+		}
+	}
+
 	// Create command with timeout
 	cmdCtx, cancel := context.WithTimeout(ctx, 30*time.Second)
 	defer cancel()
 
-	// Use the current executable to ensure help matches the running server
-	self, err := os.Executable()
-	if err != nil {
-		// Fall back to PATH lookup if os.Executable fails
-		self = "kubectl-mtv"
-	}
 	cmd := exec.CommandContext(cmdCtx, self, "help", "--machine")
 	output, err := cmd.Output()
 	if err != nil {
@@ -69,6 +82,15 @@ func NewRegistry(ctx context.Context) (*Registry, error) {
 		return nil, fmt.Errorf("failed to parse help schema: %w", err)
 	}
 
+	if cacheable {
+		writeSchemaCache(cachePath, output)
+	}
+
+	return newRegistryFromSchema(&schema), nil
+}
+
+// newRegistryFromSchema builds a registry from a parsed help --machine schema.
+func newRegistryFromSchema(schema *HelpSchema) *Registry {
 	registry := &Registry{
 		ReadOnly:        make(map[string]*Command),
 		ReadWrite:       make(map[string]*Command),
@@ -123,7 +145,7 @@ func NewRegistry(ctx context.Context) (*Registry, error) {
 		}
 	}
 
-	return registry, nil
+	return registry
 }
 
 // ListReadOnlyCommands returns read-only command paths in Cobra registration order.
@@ -236,7 +258,8 @@ func (r *Registry) GenerateReadWriteDescription() string {
 	sb.WriteString("2. Check existing providers with mtv_read \"get provider\"; create via mtv_write \"create provider\" only if needed\n")
 	sb.WriteString("3. Browse VMs with mtv_read \"get inventory vm\" + TSL queries\n")
 	sb.WriteString("4. Create a migration plan (network/storage mappings are auto-generated; use --network-pairs/--storage-pairs to override)\n")
-	sb.WriteString("5. Start the plan\n")
+	sb.WriteString("   Pass mapping pairs to \"create plan\" in the same call; only \"create mapping\" first to reuse a mapping across plans\n")
+	sb.WriteString("5. Start the plan (several plans in one call: name: \"plan1,plan2\")\n")
 	sb.WriteString("6. Monitor with mtv_read \"get plan\"\n")
 	sb.WriteString("\nCommands:\n")
 
@@ -0,0 +1,249 @@
+package tools
+
+import (
+	"context"
+	"strings"
+	"sync"
+	"time"
+
+	"github.com/yaacov/kubectl-mtv/pkg/mcp/util"
+)
+
+// batchWindow is how long the first call of a batch waits for compatible calls
+// to arrive before the batch is executed.
+const batchWindow = 10 * time.Millisecond
+
+// maxBatchNames caps the number of plan names merged into one invocation.
+const maxBatchNames = 50
+
+// batchRunTimeout bounds a merged invocation. It runs detached from the
+// callers' contexts, so one canceled caller does not fail the others.
+const batchRunTimeout = 3 * time.Minute
+
+// batchableCommands lists lifecycle commands whose --name flag takes a list.
+// Concurrent calls that differ only in the plan name are merged into a single
+// kubectl-mtv invocation, amortizing process startup and API-server auth.
+// Only idempotent commands are listed: when a merged invocation fails, each
+// caller re-runs its own plans, which must be safe for plans the merged run
+// already changed. start (a second migration) and cutover (a new cutover
+// time) are not idempotent, so they always run on their own.
+var batchableCommands = map[string]bool{
+	"archive/plan":   true,
+	"unarchive/plan": true,
+}
+
+// commandBatcher coalesces bursts of compatible lifecycle calls.
+// A call for an idle key runs immediately; only calls that arrive while
+// another invocation for the same key is running are queued and merged.
+type commandBatcher struct {
+	mu       sync.Mutex
+	pending  map[string]*commandBatch
+	inflight map[string]int
+	run      func(ctx context.Context, args []string) (util.CommandResponse, error)
+}
+
+// commandBatch is a group of calls executed as one kubectl-mtv invocation.
+type commandBatch struct {
+	names   []string
+	callers int
+	done    chan struct{}
+	result  util.CommandResponse
+	err     error
+}
+
+// lifecycleBatcher is the process-wide coalescer used by mtv_write.
+var lifecycleBatcher = newCommandBatcher(util.RunCommand)
+
+// newCommandBatcher creates a batcher that executes commands with run.
+func newCommandBatcher(run func(ctx context.Context, args []string) (util.CommandResponse, error)) *commandBatcher {
+	return &commandBatcher{
+		pending:  make(map[string]*commandBatch),
+		inflight: make(map[string]int),
+		run:      run,
+	}
+}
+
+// batchNames returns the plan names of a call if it can be batched.
+// Calls using --all, --dry-run or show-CLI mode always run on their own.
+func batchNames(ctx context.Context, cmdPath string, flags map[string]any) ([]string, bool) {
+	if !batchableCommands[cmdPath] || util.GetShowCLI(ctx) {
+		return nil, false
+	}
+	for _, key := range []string{"all", "dry_run", "dry-run"} {
+		if _, ok := flags[key]; ok {
+			return nil, false
+		}
+	}
+
+	var raw string
+	switch v := flags["name"].(type) {
+	case string:
+		raw = v
+	case []any:
+		raw = joinListFlag(v)
+	default:
+		return nil, false
+	}
+
+	var names []string
+	for _, name := range strings.Split(raw, ",") {
+		if name = strings.TrimSpace(name); name != "" {
+			names = append(names, name)
+		}
+	}
+	return names, len(names) > 0
+}
+
+// batchKey identifies calls that can share one invocation: same command,
+// same credentials and identical flags apart from the plan names.
+func batchKey(ctx context.Context, cmdPath string, flags map[string]any) string {
+	rest := make(map[string]any, len(flags))
+	for k, v := range flags {
+		if k != "name" {
+			rest[k] = v
+		}
+	}
+
+	server, _ := util.GetKubeServer(ctx)
+	token, _ := util.GetKubeToken(ctx)
+	parts := append([]string{server, token}, buildArgs(cmdPath, rest)...)
+	return strings.Join(parts, "\x00")
+}
+
+// execute runs a write command, merging it with concurrent compatible calls.
+// args are the call's own arguments, used when it cannot be batched or when
+// the merged invocation fails (so each caller gets its own accurate error).
+func (b *commandBatcher) execute(ctx context.Context, cmdPath string, flags map[string]any, args []string) (util.CommandResponse, error) {
+	names, ok := batchNames(ctx, cmdPath, flags)
+	if !ok {
+		return b.run(ctx, args)
+	}
+
+	key := batchKey(ctx, cmdPath, flags)
+
+	b.mu.Lock()
+	batch, joined := b.pending[key]
+	if !joined && b.inflight[key] == 0 {
+		// Fast path: nothing to merge with, run without waiting for a window
+		b.inflight[key]++
+		b.mu.Unlock()
+		defer b.done(key)
+		return b.run(ctx, args)
+	}
+	if joined && len(batch.names)+len(names) <= maxBatchNames {
+		batch.names = append(batch.names, names...)
+		batch.callers++
+		b.mu.Unlock()
+	} else {
+		// Start a new batch and lead it: wait for more callers, then run
+		batch = &commandBatch{names: names, callers: 1, done: make(chan struct{})}
+		b.pending[key] = batch
+		b.mu.Unlock()
+
+		b.lead(ctx, key, batch, cmdPath, flags)
+	}
+
+	select {
+	case <-batch.done:
+	case <-ctx.Done():
+		return b.run(ctx, args)
+	}
+
+	if batch.callers == 1 {
+		return batch.result, batch.err
+	}
+	if batch.err != nil || batch.result.ReturnValue != 0 {
+		// Re-run on our own so the error refers only to our plans
+		return b.run(ctx, args)
+	}
+	return filterBatchOutput(batch.result, names), nil
+}
+
+// lead waits for the batch window, closes the batch to new callers and runs it.
+func (b *commandBatcher) lead(ctx context.Context, key string, batch *commandBatch, cmdPath string, flags map[string]any) {
+	timer := time.NewTimer(batchWindow)
+	select {
+	case <-timer.C:
+	case <-ctx.Done():
+		timer.Stop()
+	}
+
+	b.mu.Lock()
+	if b.pending[key] == batch {
+		delete(b.pending, key)
+	}
+	names := uniqueStrings(batch.names)
+	b.inflight[key]++
+	b.mu.Unlock()
+	defer b.done(key)
+
+	merged := make(map[string]any, len(flags))
+	for k, v := range flags {
+		merged[k] = v
+	}
+	merged["name"] = strings.Join(names, ",")
+
+	// The batch serves every caller, so it must not stop when the leader's
+	// request is canceled
+	runCtx, cancel := context.WithTimeout(context.WithoutCancel(ctx), batchRunTimeout)
+	defer cancel()
+	batch.result, batch.err = b.run(runCtx, buildArgs(cmdPath, merged))
+	close(batch.done)
+}
+
+// done marks one invocation for key as finished.
+func (b *commandBatcher) done(key string) {
+	b.mu.Lock()
+	defer b.mu.Unlock()
+
+	if b.inflight[key]--; b.inflight[key] <= 0 {
+		delete(b.inflight, key)
+	}
+}
+
+// filterBatchOutput keeps the stdout lines of a merged response that refer to
+// the given plan names (lifecycle commands print one "... 'name' ..." line per
+// plan). If no line matches, the response is returned unchanged. The output
+// is scanned in place and matching lines are copied once into the result.
+func filterBatchOutput(response util.CommandResponse, names []string) util.CommandResponse {
+	quoted := make([]string, len(names))
+	for i, name := range names {
+		quoted[i] = "'" + name + "'"
+	}
+
+	var kept strings.Builder
+	for rest := response.Stdout; rest != ""; {
+		line := rest
+		if i := strings.IndexByte(rest, '\n'); i >= 0 {
+			line, rest = rest[:i], rest[i+1:]
+		} else {
+			rest = ""
+		}
+		for _, q := range quoted {
+			if strings.Contains(line, q) {
+				kept.WriteString(line)
+				kept.WriteByte('\n')
+				break
+			}
+		}
+	}
+	if kept.Len() == 0 {
+		return response
+	}
+
+	response.Stdout = kept.String()
+	return response
+}
+
+// uniqueStrings returns the strings in order of first appearance, without duplicates.
+func uniqueStrings(values []string) []string {
+	seen := make(map[string]bool, len(values))
+	unique := make([]string, 0, len(values))
+	for _, v := range values {
+		if !seen[v] {
+			seen[v] = true
+			unique = append(unique, v)
+		}
+	}
+	return unique
+}
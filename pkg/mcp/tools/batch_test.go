@@ -0,0 +1,250 @@
+package tools
+
+import (
+	"context"
+	"strings"
+	"sync"
+	"testing"
+	"time"
+
+	"github.com/yaacov/kubectl-mtv/pkg/mcp/util"
+)
+
+// fakeRunner records invocations and answers with one "Plan 'x' archived" line per name.
+// When gate is set, the first invocation blocks until gate is closed.
+type fakeRunner struct {
+	mu    sync.Mutex
+	calls [][]string
+	fail  bool
+	gate  chan struct{}
+}
+
+func (f *fakeRunner) run(_ context.Context, args []string) (util.CommandResponse, error) {
+	f.mu.Lock()
+	f.calls = append(f.calls, args)
+	first := len(f.calls) == 1
+	f.mu.Unlock()
+
+	if first && f.gate != nil {
+		<-f.gate
+	}
+
+	var names []string
+	for i, arg := range args {
+		if arg == "--name" && i+1 < len(args) {
+			names = strings.Split(args[i+1], ",")
+		}
+	}
+
+	response := util.CommandResponse{}
+	if f.fail && len(names) > 1 {
+		response.ReturnValue = 1
+		response.Stderr = "plan not found"
+	} else {
+		for _, name := range names {
+			response.Stdout += "Plan '" + name + "' archived\n"
+		}
+	}
+	return response, nil
+}
+
+func (f *fakeRunner) callCount() int {
+	f.mu.Lock()
+	defer f.mu.Unlock()
+	return len(f.calls)
+}
+
+// waitFor polls cond until it holds or a second has passed.
+func waitFor(cond func() bool) {
+	deadline := time.Now().Add(time.Second)
+	for !cond() && time.Now().Before(deadline) {
+		time.Sleep(100 * time.Microsecond)
+	}
+}
+
+// runConcurrentArchives starts a first call that runs directly and is held by
+// the runner's gate, then a batch leader, then the remaining calls so they
+// join the leader's batch. The gate is released once the batch is done.
+func runConcurrentArchives(t *testing.T, b *commandBatcher, runner *fakeRunner, names []string) []util.CommandResponse {
+	t.Helper()
+	results := make([]util.CommandResponse, len(names))
+	var wg sync.WaitGroup
+
+	call := func(i int) {
+		flags := map[string]any{"name": names[i], "namespace": "demo"}
+		result, err := b.execute(context.Background(), "archive/plan", flags, buildArgs("archive/plan", flags))
+		if err != nil {
+			t.Errorf("execute(%s) error: %v", names[i], err)
+		}
+		results[i] = result
+	}
+	start := func(wg *sync.WaitGroup, i int) {
+		wg.Add(1)
+		go func() {
+			defer wg.Done()
+			call(i)
+		}()
+	}
+
+	var first sync.WaitGroup
+	start(&first, 0)
+	waitFor(func() bool { return runner.callCount() == 1 })
+
+	start(&wg, 1)
+	waitFor(func() bool {
+		b.mu.Lock()
+		defer b.mu.Unlock()
+		return len(b.pending) > 0
+	})
+	for i := 2; i < len(names); i++ {
+		start(&wg, i)
+	}
+	wg.Wait()
+
+	close(runner.gate)
+	first.Wait()
+	return results
+}
+
+func TestCommandBatcher_MergesConcurrentCalls(t *testing.T) {
+	runner := &fakeRunner{gate: make(chan struct{})}
+	b := newCommandBatcher(runner.run)
+
+	results := runConcurrentArchives(t, b, runner, []string{"plan0", "plan1", "plan2", "plan3"})
+
+	// The first call runs on its own, the calls arriving while it runs are merged
+	if got := runner.callCount(); got != 2 {
+		t.Fatalf("expected 1 direct + 1 merged invocation, got %d: %v", got, runner.calls)
+	}
+	joined := strings.Join(runner.calls[1], " ")
+	for _, name := range []string{"plan1", "plan2", "plan3"} {
+		if !strings.Contains(joined, name) {
+			t.Errorf("merged invocation should include %s, got %v", name, runner.calls[1])
+		}
+	}
+
+	// Each caller only sees the output line for its own plan
+	for i, name := range []string{"plan0", "plan1", "plan2", "plan3"} {
+		if results[i].Stdout != "Plan '"+name+"' archived\n" {
+			t.Errorf("caller %s got stdout %q", name, results[i].Stdout)
+		}
+	}
+}
+
+func TestCommandBatcher_FailedBatchRerunsIndividually(t *testing.T) {
+	runner := &fakeRunner{fail: true, gate: make(chan struct{})}
+	b := newCommandBatcher(runner.run)
+
+	results := runConcurrentArchives(t, b, runner, []string{"plan0", "plan1", "plan2"})
+
+	// One direct call, one merged call plus one retry per merged caller
+	if got := runner.callCount(); got != 4 {
+		t.Fatalf("expected 4 invocations (1 direct + 1 merged + 2 retries), got %d: %v", got, runner.calls)
+	}
+	for i, result := range results {
+		if result.ReturnValue != 0 {
+			t.Errorf("caller %d should get its own successful result, got %+v", i, result)
+		}
+	}
+}
+
+func TestCommandBatcher_CanceledLeaderStillRunsBatch(t *testing.T) {
+	var runErr error
+	b := newCommandBatcher(func(ctx context.Context, args []string) (util.CommandResponse, error) {
+		runErr = ctx.Err()
+		return util.CommandResponse{}, nil
+	})
+
+	ctx, cancel := context.WithCancel(context.Background())
+	cancel()
+	flags := map[string]any{"name": "plan1", "namespace": "demo"}
+	batch := &commandBatch{names: []string{"plan1", "plan2"}, callers: 2, done: make(chan struct{})}
+	b.lead(ctx, "key", batch, "archive/plan", flags)
+
+	if runErr != nil {
+		t.Errorf("the merged invocation should not inherit the leader's cancellation, got %v", runErr)
+	}
+}
+
+func TestCommandBatcher_NonBatchableRunsDirectly(t *testing.T) {
+	runner := &fakeRunner{}
+	b := newCommandBatcher(runner.run)
+
+	flags := map[string]any{"name": "my-plan", "namespace": "demo"}
+	if _, err := b.execute(context.Background(), "delete/plan", flags, buildArgs("delete/plan", flags)); err != nil {
+		t.Fatalf("unexpected error: %v", err)
+	}
+	if got := runner.callCount(); got != 1 {
+		t.Errorf("expected 1 invocation, got %d", got)
+	}
+	if len(b.pending) != 0 {
+		t.Error("non-batchable command should not create a pending batch")
+	}
+}
+
+func TestCommandBatcher_IdleKeyRunsWithoutWindow(t *testing.T) {
+	runner := &fakeRunner{}
+	b := newCommandBatcher(runner.run)
+
+	flags := map[string]any{"name": "my-plan", "namespace": "demo"}
+	for i := 0; i < 3; i++ {
+		if _, err := b.execute(context.Background(), "archive/plan", flags, buildArgs("archive/plan", flags)); err != nil {
+			t.Fatalf("unexpected error: %v", err)
+		}
+	}
+	if got := runner.callCount(); got != 3 {
+		t.Errorf("expected 3 invocations, got %d", got)
+	}
+	if len(b.pending) != 0 || len(b.inflight) != 0 {
+		t.Errorf("sequential calls should leave no batch state, got pending=%d inflight=%d", len(b.pending), len(b.inflight))
+	}
+}
+
+func TestBatchNames(t *testing.T) {
+	ctx := context.Background()
+
+	tests := []struct {
+		name    string
+		cmdPath string
+		flags   map[string]any
+		want    []string
+		wantOK  bool
+	}{
+		{"single name", "archive/plan", map[string]any{"name": "p1"}, []string{"p1"}, true},
+		{"comma list", "archive/plan", map[string]any{"name": "p1, p2"}, []string{"p1", "p2"}, true},
+		{"json list", "unarchive/plan", map[string]any{"name": []any{"p1", "p2"}}, []string{"p1", "p2"}, true},
+		{"not batchable command", "delete/plan", map[string]any{"name": "p1"}, nil, false},
+		{"start is not idempotent", "start/plan", map[string]any{"name": "p1"}, nil, false},
+		{"cutover is not idempotent", "cutover/plan", map[string]any{"name": "p1"}, nil, false},
+		{"all flag", "archive/plan", map[string]any{"all": true}, nil, false},
+		{"dry run", "archive/plan", map[string]any{"name": "p1", "dry_run": true}, nil, false},
+		{"missing name", "archive/plan", map[string]any{}, nil, false},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			got, ok := batchNames(ctx, tt.cmdPath, tt.flags)
+			if ok != tt.wantOK || strings.Join(got, ",") != strings.Join(tt.want, ",") {
+				t.Errorf("batchNames() = %v, %v; want %v, %v", got, ok, tt.want, tt.wantOK)
+			}
+		})
+	}
+
+	// show-CLI calls are never batched
+	if _, ok := batchNames(util.WithShowCLI(ctx, true), "archive/plan", map[string]any{"name": "p1"}); ok {
+		t.Error("show-CLI calls should not be batched")
+	}
+}
+
+func TestFilterBatchOutput(t *testing.T) {
+	response := util.CommandResponse{Stdout: "Plan 'a' archived\nPlan 'b' archived\n"}
+
+	if got := filterBatchOutput(response, []string{"b"}); got.Stdout != "Plan 'b' archived\n" {
+		t.Errorf("filterBatchOutput() stdout = %q", got.Stdout)
+	}
+
+	// Unrecognized output is returned unchanged
+	if got := filterBatchOutput(response, []string{"zzz"}); got != response {
+		t.Errorf("filterBatchOutput() should not change unmatched output, got %+v", got)
+	}
+}
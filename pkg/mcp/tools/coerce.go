@@ -6,6 +6,7 @@ import (
 	"fmt"
 	"reflect"
 	"strings"
+	"sync"
 
 	"github.com/google/jsonschema-go/jsonschema"
 	"github.com/modelcontextprotocol/go-sdk/mcp"
@@ -36,14 +37,19 @@ func extractKubeCredsFromRequest(ctx context.Context, req *mcp.CallToolRequest)
 //  1. Generates the input schema from the In type using jsonschema.For[In]
 //  2. Creates a raw ToolHandler that coerces string booleans before unmarshal
 //  3. Registers via s.AddTool (bypassing the SDK's strict validation)
+//
+// t is not modified, so one tool definition can be registered with many
+// servers (HTTP mode creates a server per request).
 func AddToolWithCoercion[In, Out any](s *mcp.Server, t *mcp.Tool, h mcp.ToolHandlerFor[In, Out]) {
-	// Generate input schema from the In type if not already set
+	// Use the input schema generated from the In type if not already set
 	if t.InputSchema == nil {
-		schema, err := jsonschema.For[In](nil)
+		schema, err := inputSchemaFor[In]()
 		if err != nil {
 			panic(fmt.Sprintf("AddToolWithCoercion: tool %q: failed to generate input schema: %v", t.Name, err))
 		}
-		t.InputSchema = schema
+		tool := *t
+		tool.InputSchema = schema
+		t = &tool
 	}
 
 	rawHandler := func(ctx context.Context, req *mcp.CallToolRequest) (*mcp.CallToolResult, error) {
@@ -103,6 +109,24 @@ func AddToolWithCoercion[In, Out any](s *mcp.Server, t *mcp.Tool, h mcp.ToolHand
 	s.AddTool(t, rawHandler)
 }
 
+// inputSchemas caches the input schema generated for each tool input type.
+var inputSchemas sync.Map
+
+// inputSchemaFor returns the JSON schema for In, generating it on first use.
+// Schema inference walks the type with reflection; the result never changes.
+func inputSchemaFor[In any]() (*jsonschema.Schema, error) {
+	key := reflect.TypeFor[In]()
+	if schema, ok := inputSchemas.Load(key); ok {
+		return schema.(*jsonschema.Schema), nil
+	}
+	schema, err := jsonschema.For[In](nil)
+	if err != nil {
+		return nil, err
+	}
+	inputSchemas.Store(key, schema)
+	return schema, nil
+}
+
 // CoerceBooleans examines the In type's struct fields via reflection, finds
 // all bool fields, and coerces any corresponding string values in the JSON
 // data to actual JSON booleans. This allows clients that send "True"/"true"
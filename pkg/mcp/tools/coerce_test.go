@@ -291,9 +291,17 @@ func TestAddToolWithCoercion_SchemaSet(t *testing.T) {
 	// Register with coercion wrapper
 	AddToolWithCoercion(server, tool, handler)
 
-	// Verify that the tool's InputSchema was set
-	if tool.InputSchema == nil {
-		t.Fatal("Tool InputSchema should be set after AddToolWithCoercion")
+	// The shared tool definition is left untouched; the schema generated for
+	// the input type is cached and reused
+	if tool.InputSchema != nil {
+		t.Error("AddToolWithCoercion should not modify the tool definition")
+	}
+	schema, err := inputSchemaFor[testToolInput]()
+	if err != nil || schema == nil {
+		t.Fatalf("inputSchemaFor() = %v, %v", schema, err)
+	}
+	if again, _ := inputSchemaFor[testToolInput](); again != schema {
+		t.Error("inputSchemaFor should return the cached schema")
 	}
 }
 
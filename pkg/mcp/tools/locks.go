@@ -0,0 +1,133 @@
+package tools
+
+import (
+	"context"
+	"sort"
+	"strings"
+	"sync"
+
+	"github.com/yaacov/kubectl-mtv/pkg/mcp/util"
+)
+
+// resourceLocks serializes write commands that target the same resource.
+// Two concurrent patches of one plan would otherwise race at the API server,
+// and the loser pays for a whole kubectl-mtv invocation only to get a
+// conflict error; writes to different resources still run in parallel.
+var resourceLocks = newKeyedLocks()
+
+// keyedLocks is a set of mutexes identified by string keys. A key's lock is
+// removed when no caller holds or waits for it, so idle keys do not pile up.
+type keyedLocks struct {
+	mu    sync.Mutex
+	locks map[string]*keyedLock
+}
+
+// keyedLock is a mutex usable with a context, with a count of its users.
+type keyedLock struct {
+	ch   chan struct{}
+	refs int
+}
+
+// newKeyedLocks creates an empty lock set.
+func newKeyedLocks() *keyedLocks {
+	return &keyedLocks{locks: make(map[string]*keyedLock)}
+}
+
+// lock acquires the locks for all keys, in sorted order so that callers
+// locking overlapping key sets cannot deadlock. It returns a function that
+// releases them, or ctx's error if ctx is done first.
+func (k *keyedLocks) lock(ctx context.Context, keys []string) (func(), error) {
+	keys = uniqueStrings(keys)
+	sort.Strings(keys)
+
+	held := make([]string, 0, len(keys))
+	release := func() {
+		for i := len(held) - 1; i >= 0; i-- {
+			k.unlock(held[i])
+		}
+	}
+
+	for _, key := range keys {
+		l := k.acquireRef(key)
+		select {
+		case l.ch <- struct{}{}:
+			held = append(held, key)
+		case <-ctx.Done():
+			k.releaseRef(key)
+			release()
+			return nil, ctx.Err()
+		}
+	}
+	return release, nil
+}
+
+// acquireRef returns the lock for key, registering the caller as a user.
+func (k *keyedLocks) acquireRef(key string) *keyedLock {
+	k.mu.Lock()
+	defer k.mu.Unlock()
+
+	l, ok := k.locks[key]
+	if !ok {
+		l = &keyedLock{ch: make(chan struct{}, 1)}
+		k.locks[key] = l
+	}
+	l.refs++
+	return l
+}
+
+// releaseRef unregisters a user of key's lock, removing the lock when unused.
+func (k *keyedLocks) releaseRef(key string) {
+	k.mu.Lock()
+	defer k.mu.Unlock()
+
+	if l := k.locks[key]; l != nil {
+		if l.refs--; l.refs == 0 {
+			delete(k.locks, key)
+		}
+	}
+}
+
+// unlock releases a held lock for key.
+func (k *keyedLocks) unlock(key string) {
+	k.mu.Lock()
+	l := k.locks[key]
+	k.mu.Unlock()
+
+	<-l.ch
+	k.releaseRef(key)
+}
+
+// resourceLockKeys returns the lock keys for the resources a write command
+// targets: one per name, scoped by cluster, namespace and resource type
+// (e.g. "plan" for start/patch/delete plan). It returns nil for commands
+// without explicit names (such as --all), which run unlocked.
+func resourceLockKeys(ctx context.Context, cmdPath string, flags map[string]any) []string {
+	parts := splitCommandPath(cmdPath)
+	if len(parts) < 2 {
+		return nil
+	}
+
+	value, _ := lookupFlag(flags, "name", "M")
+	var names []string
+	switch v := value.(type) {
+	case string:
+		names = strings.Split(v, ",")
+	case []any:
+		for _, item := range v {
+			if s, ok := item.(string); ok {
+				names = append(names, s)
+			}
+		}
+	}
+
+	server, _ := util.GetKubeServer(ctx)
+	namespace := lookupFlagString(flags, "namespace", "n")
+
+	keys := make([]string, 0, len(names))
+	for _, name := range names {
+		if name = strings.TrimSpace(name); name != "" {
+			keys = append(keys, strings.Join([]string{server, namespace, parts[1], name}, "\x00"))
+		}
+	}
+	return keys
+}
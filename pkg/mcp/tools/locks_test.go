@@ -0,0 +1,105 @@
+package tools
+
+import (
+	"context"
+	"strings"
+	"testing"
+	"time"
+)
+
+func TestKeyedLocks_SerializesSameKey(t *testing.T) {
+	locks := newKeyedLocks()
+	ctx := context.Background()
+
+	unlock, err := locks.lock(ctx, []string{"plan-a"})
+	if err != nil {
+		t.Fatalf("lock() error = %v", err)
+	}
+
+	acquired := make(chan struct{})
+	go func() {
+		unlock2, err := locks.lock(ctx, []string{"plan-a"})
+		if err != nil {
+			t.Errorf("second lock() error = %v", err)
+			return
+		}
+		close(acquired)
+		unlock2()
+	}()
+
+	select {
+	case <-acquired:
+		t.Fatal("second caller acquired a held lock")
+	case <-time.After(20 * time.Millisecond):
+	}
+
+	// A different key is not blocked
+	unlockB, err := locks.lock(ctx, []string{"plan-b"})
+	if err != nil {
+		t.Fatalf("lock(plan-b) error = %v", err)
+	}
+	unlockB()
+
+	unlock()
+	select {
+	case <-acquired:
+	case <-time.After(time.Second):
+		t.Fatal("second caller did not acquire the released lock")
+	}
+
+	// Idle locks are removed
+	time.Sleep(10 * time.Millisecond)
+	locks.mu.Lock()
+	n := len(locks.locks)
+	locks.mu.Unlock()
+	if n != 0 {
+		t.Errorf("expected no idle locks, got %d", n)
+	}
+}
+
+func TestKeyedLocks_CanceledWait(t *testing.T) {
+	locks := newKeyedLocks()
+
+	unlock, err := locks.lock(context.Background(), []string{"a", "b"})
+	if err != nil {
+		t.Fatalf("lock() error = %v", err)
+	}
+	defer unlock()
+
+	ctx, cancel := context.WithTimeout(context.Background(), 10*time.Millisecond)
+	defer cancel()
+	if _, err := locks.lock(ctx, []string{"c", "b"}); err == nil {
+		t.Fatal("expected error when the context expires while waiting")
+	}
+
+	// "c" was acquired before waiting on "b" and must have been released
+	unlockC, err := locks.lock(context.Background(), []string{"c"})
+	if err != nil {
+		t.Fatalf("lock(c) error = %v", err)
+	}
+	unlockC()
+}
+
+func TestResourceLockKeys(t *testing.T) {
+	ctx := context.Background()
+
+	keys := resourceLockKeys(ctx, "patch/plan", map[string]any{"name": "p1", "namespace": "demo"})
+	if len(keys) != 1 || !strings.Contains(keys[0], "demo") || !strings.Contains(keys[0], "plan") {
+		t.Errorf("unexpected keys for patch plan: %q", keys)
+	}
+
+	// Different verbs on the same plan share a key
+	if other := resourceLockKeys(ctx, "start/plan", map[string]any{"name": "p1", "namespace": "demo"}); other[0] != keys[0] {
+		t.Errorf("start and patch of one plan should share a lock key")
+	}
+
+	if got := resourceLockKeys(ctx, "archive/plan", map[string]any{"name": "p1,p2"}); len(got) != 2 {
+		t.Errorf("expected one key per name, got %q", got)
+	}
+	if got := resourceLockKeys(ctx, "start/plan", map[string]any{"all": true}); len(got) != 0 {
+		t.Errorf("commands without names should not lock, got %q", got)
+	}
+	if got := resourceLockKeys(ctx, "patch", map[string]any{"name": "x"}); len(got) != 0 {
+		t.Errorf("commands without a resource type should not lock, got %q", got)
+	}
+}
@@ -58,21 +58,19 @@ func HandleMTVHelp(ctx context.Context, req *mcp.CallToolRequest, input MTVHelpI
 	}
 
 	// Build args: help --machine [command parts...]
-	args := []string{"help", "--machine"}
 	parts := strings.Fields(command)
+	args := make([]string, 0, 2+len(parts))
+	args = append(args, "help", "--machine")
 	args = append(args, parts...)
 
 	// Execute kubectl-mtv help --machine [command]
-	result, err := util.RunKubectlMTVCommand(ctx, args)
+	result, err := util.RunCommand(ctx, args)
 	if err != nil {
 		return nil, nil, fmt.Errorf("help command failed: %w", err)
 	}
 
 	// Parse and return result
-	data, err := util.UnmarshalJSONResponse(result)
-	if err != nil {
-		return nil, nil, err
-	}
+	data := util.ResponseData(result)
 
 	// Post-process: convert CLI-style help to MCP-style for LLM consumption.
 	// This handles both single-command responses and multi-command (array) responses.
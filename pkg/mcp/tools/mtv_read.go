@@ -2,8 +2,14 @@ package tools
 
 import (
 	"context"
+	"encoding/json"
+	"errors"
 	"fmt"
+	"slices"
+	"sort"
+	"strconv"
 	"strings"
+	"sync"
 
 	"github.com/modelcontextprotocol/go-sdk/mcp"
 	"github.com/yaacov/kubectl-mtv/pkg/mcp/discovery"
@@ -62,6 +68,23 @@ func GetMTVReadTool(registry *discovery.Registry) *mcp.Tool {
 	}
 }
 
+// Input rejected by validateCommandInput. The fixed messages are built once;
+// small LLMs can repeat the same mistake many times in a session.
+var (
+	errFullCLICommand = errors.New(
+		"the 'command' field should be a subcommand path like 'get plan' or 'get inventory vm', " +
+			"not a full CLI command. Remove the 'kubectl-mtv' or 'kubectl' prefix")
+	errToolResponseInCommand = errors.New(
+		"the 'command' field contains what looks like a previous tool response. " +
+			"It should only contain a command path like 'get inventory datastore'")
+)
+
+// hasPrefixFold reports whether s begins with prefix, ignoring case, without
+// lowering a copy of s.
+func hasPrefixFold(s, prefix string) bool {
+	return len(s) >= len(prefix) && strings.EqualFold(s[:len(prefix)], prefix)
+}
+
 // validateCommandInput checks for common malformed input patterns from small LLMs.
 // When a model sends garbled input (CLI commands, embedded tool results, etc.),
 // this returns a corrective error message that teaches the model the right format,
@@ -70,11 +93,8 @@ func validateCommandInput(command string) error {
 	command = strings.TrimSpace(command)
 
 	// Detect full CLI commands pasted as the command field
-	lower := strings.ToLower(command)
-	if strings.HasPrefix(lower, "kubectl-mtv ") || strings.HasPrefix(lower, "kubectl ") {
-		return fmt.Errorf(
-			"the 'command' field should be a subcommand path like 'get plan' or 'get inventory vm', " +
-				"not a full CLI command. Remove the 'kubectl-mtv' or 'kubectl' prefix")
+	if hasPrefixFold(command, "kubectl-mtv ") || hasPrefixFold(command, "kubectl ") {
+		return errFullCLICommand
 	}
 
 	// Detect embedded JSON/output (hallucinated tool responses mixed into input)
@@ -82,9 +102,7 @@ func validateCommandInput(command string) error {
 		strings.Contains(command, "\"return_value\"") ||
 		strings.Contains(command, "\"stdout\"") ||
 		strings.Contains(command, "[TOOL_CALLS]") {
-		return fmt.Errorf(
-			"the 'command' field contains what looks like a previous tool response. " +
-				"It should only contain a command path like 'get inventory datastore'")
+		return errToolResponseInCommand
 	}
 
 	// Detect overly long command strings (almost certainly malformed)
@@ -112,19 +130,26 @@ func HandleMTVRead(registry *discovery.Registry) func(context.Context, *mcp.Call
 		// Normalize command path
 		cmdPath := normalizeCommandPath(input.Command)
 
-		// Validate command exists and is read-only
-		if !registry.IsReadOnly(cmdPath) {
+		// Validate command exists and is read-only. The command is looked up
+		// once and reused for every later step.
+		cmd, ok := registry.ReadOnly[cmdPath]
+		if !ok {
 			if registry.IsReadWrite(cmdPath) {
 				return nil, nil, fmt.Errorf("command '%s' is a write operation, use mtv_write tool instead", input.Command)
 			}
 			// List available commands in error, converting path keys to user-friendly format
 			available := registry.ListReadOnlyCommands()
-			for i, cmd := range available {
-				available[i] = strings.ReplaceAll(cmd, "/", " ")
+			for i, c := range available {
+				available[i] = strings.ReplaceAll(c, "/", " ")
 			}
 			return nil, nil, fmt.Errorf("unknown command '%s'. Available read commands: %s", input.Command, strings.Join(available, ", "))
 		}
 
+		// Reject invalid enum values without starting kubectl-mtv
+		if err := validateEnumFlags(cmd, input.Flags); err != nil {
+			return nil, nil, err
+		}
+
 		// Enable show-CLI mode if requested
 		if input.ShowCLI {
 			ctx = util.WithShowCLI(ctx, true)
@@ -132,7 +157,6 @@ func HandleMTVRead(registry *discovery.Registry) func(context.Context, *mcp.Call
 
 		// Apply default output format for commands that support --output.
 		// If the user didn't specify one, use the MCP server default.
-		cmd := registry.ReadOnly[cmdPath]
 		if commandHasFlag(cmd, "output") {
 			if input.Flags == nil {
 				input.Flags = make(map[string]any)
@@ -140,8 +164,8 @@ func HandleMTVRead(registry *discovery.Registry) func(context.Context, *mcp.Call
 
 			valOutput, hasOutput := input.Flags["output"]
 			valO, hasO := input.Flags["o"]
-			outputProvided := (hasOutput && fmt.Sprintf("%v", valOutput) != "") ||
-				(hasO && fmt.Sprintf("%v", valO) != "")
+			outputProvided := (hasOutput && flagValueString(valOutput) != "") ||
+				(hasO && flagValueString(valO) != "")
 
 			if !outputProvided {
 				delete(input.Flags, "output")
@@ -162,21 +186,31 @@ func HandleMTVRead(registry *discovery.Registry) func(context.Context, *mcp.Call
 		// Build command arguments (all params passed via flags)
 		args := buildArgs(cmdPath, input.Flags)
 
+		// Reads have no side effects, so identical concurrent reads share one run
+		// and identical repeated reads are answered from the response cache
+		ctx = util.WithCoalescing(ctx)
+		if ttl := util.GetReadCacheTTL(); ttl > 0 {
+			ctx = util.WithCacheTTL(ctx, ttl)
+		}
+
 		// Execute command
-		result, err := util.RunKubectlMTVCommand(ctx, args)
+		result, err := util.RunCommand(ctx, args)
 		if err != nil {
 			return nil, nil, fmt.Errorf("command failed: %w", err)
 		}
 
-		// Parse and return result
-		data, err := util.UnmarshalJSONResponse(result)
-		if err != nil {
-			return nil, nil, err
+		// Parse and return result. JSON output is only decoded when fields
+		// are filtered; otherwise it is passed through as is.
+		var data map[string]interface{}
+		if len(input.Fields) > 0 {
+			data = util.ResponseData(result)
+		} else {
+			data = util.RawResponseData(result)
 		}
 
 		// Check for CLI errors and surface as MCP IsError response
 		if errResult := buildCLIErrorResult(data); errResult != nil {
-			if cmd := registry.ReadOnly[cmdPath]; cmd != nil {
+			if cmd != nil {
 				enrichErrorWithHelp(errResult, cmd)
 			}
 			return errResult, nil, nil
@@ -266,31 +300,64 @@ func commandHasFlag(cmd *discovery.Command, flagName string) bool {
 	return false
 }
 
-// buildArgs builds the command-line arguments for kubectl-mtv.
+// commandFlagType returns the type of a flag declared by a discovered command,
+// or "" if the command does not declare it.
+func commandFlagType(cmd *discovery.Command, flagName string) string {
+	if cmd == nil {
+		return ""
+	}
+	for _, f := range cmd.Flags {
+		if f.Name == flagName {
+			return f.Type
+		}
+	}
+	return ""
+}
+
+// validateEnumFlags checks string values of flags that only accept a fixed set
+// of values (provider type, migration type, output format ...) against the
+// values reported by help --machine. Invalid input is rejected here, before a
+// kubectl-mtv process is started just to print the same error.
+func validateEnumFlags(cmd *discovery.Command, flags map[string]any) error {
+	if cmd == nil || len(flags) == 0 {
+		return nil
+	}
+	for _, f := range cmd.Flags {
+		if len(f.Enum) == 0 {
+			continue
+		}
+		v, ok := lookupFlag(flags, f.Name, strings.ReplaceAll(f.Name, "-", "_"), f.Shorthand)
+		if !ok {
+			continue
+		}
+		s, isString := v.(string)
+		if !isString || s == "" {
+			continue
+		}
+		if !slices.Contains(f.Enum, s) {
+			return fmt.Errorf("invalid value %q for flag '%s': must be one of: %s", s, f.Name, strings.Join(f.Enum, ", "))
+		}
+	}
+	return nil
+}
+
+// buildArgs builds the command-line arguments for kubectl-mtv read and write commands.
 // All parameters (namespace, all_namespaces, inventory_url, output, name, provider, etc.)
 // are extracted from the flags map — there are no separate top-level fields.
 func buildArgs(cmdPath string, flags map[string]any) []string {
-	var args []string
-
-	// Add command path parts
-	parts := strings.Split(cmdPath, "/")
+	// Add command path parts; size for two tokens per flag plus the namespace
+	// and inventory flags so the slice is allocated once
+	parts := splitCommandPath(cmdPath)
+	args := make([]string, 0, len(parts)+2*len(flags)+3)
 	args = append(args, parts...)
 
-	// Extract namespace / all_namespaces from flags
-	var namespace string
-	var allNamespaces bool
-	if flags != nil {
-		if v, ok := flags["namespace"]; ok {
-			namespace = fmt.Sprintf("%v", v)
-		} else if v, ok := flags["n"]; ok {
-			namespace = fmt.Sprintf("%v", v)
-		}
-		if v, ok := flags["all_namespaces"]; ok {
-			allNamespaces = parseBoolValue(v)
-		} else if v, ok := flags["A"]; ok {
-			allNamespaces = parseBoolValue(v)
-		}
+	// Extract namespace / all_namespaces / inventory URL from flags
+	namespace := lookupFlagString(flags, "namespace", "n")
+	allNamespaces := false
+	if v, ok := lookupFlag(flags, "all_namespaces", "A"); ok {
+		allNamespaces = parseBoolValue(v)
 	}
+	inventoryURL := lookupFlagString(flags, "inventory_url", "inventory-url", "i")
 
 	// Add namespace flags
 	if allNamespaces {
@@ -298,35 +365,125 @@ func buildArgs(cmdPath string, flags map[string]any) []string {
 	} else if namespace != "" {
 		args = append(args, "--namespace", namespace)
 	}
+	if inventoryURL != "" {
+		args = append(args, "--inventory-url", inventoryURL)
+	}
+
+	// Add other flags using the normalizer
+	args = appendNormalizedFlags(args, flags, buildArgsSkipFlags)
+
+	return args
+}
+
+// buildArgsSkipFlags holds the flags buildArgs handles itself (or drops), so
+// the normalizer does not add them again. It is read-only.
+var buildArgsSkipFlags = map[string]bool{
+	"namespace": true, "n": true,
+	"all_namespaces": true, "A": true,
+	"inventory_url": true, "inventory-url": true, "i": true,
+	// --watch starts an interactive TUI that hangs the MCP subprocess
+	"watch": true, "w": true,
+}
+
+// commandPathParts caches the split form of command paths (e.g. "get/plan").
+// Paths are validated against the registry before arguments are built, so
+// the cache is bounded by the number of discovered commands.
+var commandPathParts sync.Map
+
+// splitCommandPath returns the parts of a "/"-separated command path.
+// The returned slice is shared and must not be modified.
+func splitCommandPath(cmdPath string) []string {
+	if parts, ok := commandPathParts.Load(cmdPath); ok {
+		return parts.([]string)
+	}
+	parts := strings.Split(cmdPath, "/")
+	commandPathParts.Store(cmdPath, parts)
+	return parts
+}
 
-	// Extract inventory URL from flags
-	var inventoryURL string
-	if flags != nil {
-		if v, ok := flags["inventory_url"]; ok {
-			inventoryURL = fmt.Sprintf("%v", v)
-		} else if v, ok := flags["inventory-url"]; ok {
-			inventoryURL = fmt.Sprintf("%v", v)
-		} else if v, ok := flags["i"]; ok {
-			inventoryURL = fmt.Sprintf("%v", v)
+// lookupFlag returns the value of the first of keys present in flags.
+// keys lists the spellings of one flag (snake_case, kebab-case, shorthand)
+// in order of precedence.
+func lookupFlag(flags map[string]any, keys ...string) (any, bool) {
+	for _, key := range keys {
+		if v, ok := flags[key]; ok {
+			return v, true
 		}
 	}
-	if inventoryURL != "" {
-		args = append(args, "--inventory-url", inventoryURL)
+	return nil, false
+}
+
+// lookupFlagString is lookupFlag for string-valued flags; it returns "" when
+// none of the keys is present.
+func lookupFlagString(flags map[string]any, keys ...string) string {
+	if v, ok := lookupFlag(flags, keys...); ok {
+		return flagValueString(v)
 	}
+	return ""
+}
 
-	// Skip set for already handled flags
-	skipFlags := map[string]bool{
-		"namespace": true, "n": true,
-		"all_namespaces": true, "A": true,
-		"inventory_url": true, "inventory-url": true, "i": true,
-		// --watch starts an interactive TUI that hangs the MCP subprocess
-		"watch": true, "w": true,
+// cliFlag returns the CLI spelling of an MCP flag key. Underscores are
+// converted back to hyphens: help text uses snake_case for JSON/MCP convention,
+// but the CLI expects kebab-case (e.g. --migrate-shared-disks). Single-char
+// keys get a single dash.
+func cliFlag(key string) string {
+	name := strings.ReplaceAll(key, "_", "-")
+	if len(name) == 1 {
+		return "-" + name
 	}
+	return "--" + name
+}
 
-	// Add other flags using the normalizer
-	args = appendNormalizedFlags(args, flags, skipFlags)
+// flagValueString formats a scalar flag value the way the CLI expects it.
+// JSON numbers are decoded as float64; whole numbers are written without
+// decimals. Common types are formatted with strconv rather than fmt.
+func flagValueString(v any) string {
+	switch v := v.(type) {
+	case nil:
+		return ""
+	case string:
+		return v
+	case bool:
+		return strconv.FormatBool(v)
+	case float64:
+		if v == float64(int64(v)) {
+			return strconv.FormatInt(int64(v), 10)
+		}
+		return strconv.FormatFloat(v, 'g', -1, 64)
+	case int:
+		return strconv.Itoa(v)
+	case int64:
+		return strconv.FormatInt(v, 10)
+	case int32:
+		return strconv.FormatInt(int64(v), 10)
+	}
+	return fmt.Sprintf("%v", v)
+}
 
-	return args
+// joinListFlag joins a JSON array flag value into the CLI's comma-separated form.
+// Strings, the common case (VM and plan names), are written as-is without
+// formatting; objects are JSON encoded rather than printed as Go maps.
+func joinListFlag(items []any) string {
+	var b strings.Builder
+	for i, item := range items {
+		if i > 0 {
+			b.WriteByte(',')
+		}
+		switch v := item.(type) {
+		case string:
+			b.WriteString(v)
+		case map[string]any, []any:
+			data, err := json.Marshal(v)
+			if err != nil {
+				fmt.Fprintf(&b, "%v", v)
+				continue
+			}
+			b.Write(data)
+		default:
+			b.WriteString(flagValueString(v))
+		}
+	}
+	return b.String()
 }
 
 // appendNormalizedFlags appends flags from a map[string]any to the args slice.
@@ -334,55 +491,67 @@ func buildArgs(cmdPath string, flags map[string]any) []string {
 //   - bool true/false: passes --flag=true or --flag=false (equals form, safe for both BoolVar and ExplicitBool)
 //   - string "true"/"false": treated as boolean
 //   - string/number: converted to string form
+//   - list: joined with commas (the form expected by slice flags)
 //
 // Flag prefix is determined by key length: single char uses "-x", multi-char uses "--long"
+//
+// Flags are emitted in sorted order so identical calls produce identical
+// arguments (and hit the same response cache entry).
+//
+// Keys that spell the same CLI flag (e.g. "dry-run" and "dry_run") are passed
+// once, with the value of the last key in sorted order whose value is set, so
+// the CLI never sees a repeated flag and an empty spelling never hides a real
+// value.
 func appendNormalizedFlags(args []string, flags map[string]any, skipFlags map[string]bool) []string {
-	for name, value := range flags {
-		// Skip flags in the skip set
-		if skipFlags != nil && skipFlags[name] {
-			continue
+	names := make([]string, 0, len(flags))
+	for name := range flags {
+		if !skipFlags[name] {
+			names = append(names, name)
 		}
+	}
+	sort.Strings(names)
 
-		// Convert underscores back to hyphens: help text uses snake_case for JSON/MCP
-		// convention, but the CLI expects kebab-case (e.g. --migrate-shared-disks).
-		name = strings.ReplaceAll(name, "_", "-")
+	lastKey := make(map[string]string, len(names))
+	for _, name := range names {
+		if flagValueSet(flags[name]) {
+			lastKey[cliFlag(name)] = name
+		}
+	}
 
-		// Determine flag prefix: single dash for single-char flags, double dash for multi-char
-		prefix := "--"
-		if len(name) == 1 {
-			prefix = "-"
+	for _, name := range names {
+		value := flags[name]
+		flag := cliFlag(name)
+		if lastKey[flag] != name {
+			continue
 		}
 
 		// Handle different value types
 		switch v := value.(type) {
 		case bool:
 			if v {
-				args = append(args, prefix+name+"=true")
+				args = append(args, flag+"=true")
 			} else {
-				args = append(args, prefix+name+"=false")
+				args = append(args, flag+"=false")
 			}
 		case string:
 			if v == "true" {
-				args = append(args, prefix+name+"=true")
+				args = append(args, flag+"=true")
 			} else if v == "false" {
-				args = append(args, prefix+name+"=false")
+				args = append(args, flag+"=false")
 			} else if v != "" {
-				args = append(args, prefix+name, v)
+				args = append(args, flag, v)
 			}
-		case float64:
-			// JSON numbers are decoded as float64
-			// Check if it's a whole number to avoid unnecessary decimals
-			if v == float64(int64(v)) {
-				args = append(args, prefix+name, fmt.Sprintf("%d", int64(v)))
-			} else {
-				args = append(args, prefix+name, fmt.Sprintf("%g", v))
+		case float64, int, int64, int32:
+			args = append(args, flag, flagValueString(v))
+		case []any:
+			// Lists map to the CLI's comma-separated form (e.g. --name plan1,plan2)
+			if len(v) > 0 {
+				args = append(args, flag, joinListFlag(v))
 			}
-		case int, int64, int32:
-			args = append(args, prefix+name, fmt.Sprintf("%d", v))
 		default:
 			// For any other type, convert to string
 			if v != nil {
-				args = append(args, prefix+name, fmt.Sprintf("%v", v))
+				args = append(args, flag, flagValueString(v))
 			}
 		}
 	}
@@ -390,6 +559,20 @@ func appendNormalizedFlags(args []string, flags map[string]any, skipFlags map[st
 	return args
 }
 
+// flagValueSet reports whether appendNormalizedFlags emits tokens for value:
+// empty strings, empty lists and nil are left out.
+func flagValueSet(value any) bool {
+	switch v := value.(type) {
+	case nil:
+		return false
+	case string:
+		return v != ""
+	case []any:
+		return len(v) > 0
+	}
+	return true
+}
+
 // buildCLIErrorResult checks if a CLI response indicates failure (non-zero return_value)
 // and returns an MCP CallToolResult with IsError=true if so.
 // This gives the LLM immediate, unambiguous error feedback instead of embedding
@@ -338,6 +338,11 @@ func TestValidateCommandInput(t *testing.T) {
 			input:     "kubectl get pods",
 			wantError: "subcommand path",
 		},
+		{
+			name:      "full CLI command with mixed-case prefix",
+			input:     "  Kubectl-MTV get plan",
+			wantError: "subcommand path",
+		},
 		{
 			name:      "embedded tool output with return_value",
 			input:     `get plan {"return_value": 0, "output": "..."}`,
@@ -1023,3 +1028,126 @@ func TestFilterMapFields(t *testing.T) {
 		t.Error("powerState should be filtered out")
 	}
 }
+
+func TestAppendNormalizedFlags_DeterministicOrder(t *testing.T) {
+	flags := map[string]any{
+		"name":     "my-plan",
+		"provider": "vsphere",
+		"extended": true,
+		"query":    "where cpuCount > 4",
+	}
+
+	want := []string{"--extended=true", "--name", "my-plan", "--provider", "vsphere", "--query", "where cpuCount > 4"}
+	for i := 0; i < 20; i++ {
+		got := appendNormalizedFlags(nil, flags, nil)
+		if strings.Join(got, "\x00") != strings.Join(want, "\x00") {
+			t.Fatalf("appendNormalizedFlags() = %v, want %v", got, want)
+		}
+	}
+}
+
+func TestAppendNormalizedFlags_DuplicateSpellings(t *testing.T) {
+	flags := map[string]any{
+		"dry-run":     false,
+		"dry_run":     true,
+		"target_name": "vm-a",
+		"target-name": "vm-b",
+		"namespace":   "demo",
+	}
+
+	got := appendNormalizedFlags(nil, flags, map[string]bool{"namespace": true})
+	want := []string{"--dry-run=true", "--target-name", "vm-a"}
+	if strings.Join(got, "\x00") != strings.Join(want, "\x00") {
+		t.Fatalf("appendNormalizedFlags() = %v, want %v", got, want)
+	}
+}
+
+func TestAppendNormalizedFlags_EmptySpellingKeepsValue(t *testing.T) {
+	flags := map[string]any{
+		"dry-run":     true,
+		"dry_run":     "",
+		"target-name": "vm-a",
+		"target_name": nil,
+		"vm-names":    []any{"vm1", "vm2"},
+		"vm_names":    []any{},
+	}
+
+	got := appendNormalizedFlags(nil, flags, nil)
+	want := []string{"--dry-run=true", "--target-name", "vm-a", "--vm-names", "vm1,vm2"}
+	if strings.Join(got, "\x00") != strings.Join(want, "\x00") {
+		t.Fatalf("appendNormalizedFlags() = %v, want %v", got, want)
+	}
+}
+
+func TestLookupFlag(t *testing.T) {
+	tests := []struct {
+		name   string
+		flags  map[string]any
+		keys   []string
+		want   string
+		wantOK bool
+	}{
+		{name: "first key", flags: map[string]any{"namespace": "a", "n": "b"}, keys: []string{"namespace", "n"}, want: "a", wantOK: true},
+		{name: "fallback key", flags: map[string]any{"i": "http://inv"}, keys: []string{"inventory_url", "inventory-url", "i"}, want: "http://inv", wantOK: true},
+		{name: "missing", flags: map[string]any{"name": "x"}, keys: []string{"namespace", "n"}, want: "", wantOK: false},
+		{name: "nil flags", flags: nil, keys: []string{"namespace"}, want: "", wantOK: false},
+	}
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			_, ok := lookupFlag(tt.flags, tt.keys...)
+			if ok != tt.wantOK {
+				t.Errorf("lookupFlag() ok = %v, want %v", ok, tt.wantOK)
+			}
+			if got := lookupFlagString(tt.flags, tt.keys...); got != tt.want {
+				t.Errorf("lookupFlagString() = %q, want %q", got, tt.want)
+			}
+		})
+	}
+}
+
+func TestSplitCommandPath_SharedPartsNotModified(t *testing.T) {
+	first := buildArgs("get/inventory/vm", map[string]any{"provider": "vsphere"})
+	second := buildArgs("get/inventory/vm", map[string]any{"query": "where cpuCount > 4"})
+
+	if got := strings.Join(first, " "); got != "get inventory vm --provider vsphere" {
+		t.Errorf("first args = %q", got)
+	}
+	if got := strings.Join(second, " "); got != "get inventory vm --query where cpuCount > 4" {
+		t.Errorf("second args = %q", got)
+	}
+	if got := splitCommandPath("get/inventory/vm"); strings.Join(got, "/") != "get/inventory/vm" {
+		t.Errorf("cached parts modified: %v", got)
+	}
+}
+
+func TestFlagValueString(t *testing.T) {
+	tests := []struct {
+		value any
+		want  string
+	}{
+		{nil, ""},
+		{"demo", "demo"},
+		{true, "true"},
+		{float64(3), "3"},
+		{float64(2.5), "2.5"},
+		{float64(1e6), "1000000"},
+		{42, "42"},
+		{int64(-7), "-7"},
+		{int32(8), "8"},
+		{uint(9), "9"},
+	}
+	for _, tt := range tests {
+		if got := flagValueString(tt.value); got != tt.want {
+			t.Errorf("flagValueString(%#v) = %q, want %q", tt.value, got, tt.want)
+		}
+	}
+}
+
+func TestCLIFlag(t *testing.T) {
+	if got := cliFlag("migrate_shared_disks"); got != "--migrate-shared-disks" {
+		t.Errorf("cliFlag(migrate_shared_disks) = %q, want --migrate-shared-disks", got)
+	}
+	if got := cliFlag("n"); got != "-n" {
+		t.Errorf("cliFlag(n) = %q, want -n", got)
+	}
+}
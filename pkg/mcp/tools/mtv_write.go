@@ -10,11 +10,25 @@ import (
 	"github.com/yaacov/kubectl-mtv/pkg/mcp/util"
 )
 
+// lifecycleOutputTail is the stdout kept for plan lifecycle commands. Their
+// result is the confirmation printed at the end, so only the tail is kept
+// in memory however much progress output they print.
+const lifecycleOutputTail = 8 * 1024
+
+// lifecycleCommands lists the commands whose output is reduced to its tail.
+var lifecycleCommands = map[string]bool{
+	"start/plan":     true,
+	"archive/plan":   true,
+	"unarchive/plan": true,
+	"cutover/plan":   true,
+	"cancel/plan":    true,
+}
+
 // MTVWriteInput represents the input for the mtv_write tool.
 type MTVWriteInput struct {
 	Command string `json:"command" jsonschema:"Command path (e.g. create provider, delete plan, patch mapping)"`
 
-	Flags map[string]any `json:"flags,omitempty" jsonschema:"All parameters including positional args and options (e.g. name: \"my-provider\", type: \"vsphere\", url: \"https://vcenter/sdk\", namespace: \"ns\")"`
+	Flags map[string]any `json:"flags,omitempty" jsonschema:"All parameters including positional args and options (e.g. name: \"my-provider\", type: \"vsphere\", url: \"https://vcenter/sdk\", namespace: \"ns\"). Lists may be JSON arrays (e.g. vms: [\"vm1\", \"vm2\"])"`
 
 	ShowCLI bool `json:"show_cli,omitempty" jsonschema:"If true, does not execute. Returns the equivalent CLI command in the output field instead"`
 }
@@ -51,42 +65,80 @@ func HandleMTVWrite(registry *discovery.Registry) func(context.Context, *mcp.Cal
 		// Normalize command path
 		cmdPath := normalizeCommandPath(input.Command)
 
-		// Validate command exists and is read-write
-		if !registry.IsReadWrite(cmdPath) {
+		// Validate command exists and is read-write. The command is looked up
+		// once and reused for every later step.
+		cmd, ok := registry.ReadWrite[cmdPath]
+		if !ok {
 			if registry.IsReadOnly(cmdPath) {
 				return nil, nil, fmt.Errorf("command '%s' is a read-only operation, use mtv_read tool instead", input.Command)
 			}
 			// List available commands in error, converting path keys to user-friendly format
 			available := registry.ListReadWriteCommands()
-			for i, cmd := range available {
-				available[i] = strings.ReplaceAll(cmd, "/", " ")
+			for i, c := range available {
+				available[i] = strings.ReplaceAll(c, "/", " ")
 			}
 			return nil, nil, fmt.Errorf("unknown command '%s'. Available write commands: %s", input.Command, strings.Join(available, ", "))
 		}
 
+		// Reject invalid enum values without starting kubectl-mtv
+		if err := validateEnumFlags(cmd, input.Flags); err != nil {
+			return nil, nil, err
+		}
+
 		// Enable show-CLI mode if requested
 		if input.ShowCLI {
 			ctx = util.WithShowCLI(ctx, true)
 		}
 
-		// Build command arguments (all params passed via flags)
-		args := buildWriteArgs(cmdPath, input.Flags)
+		// A patch that only names its target has nothing to apply
+		if !input.ShowCLI && isEmptyPatch(cmd, cmdPath, input.Flags) {
+			return nil, map[string]interface{}{
+				"return_value": float64(0),
+				"output":       strings.ReplaceAll(cmdPath, "/", " ") + ": no updates specified, nothing was patched",
+			}, nil
+		}
 
-		// Execute command
-		result, err := util.RunKubectlMTVCommand(ctx, args)
-		if err != nil {
-			return nil, nil, fmt.Errorf("command failed: %w", err)
+		// Pass several resource names to one kubectl-mtv invocation
+		normalizeNameList(cmd, input.Flags)
+
+		// Every write may change cluster state, so it invalidates cached
+		// responses. Writes are never answered from the cache: a retry after an
+		// out-of-band change must reach the cluster.
+		ctx = util.WithCacheInvalidation(ctx)
+
+		// Lifecycle commands only need the end of their output; dry-run output
+		// (the generated resources) is returned in full
+		if lifecycleCommands[cmdPath] {
+			if _, dryRun := lookupFlag(input.Flags, "dry_run", "dry-run"); !dryRun {
+				ctx = util.WithOutputTail(ctx, lifecycleOutputTail)
+			}
+		}
+
+		// Build command arguments (all params passed via flags); write
+		// commands do not get a default --output like reads do
+		args := buildArgs(cmdPath, input.Flags)
+
+		// Serialize concurrent writes to the same resource
+		if !input.ShowCLI {
+			unlock, err := resourceLocks.lock(ctx, resourceLockKeys(ctx, cmdPath, input.Flags))
+			if err != nil {
+				return nil, nil, fmt.Errorf("command canceled while waiting for another write to the same resource: %w", err)
+			}
+			defer unlock()
 		}
 
-		// Parse and return result
-		data, err := util.UnmarshalJSONResponse(result)
+		// Execute command, coalescing bursts of compatible lifecycle calls
+		result, err := lifecycleBatcher.execute(ctx, cmdPath, input.Flags, args)
 		if err != nil {
-			return nil, nil, err
+			return nil, nil, fmt.Errorf("command failed: %w", err)
 		}
 
+		// Return the result; JSON output is passed through without decoding
+		data := util.RawResponseData(result)
+
 		// Check for CLI errors and surface as MCP IsError response
 		if errResult := buildCLIErrorResult(data); errResult != nil {
-			if cmd := registry.ReadWrite[cmdPath]; cmd != nil {
+			if cmd != nil {
 				enrichErrorWithHelp(errResult, cmd)
 			}
 			return errResult, nil, nil
@@ -96,40 +148,69 @@ func HandleMTVWrite(registry *discovery.Registry) func(context.Context, *mcp.Cal
 	}
 }
 
-// buildWriteArgs builds the command-line arguments for kubectl-mtv write commands.
-// All parameters (namespace, name, etc.) are extracted from the flags map.
-func buildWriteArgs(cmdPath string, flags map[string]any) []string {
-	var args []string
-
-	// Add command path parts
-	parts := strings.Split(cmdPath, "/")
-	args = append(args, parts...)
+// isEmptyPatch reports whether a patch command was called with only the flags
+// that select its target (name, namespace and the command's required flags)
+// and no change. Such a call is answered without starting kubectl-mtv. It
+// returns false when a target flag is missing, so the CLI reports the error.
+func isEmptyPatch(cmd *discovery.Command, cmdPath string, flags map[string]any) bool {
+	if cmd == nil || !strings.HasPrefix(cmdPath, "patch/") {
+		return false
+	}
 
-	// Extract namespace from flags
-	var namespace string
-	if flags != nil {
-		if v, ok := flags["namespace"]; ok {
-			namespace = fmt.Sprintf("%v", v)
-		} else if v, ok := flags["n"]; ok {
-			namespace = fmt.Sprintf("%v", v)
+	target := map[string]bool{"namespace": true, "n": true, "verbose": true, "v": true}
+	var required [][]string
+	for _, f := range cmd.Flags {
+		if !f.Required && f.Name != "name" {
+			continue
+		}
+		keys := []string{f.Name, strings.ReplaceAll(f.Name, "-", "_")}
+		if f.Shorthand != "" {
+			keys = append(keys, f.Shorthand)
+		}
+		for _, key := range keys {
+			target[key] = true
 		}
+		required = append(required, keys)
 	}
-
-	// Add namespace flag
-	if namespace != "" {
-		args = append(args, "--namespace", namespace)
+	for _, keys := range required {
+		if lookupFlagString(flags, keys...) == "" {
+			return false
+		}
 	}
 
-	// Note: Write commands typically don't support --output json output format
-	// so we don't add it automatically like we do for read commands
-
-	// Skip set for already handled flags
-	skipFlags := map[string]bool{
-		"namespace": true, "n": true,
+	for key, value := range flags {
+		if target[key] {
+			continue
+		}
+		switch v := value.(type) {
+		case nil:
+		case string:
+			if v != "" {
+				return false
+			}
+		case []any:
+			if len(v) > 0 {
+				return false
+			}
+		default:
+			return false
+		}
 	}
+	return true
+}
 
-	// Add other flags using the normalizer
-	args = appendNormalizedFlags(args, flags, skipFlags)
-
-	return args
+// normalizeNameList lets commands whose --name flag takes a list (start, archive,
+// unarchive, cutover, delete ...) receive several names in one call. Names given
+// as a whitespace-separated string are rewritten to the comma-separated form the
+// CLI expects; JSON arrays are joined by appendNormalizedFlags. This runs one
+// kubectl-mtv process for all names instead of one per name.
+func normalizeNameList(cmd *discovery.Command, flags map[string]any) {
+	if !strings.HasSuffix(commandFlagType(cmd, "name"), "Slice") {
+		return
+	}
+	for _, key := range []string{"name", "M"} {
+		if s, ok := flags[key].(string); ok && strings.ContainsAny(s, " \t\n") {
+			flags[key] = strings.Join(strings.Fields(s), ",")
+		}
+	}
 }
@@ -49,9 +49,9 @@ func TestGetMTVWriteTool(t *testing.T) {
 	}
 }
 
-// --- buildWriteArgs tests ---
+// --- buildArgs tests for write commands ---
 
-func TestBuildWriteArgs(t *testing.T) {
+func TestBuildArgs_WriteCommands(t *testing.T) {
 	tests := []struct {
 		name         string
 		cmdPath      string
@@ -104,23 +104,140 @@ func TestBuildWriteArgs(t *testing.T) {
 
 	for _, tt := range tests {
 		t.Run(tt.name, func(t *testing.T) {
-			result := buildWriteArgs(tt.cmdPath, tt.flags)
+			result := buildArgs(tt.cmdPath, tt.flags)
 			joined := strings.Join(result, " ")
 
 			for _, want := range tt.wantContains {
 				if !strings.Contains(joined, want) {
-					t.Errorf("buildWriteArgs() = %v, should contain %q", result, want)
+					t.Errorf("buildArgs() = %v, should contain %q", result, want)
 				}
 			}
 			for _, notWant := range tt.wantMissing {
 				if strings.Contains(joined, notWant) {
-					t.Errorf("buildWriteArgs() = %v, should NOT contain %q", result, notWant)
+					t.Errorf("buildArgs() = %v, should NOT contain %q", result, notWant)
 				}
 			}
 		})
 	}
 }
 
+func TestIsEmptyPatch(t *testing.T) {
+	planVMCmd := &discovery.Command{
+		Path: []string{"patch", "planvm"},
+		Flags: []discovery.Flag{
+			{Name: "plan-name", Type: "string", Required: true},
+			{Name: "vm-name", Type: "string", Required: true},
+			{Name: "target-name", Type: "string"},
+		},
+	}
+	providerCmd := &discovery.Command{
+		Path: []string{"patch", "provider"},
+		Flags: []discovery.Flag{
+			{Name: "name", Shorthand: "M", Type: "string"},
+			{Name: "insecure-skip-tls", Type: "bool"},
+		},
+	}
+
+	tests := []struct {
+		name    string
+		cmd     *discovery.Command
+		cmdPath string
+		flags   map[string]any
+		want    bool
+	}{
+		{"only target flags", planVMCmd, "patch/planvm", map[string]any{"plan_name": "p1", "vm-name": "vm1", "namespace": "demo"}, true},
+		{"empty values", planVMCmd, "patch/planvm", map[string]any{"plan_name": "p1", "vm_name": "vm1", "target_name": ""}, true},
+		{"change given", planVMCmd, "patch/planvm", map[string]any{"plan_name": "p1", "vm_name": "vm1", "target_name": "new"}, false},
+		{"missing required flag", planVMCmd, "patch/planvm", map[string]any{"plan_name": "p1"}, false},
+		{"shorthand name", providerCmd, "patch/provider", map[string]any{"M": "prov", "n": "demo"}, true},
+		{"bool false is a change", providerCmd, "patch/provider", map[string]any{"name": "prov", "insecure_skip_tls": false}, false},
+		{"missing name", providerCmd, "patch/provider", map[string]any{"namespace": "demo"}, false},
+		{"not a patch", providerCmd, "delete/provider", map[string]any{"name": "prov"}, false},
+		{"nil command", nil, "patch/provider", map[string]any{"name": "prov"}, false},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			if got := isEmptyPatch(tt.cmd, tt.cmdPath, tt.flags); got != tt.want {
+				t.Errorf("isEmptyPatch() = %v, want %v", got, tt.want)
+			}
+		})
+	}
+}
+
+func TestNormalizeNameList(t *testing.T) {
+	sliceCmd := &discovery.Command{
+		Path:  []string{"archive", "plan"},
+		Flags: []discovery.Flag{{Name: "name", Shorthand: "M", Type: "stringSlice"}},
+	}
+	stringCmd := &discovery.Command{
+		Path:  []string{"create", "plan"},
+		Flags: []discovery.Flag{{Name: "name", Shorthand: "M", Type: "string"}},
+	}
+
+	tests := []struct {
+		name  string
+		cmd   *discovery.Command
+		flags map[string]any
+		want  any
+		key   string
+	}{
+		{"space separated names", sliceCmd, map[string]any{"name": "plan1 plan2  plan3"}, "plan1,plan2,plan3", "name"},
+		{"shorthand key", sliceCmd, map[string]any{"M": "plan1\tplan2"}, "plan1,plan2", "M"},
+		{"comma separated unchanged", sliceCmd, map[string]any{"name": "plan1,plan2"}, "plan1,plan2", "name"},
+		{"single name unchanged", sliceCmd, map[string]any{"name": "plan1"}, "plan1", "name"},
+		{"string flag unchanged", stringCmd, map[string]any{"name": "plan1 plan2"}, "plan1 plan2", "name"},
+		{"nil command unchanged", nil, map[string]any{"name": "plan1 plan2"}, "plan1 plan2", "name"},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			normalizeNameList(tt.cmd, tt.flags)
+			if got := tt.flags[tt.key]; got != tt.want {
+				t.Errorf("flags[%q] = %v, want %v", tt.key, got, tt.want)
+			}
+		})
+	}
+
+	// A nil flags map must not panic
+	normalizeNameList(sliceCmd, nil)
+}
+
+func TestBuildWriteArgs_NameList(t *testing.T) {
+	args := buildArgs("archive/plan", map[string]any{
+		"name":      []any{"plan1", "plan2"},
+		"namespace": "demo",
+	})
+	joined := strings.Join(args, " ")
+	if !strings.Contains(joined, "--name plan1,plan2") {
+		t.Errorf("buildArgs() = %v, should join list names with commas", args)
+	}
+}
+
+func TestJoinListFlag(t *testing.T) {
+	tests := []struct {
+		name  string
+		items []any
+		want  string
+	}{
+		{"strings", []any{"vm-1", "vm 2"}, "vm-1,vm 2"},
+		{"numbers", []any{float64(1), float64(2.5)}, "1,2.5"},
+		{"objects", []any{map[string]any{"name": "vm-1"}}, `{"name":"vm-1"}`},
+	}
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			if got := joinListFlag(tt.items); got != tt.want {
+				t.Errorf("joinListFlag() = %q, want %q", got, tt.want)
+			}
+		})
+	}
+
+	args := buildArgs("cancel/plan", map[string]any{"name": "p1", "vms": []any{"vm-1", "vm-2"}})
+	if !strings.Contains(strings.Join(args, " "), "--vms vm-1,vm-2") {
+		t.Errorf("buildArgs() = %v, should join the VM list with commas", args)
+	}
+}
+
 // --- Handler validation error tests ---
 
 func TestHandleMTVWrite_ValidationErrors(t *testing.T) {
@@ -257,3 +374,44 @@ func TestHandleMTVWrite_ShowCLI(t *testing.T) {
 		})
 	}
 }
+
+func TestValidateEnumFlags(t *testing.T) {
+	cmd := &discovery.Command{
+		Path: []string{"create", "provider"},
+		Flags: []discovery.Flag{
+			{Name: "type", Type: "string", Enum: []string{"vsphere", "ovirt", "openstack", "openshift", "ova"}},
+			{Name: "migration-type", Shorthand: "m", Type: "string", Enum: []string{"cold", "warm", "live"}},
+			{Name: "url", Type: "string"},
+		},
+	}
+
+	tests := []struct {
+		name    string
+		flags   map[string]any
+		wantErr string
+	}{
+		{name: "valid values", flags: map[string]any{"type": "vsphere", "migration_type": "warm"}},
+		{name: "no enum flags", flags: map[string]any{"url": "https://vcenter"}},
+		{name: "nil flags", flags: nil},
+		{name: "invalid type", flags: map[string]any{"type": "vspheer"}, wantErr: `invalid value "vspheer" for flag 'type'`},
+		{name: "invalid snake_case", flags: map[string]any{"migration_type": "hot"}, wantErr: "must be one of: cold, warm, live"},
+		{name: "invalid kebab-case", flags: map[string]any{"migration-type": "hot"}, wantErr: "migration-type"},
+		{name: "invalid shorthand", flags: map[string]any{"m": "hot"}, wantErr: "migration-type"},
+		{name: "empty value ignored", flags: map[string]any{"type": ""}},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			err := validateEnumFlags(cmd, tt.flags)
+			if tt.wantErr == "" {
+				if err != nil {
+					t.Fatalf("unexpected error: %v", err)
+				}
+				return
+			}
+			if err == nil || !strings.Contains(err.Error(), tt.wantErr) {
+				t.Fatalf("error = %v, want containing %q", err, tt.wantErr)
+			}
+		})
+	}
+}
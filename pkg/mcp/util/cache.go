@@ -0,0 +1,198 @@
+package util
+
+import (
+	"container/list"
+	"context"
+	"crypto/sha256"
+	"encoding/hex"
+	"sync"
+	"time"
+)
+
+const (
+	// cacheTTLKey is the context key for the response cache TTL of a command
+	cacheTTLKey contextKey = "cache_ttl"
+	// cacheInvalidateKey is the context key marking a command that changes cluster state
+	cacheInvalidateKey contextKey = "cache_invalidate"
+)
+
+// responseCacheSize is the maximum number of responses kept in the cache.
+const responseCacheSize = 512
+
+// DefaultReadCacheTTL is the default time a read command's response is reused
+// for identical read calls.
+const DefaultReadCacheTTL = 3 * time.Second
+
+// readCacheTTL is the response cache TTL of read commands (0 = disabled).
+var readCacheTTL = DefaultReadCacheTTL
+
+// SetReadCacheTTL sets the time a read command's response is reused for
+// identical read calls. Agents often repeat a read while iterating; a short
+// TTL answers the repeats without running kubectl-mtv again, while writes
+// still clear the cache. A TTL <= 0 disables read caching.
+func SetReadCacheTTL(ttl time.Duration) {
+	if ttl < 0 {
+		ttl = 0
+	}
+	readCacheTTL = ttl
+}
+
+// GetReadCacheTTL returns the response cache TTL of read commands.
+func GetReadCacheTTL() time.Duration {
+	return readCacheTTL
+}
+
+// WithCacheTTL enables response caching for a command.
+// Successful responses are reused for identical commands (same arguments and
+// credentials) until the TTL expires. A TTL <= 0 disables caching.
+func WithCacheTTL(ctx context.Context, ttl time.Duration) context.Context {
+	return context.WithValue(ctx, cacheTTLKey, ttl)
+}
+
+// GetCacheTTL retrieves the response cache TTL from the context.
+func GetCacheTTL(ctx context.Context) time.Duration {
+	if ctx == nil {
+		return 0
+	}
+	ttl, _ := ctx.Value(cacheTTLKey).(time.Duration)
+	return ttl
+}
+
+// WithCacheInvalidation marks a command as changing cluster state.
+// When such a command is executed (not served from the cache), all cached
+// responses are dropped, since any of them may now be stale.
+func WithCacheInvalidation(ctx context.Context) context.Context {
+	return context.WithValue(ctx, cacheInvalidateKey, true)
+}
+
+// GetCacheInvalidation retrieves the cache invalidation flag from the context.
+func GetCacheInvalidation(ctx context.Context) bool {
+	if ctx == nil {
+		return false
+	}
+	invalidate, ok := ctx.Value(cacheInvalidateKey).(bool)
+	return ok && invalidate
+}
+
+// responseCache is a TTL + LRU cache of command responses.
+type responseCache struct {
+	mu         sync.Mutex
+	maxEntries int
+	order      *list.List // front is the most recently used entry
+	entries    map[string]*list.Element
+	// generation counts clears, so a response read before a write is not
+	// stored after the write cleared the cache
+	generation uint64
+}
+
+// cacheEntry is a single cached response.
+type cacheEntry struct {
+	key      string
+	response CommandResponse
+	expires  time.Time
+}
+
+// commandCache holds responses of commands executed with a cache TTL.
+var commandCache = newResponseCache(responseCacheSize)
+
+// newResponseCache creates an empty cache holding at most maxEntries responses.
+func newResponseCache(maxEntries int) *responseCache {
+	return &responseCache{
+		maxEntries: maxEntries,
+		order:      list.New(),
+		entries:    make(map[string]*list.Element),
+	}
+}
+
+// get returns the cached response for key if present and not expired.
+func (c *responseCache) get(key string, now time.Time) (CommandResponse, bool) {
+	c.mu.Lock()
+	defer c.mu.Unlock()
+
+	elem, ok := c.entries[key]
+	if !ok {
+		return CommandResponse{}, false
+	}
+	entry := elem.Value.(*cacheEntry)
+	if now.After(entry.expires) {
+		c.order.Remove(elem)
+		delete(c.entries, key)
+		return CommandResponse{}, false
+	}
+	c.order.MoveToFront(elem)
+	return entry.response, true
+}
+
+// put stores a response, evicting the least recently used entry when full.
+func (c *responseCache) put(key string, response CommandResponse, expires time.Time) {
+	c.mu.Lock()
+	defer c.mu.Unlock()
+
+	c.store(key, response, expires)
+}
+
+// putIfGeneration stores a response like put, unless the cache was cleared
+// since generation gen was read: the response may predate that write.
+func (c *responseCache) putIfGeneration(gen uint64, key string, response CommandResponse, expires time.Time) {
+	c.mu.Lock()
+	defer c.mu.Unlock()
+
+	if c.generation == gen {
+		c.store(key, response, expires)
+	}
+}
+
+// store adds or updates an entry; c.mu must be held.
+func (c *responseCache) store(key string, response CommandResponse, expires time.Time) {
+	if elem, ok := c.entries[key]; ok {
+		entry := elem.Value.(*cacheEntry)
+		entry.response = response
+		entry.expires = expires
+		c.order.MoveToFront(elem)
+		return
+	}
+
+	c.entries[key] = c.order.PushFront(&cacheEntry{key: key, response: response, expires: expires})
+	if c.order.Len() > c.maxEntries {
+		oldest := c.order.Back()
+		c.order.Remove(oldest)
+		delete(c.entries, oldest.Value.(*cacheEntry).key)
+	}
+}
+
+// clear drops all cached responses and starts a new generation.
+func (c *responseCache) clear() {
+	c.mu.Lock()
+	defer c.mu.Unlock()
+
+	c.order.Init()
+	c.entries = make(map[string]*list.Element)
+	c.generation++
+}
+
+// currentGeneration returns the number of clears so far.
+func (c *responseCache) currentGeneration() uint64 {
+	c.mu.Lock()
+	defer c.mu.Unlock()
+
+	return c.generation
+}
+
+// len returns the number of cached responses.
+func (c *responseCache) len() int {
+	c.mu.Lock()
+	defer c.mu.Unlock()
+
+	return c.order.Len()
+}
+
+// cacheKey hashes the full argument vector. The arguments include the --server
+// and --token flags, so responses are never shared between users or clusters.
+func cacheKey(args []string) string {
+	h := sha256.New()
+	for _, arg := range args {
+		h.Write([]byte(arg))
+		h.Write([]byte{0})
+	}
+	return hex.EncodeToString(h.Sum(nil))
+}
@@ -0,0 +1,222 @@
+package util
+
+import (
+	"context"
+	"sync/atomic"
+	"testing"
+	"time"
+)
+
+func TestResponseCache_GetPut(t *testing.T) {
+	c := newResponseCache(4)
+	now := time.Now()
+
+	if _, ok := c.get("missing", now); ok {
+		t.Error("get() on empty cache should miss")
+	}
+
+	c.put("a", CommandResponse{Stdout: "response-a"}, now.Add(time.Minute))
+	if got, ok := c.get("a", now); !ok || got.Stdout != "response-a" {
+		t.Errorf("get(a) = %+v, %v; want response-a, true", got, ok)
+	}
+
+	// Overwriting an existing key updates the response
+	c.put("a", CommandResponse{Stdout: "response-a2"}, now.Add(time.Minute))
+	if got, _ := c.get("a", now); got.Stdout != "response-a2" {
+		t.Errorf("get(a) after overwrite = %+v, want response-a2", got)
+	}
+	if c.len() != 1 {
+		t.Errorf("len() = %d, want 1", c.len())
+	}
+}
+
+func TestResponseCache_Expiry(t *testing.T) {
+	c := newResponseCache(4)
+	now := time.Now()
+
+	c.put("a", CommandResponse{Stdout: "response-a"}, now.Add(time.Second))
+	if _, ok := c.get("a", now.Add(2*time.Second)); ok {
+		t.Error("get() should miss after the entry expired")
+	}
+	if c.len() != 0 {
+		t.Errorf("expired entry should be removed, len() = %d", c.len())
+	}
+}
+
+func TestResponseCache_LRUEviction(t *testing.T) {
+	c := newResponseCache(3)
+	now := time.Now()
+	expires := now.Add(time.Minute)
+
+	c.put("a", CommandResponse{Stdout: "1"}, expires)
+	c.put("b", CommandResponse{Stdout: "2"}, expires)
+	c.put("c", CommandResponse{Stdout: "3"}, expires)
+
+	// Touch "a" so "b" becomes the least recently used entry
+	c.get("a", now)
+	c.put("d", CommandResponse{Stdout: "4"}, expires)
+
+	if _, ok := c.get("b", now); ok {
+		t.Error("least recently used entry b should have been evicted")
+	}
+	for _, key := range []string{"a", "c", "d"} {
+		if _, ok := c.get(key, now); !ok {
+			t.Errorf("entry %s should still be cached", key)
+		}
+	}
+}
+
+func TestResponseCache_Clear(t *testing.T) {
+	c := newResponseCache(4)
+	c.put("a", CommandResponse{Stdout: "1"}, time.Now().Add(time.Minute))
+	c.clear()
+	if c.len() != 0 {
+		t.Errorf("len() after clear = %d, want 0", c.len())
+	}
+}
+
+func TestResponseCache_PutIfGeneration(t *testing.T) {
+	c := newResponseCache(4)
+	expires := time.Now().Add(time.Minute)
+
+	gen := c.currentGeneration()
+	c.putIfGeneration(gen, "a", CommandResponse{Stdout: "1"}, expires)
+	if _, ok := c.get("a", time.Now()); !ok {
+		t.Error("putIfGeneration() should store a response of the current generation")
+	}
+
+	c.clear()
+	c.putIfGeneration(gen, "b", CommandResponse{Stdout: "2"}, expires)
+	if _, ok := c.get("b", time.Now()); ok {
+		t.Error("putIfGeneration() should drop a response read before the cache was cleared")
+	}
+}
+
+func TestRunCommand_ReadOverlappingWrite(t *testing.T) {
+	defer commandCache.clear()
+	origDirect := directCommands
+	directCommands = map[string]DirectCommand{}
+	defer func() { directCommands = origDirect }()
+
+	started := make(chan struct{})
+	release := make(chan struct{})
+	var reads atomic.Int32
+	RegisterDirectCommand("get/plan", func(context.Context, []string) (string, bool, error) {
+		if reads.Add(1) == 1 {
+			close(started)
+			<-release
+			return "before", true, nil
+		}
+		return "after", true, nil
+	})
+	RegisterDirectCommand("archive/plan", func(context.Context, []string) (string, bool, error) {
+		return "archived", true, nil
+	})
+
+	readCtx := WithCoalescing(WithCacheTTL(context.Background(), time.Minute))
+	read := []string{"get", "plan"}
+	first := make(chan CommandResponse, 1)
+	go func() {
+		response, _ := RunCommand(readCtx, read)
+		first <- response
+	}()
+	<-started
+
+	if _, err := RunCommand(WithCacheInvalidation(context.Background()), []string{"archive", "plan"}); err != nil {
+		t.Fatalf("write failed: %v", err)
+	}
+
+	// A read issued after the write does not join the read started before it
+	second := make(chan CommandResponse, 1)
+	go func() {
+		response, _ := RunCommand(readCtx, read)
+		second <- response
+	}()
+	select {
+	case response := <-second:
+		if response.Stdout != "after" {
+			t.Errorf("read after the write = %q, want %q", response.Stdout, "after")
+		}
+	case <-time.After(5 * time.Second):
+		close(release)
+		t.Fatal("read after the write joined the read started before it")
+	}
+	close(release)
+	if response := <-first; response.Stdout != "before" {
+		t.Errorf("read before the write = %q, want %q", response.Stdout, "before")
+	}
+
+	// The earlier read finished last, but its response was not cached
+	if response, _ := RunCommand(readCtx, read); response.Stdout != "after" {
+		t.Errorf("cached read = %q, want %q", response.Stdout, "after")
+	}
+}
+
+func TestCacheKey(t *testing.T) {
+	base := cacheKey([]string{"--token", "t1", "archive", "plan", "--name", "p1"})
+
+	if got := cacheKey([]string{"--token", "t1", "archive", "plan", "--name", "p1"}); got != base {
+		t.Error("identical args should produce the same key")
+	}
+	if got := cacheKey([]string{"--token", "t2", "archive", "plan", "--name", "p1"}); got == base {
+		t.Error("different credentials must produce different keys")
+	}
+	// Argument boundaries are part of the key
+	if cacheKey([]string{"ab", "c"}) == cacheKey([]string{"a", "bc"}) {
+		t.Error("keys should not collide when argument boundaries differ")
+	}
+}
+
+func TestWithCacheTTL(t *testing.T) {
+	ctx := context.Background()
+	if got := GetCacheTTL(ctx); got != 0 {
+		t.Errorf("GetCacheTTL() default = %v, want 0", got)
+	}
+	ctx = WithCacheTTL(ctx, 5*time.Second)
+	if got := GetCacheTTL(ctx); got != 5*time.Second {
+		t.Errorf("GetCacheTTL() = %v, want 5s", got)
+	}
+}
+
+func TestRunKubectlMTVCommand_ServesCachedResponse(t *testing.T) {
+	defer commandCache.clear()
+
+	ctx := WithCacheTTL(context.Background(), time.Minute)
+	args := []string{"archive", "plan", "--name", "cached-plan"}
+
+	// Seed the cache with the key the runner will compute for these args
+	cached := CommandResponse{Stdout: "cached"}
+	commandCache.put(cacheKey(buildCommandArgs(ctx, args)), cached, time.Now().Add(time.Minute))
+
+	result, err := RunCommand(ctx, args)
+	if err != nil {
+		t.Fatalf("unexpected error: %v", err)
+	}
+	if result != cached {
+		t.Errorf("expected cached response, got: %+v", result)
+	}
+
+	// Without a TTL the cache is bypassed (the canceled context keeps the
+	// command from actually running)
+	canceled, cancel := context.WithCancel(context.Background())
+	cancel()
+	result, err = RunCommand(canceled, args)
+	if err != nil {
+		t.Fatalf("unexpected error: %v", err)
+	}
+	if result == cached {
+		t.Error("cache should not be consulted when no TTL is set")
+	}
+}
+
+func TestSetReadCacheTTL(t *testing.T) {
+	defer SetReadCacheTTL(DefaultReadCacheTTL)
+
+	if got := GetReadCacheTTL(); got != DefaultReadCacheTTL {
+		t.Errorf("GetReadCacheTTL() = %v, want default %v", got, DefaultReadCacheTTL)
+	}
+	SetReadCacheTTL(-time.Second)
+	if got := GetReadCacheTTL(); got != 0 {
+		t.Errorf("a negative TTL should disable read caching, got %v", got)
+	}
+}
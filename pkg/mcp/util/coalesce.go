@@ -0,0 +1,79 @@
+package util
+
+import (
+	"context"
+	"sync"
+)
+
+// coalesceKey is the context key marking a command whose concurrent identical
+// executions may be shared
+const coalesceKey contextKey = "coalesce"
+
+// WithCoalescing lets a command share the execution of an identical command
+// (same arguments and credentials) that is already running, instead of
+// starting its own. It is meant for read commands: a burst of agents or
+// retries asking for the same listing then costs one kubectl-mtv run.
+func WithCoalescing(ctx context.Context) context.Context {
+	return context.WithValue(ctx, coalesceKey, true)
+}
+
+// GetCoalescing retrieves the coalescing flag from the context.
+func GetCoalescing(ctx context.Context) bool {
+	if ctx == nil {
+		return false
+	}
+	coalesce, ok := ctx.Value(coalesceKey).(bool)
+	return ok && coalesce
+}
+
+// inflightGroup shares the result of a running command with identical calls
+// that arrive before it finishes.
+type inflightGroup struct {
+	mu    sync.Mutex
+	calls map[string]*inflightCall
+}
+
+// inflightCall is a command execution shared by one or more callers.
+type inflightCall struct {
+	done     chan struct{}
+	response CommandResponse
+	err      error
+	// shared is false when the caller running the command was canceled;
+	// waiting callers then run the command themselves.
+	shared bool
+}
+
+// inflightCommands holds the commands run with coalescing enabled.
+var inflightCommands = &inflightGroup{calls: make(map[string]*inflightCall)}
+
+// do runs fn for key, or waits for the call already running for key and
+// returns its result. ctx is the caller's context; a caller whose context
+// ends while waiting gets a canceled response.
+func (g *inflightGroup) do(ctx context.Context, key string, fn func() (CommandResponse, error)) (CommandResponse, error) {
+	g.mu.Lock()
+	if call, ok := g.calls[key]; ok {
+		g.mu.Unlock()
+		select {
+		case <-call.done:
+		case <-ctx.Done():
+			return CommandResponse{ReturnValue: -1, Stderr: "command canceled: " + ctx.Err().Error()}, nil
+		}
+		if call.shared {
+			return call.response, call.err
+		}
+		return fn()
+	}
+	call := &inflightCall{done: make(chan struct{})}
+	g.calls[key] = call
+	g.mu.Unlock()
+
+	call.response, call.err = fn()
+	call.shared = ctx.Err() == nil
+
+	g.mu.Lock()
+	delete(g.calls, key)
+	g.mu.Unlock()
+	close(call.done)
+
+	return call.response, call.err
+}
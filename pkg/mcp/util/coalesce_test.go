@@ -0,0 +1,100 @@
+package util
+
+import (
+	"context"
+	"sync"
+	"sync/atomic"
+	"testing"
+	"time"
+)
+
+func TestInflightGroup_SharesRunningCall(t *testing.T) {
+	g := &inflightGroup{calls: make(map[string]*inflightCall)}
+	release := make(chan struct{})
+	var runs atomic.Int32
+	fn := func() (CommandResponse, error) {
+		runs.Add(1)
+		<-release
+		return CommandResponse{Stdout: "plans"}, nil
+	}
+
+	const callers = 5
+	results := make([]CommandResponse, callers)
+	var wg sync.WaitGroup
+	for i := 0; i < callers; i++ {
+		wg.Add(1)
+		go func(i int) {
+			defer wg.Done()
+			results[i], _ = g.do(context.Background(), "get plan", fn)
+		}(i)
+	}
+
+	// Let every caller join the running call before it finishes
+	deadline := time.Now().Add(time.Second)
+	for runs.Load() == 0 && time.Now().Before(deadline) {
+		time.Sleep(time.Millisecond)
+	}
+	time.Sleep(20 * time.Millisecond)
+	close(release)
+	wg.Wait()
+
+	if n := runs.Load(); n != 1 {
+		t.Errorf("identical concurrent calls should run once, ran %d times", n)
+	}
+	for i, r := range results {
+		if r.Stdout != "plans" {
+			t.Errorf("caller %d got %+v, want the shared response", i, r)
+		}
+	}
+
+	// Once finished, the next call runs again
+	release = make(chan struct{})
+	close(release)
+	if _, err := g.do(context.Background(), "get plan", fn); err != nil {
+		t.Fatalf("do() error = %v", err)
+	}
+	if n := runs.Load(); n != 2 {
+		t.Errorf("a call after completion should run again, ran %d times", n)
+	}
+}
+
+func TestInflightGroup_CanceledLeaderNotShared(t *testing.T) {
+	g := &inflightGroup{calls: make(map[string]*inflightCall)}
+	leaderCtx, cancel := context.WithCancel(context.Background())
+	started := make(chan struct{})
+
+	leaderDone := make(chan struct{})
+	go func() {
+		defer close(leaderDone)
+		_, _ = g.do(leaderCtx, "get plan", func() (CommandResponse, error) {
+			close(started)
+			<-leaderCtx.Done()
+			return CommandResponse{ReturnValue: -1, Stderr: "command canceled"}, nil
+		})
+	}()
+	<-started
+
+	followerDone := make(chan CommandResponse)
+	go func() {
+		r, _ := g.do(context.Background(), "get plan", func() (CommandResponse, error) {
+			return CommandResponse{Stdout: "plans"}, nil
+		})
+		followerDone <- r
+	}()
+	time.Sleep(20 * time.Millisecond)
+	cancel()
+	<-leaderDone
+
+	if r := <-followerDone; r.Stdout != "plans" {
+		t.Errorf("a waiting caller should run the command itself when the leader was canceled, got %+v", r)
+	}
+}
+
+func TestGetCoalescing(t *testing.T) {
+	if GetCoalescing(context.Background()) {
+		t.Error("coalescing should be off by default")
+	}
+	if !GetCoalescing(WithCoalescing(context.Background())) {
+		t.Error("WithCoalescing should enable coalescing")
+	}
+}
@@ -0,0 +1,41 @@
+package util
+
+import (
+	"context"
+)
+
+// DefaultMaxConcurrency is the default number of kubectl-mtv subprocesses
+// that may run at the same time.
+const DefaultMaxConcurrency = 8
+
+// commandSlots is a counting semaphore bounding concurrent kubectl-mtv subprocesses.
+// A burst of tool calls (e.g. an agent fanning out over many plans) would
+// otherwise fork one process per call, thrashing the host and the API server.
+var commandSlots = make(chan struct{}, DefaultMaxConcurrency)
+
+// SetMaxConcurrency sets the maximum number of concurrent kubectl-mtv subprocesses.
+// Values < 1 fall back to DefaultMaxConcurrency.
+// It must be called before the server starts handling requests.
+func SetMaxConcurrency(n int) {
+	if n < 1 {
+		n = DefaultMaxConcurrency
+	}
+	commandSlots = make(chan struct{}, n)
+}
+
+// GetMaxConcurrency returns the maximum number of concurrent kubectl-mtv subprocesses.
+func GetMaxConcurrency() int {
+	return cap(commandSlots)
+}
+
+// acquireCommandSlot blocks until a subprocess slot is free or the context is done.
+// On success it returns a function that releases the slot.
+func acquireCommandSlot(ctx context.Context) (func(), error) {
+	slots := commandSlots
+	select {
+	case slots <- struct{}{}:
+		return func() { <-slots }, nil
+	case <-ctx.Done():
+		return nil, ctx.Err()
+	}
+}
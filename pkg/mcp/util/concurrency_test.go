@@ -0,0 +1,49 @@
+package util
+
+import (
+	"context"
+	"testing"
+	"time"
+)
+
+func TestSetMaxConcurrency(t *testing.T) {
+	orig := GetMaxConcurrency()
+	defer SetMaxConcurrency(orig)
+
+	SetMaxConcurrency(3)
+	if got := GetMaxConcurrency(); got != 3 {
+		t.Errorf("GetMaxConcurrency() = %d, want 3", got)
+	}
+
+	SetMaxConcurrency(0)
+	if got := GetMaxConcurrency(); got != DefaultMaxConcurrency {
+		t.Errorf("SetMaxConcurrency(0) should fall back to %d, got %d", DefaultMaxConcurrency, got)
+	}
+}
+
+func TestAcquireCommandSlot(t *testing.T) {
+	orig := GetMaxConcurrency()
+	defer SetMaxConcurrency(orig)
+
+	SetMaxConcurrency(1)
+
+	release, err := acquireCommandSlot(context.Background())
+	if err != nil {
+		t.Fatalf("first acquire failed: %v", err)
+	}
+
+	// The only slot is taken, so a second acquire must wait until the context expires
+	ctx, cancel := context.WithTimeout(context.Background(), 20*time.Millisecond)
+	defer cancel()
+	if _, err := acquireCommandSlot(ctx); err == nil {
+		t.Fatal("second acquire should fail while the slot is held")
+	}
+
+	// After release the slot is available again
+	release()
+	release2, err := acquireCommandSlot(context.Background())
+	if err != nil {
+		t.Fatalf("acquire after release failed: %v", err)
+	}
+	release2()
+}
@@ -0,0 +1,56 @@
+package util
+
+import (
+	"context"
+	"errors"
+	"strings"
+)
+
+// DirectCommand runs a kubectl-mtv command in-process, calling the Kubernetes
+// API directly instead of starting a kubectl-mtv process.
+// args are the command arguments after the command path (for "archive plan
+// --name p1" that is ["--name", "p1"]). It returns handled=false, without
+// doing anything, when it does not support the given arguments; the command
+// then runs in a kubectl-mtv process as usual.
+type DirectCommand func(ctx context.Context, args []string) (stdout string, handled bool, err error)
+
+// directCommands maps a command path ("archive/plan") to its in-process implementation.
+// It is filled at startup and read-only afterwards.
+var directCommands = map[string]DirectCommand{}
+
+// errNotDirect is returned by runDirect when a command has no in-process implementation.
+var errNotDirect = errors.New("no direct implementation")
+
+// RegisterDirectCommand registers an in-process implementation for a command path
+// such as "archive/plan". It must be called before the server starts handling requests.
+func RegisterDirectCommand(cmdPath string, fn DirectCommand) {
+	directCommands[cmdPath] = fn
+}
+
+// lookupDirectCommand returns the in-process implementation registered for
+// the command path of args, or nil when there is none.
+func lookupDirectCommand(args []string) DirectCommand {
+	if len(args) < 2 || len(directCommands) == 0 {
+		return nil
+	}
+	return directCommands[args[0]+"/"+args[1]]
+}
+
+// runDirect runs a command through its registered in-process implementation.
+// It returns errNotDirect when there is none or it declined the arguments.
+// A failed command is reported like the CLI does: "Error: ..." on stderr and rc 1.
+func runDirect(ctx context.Context, args []string) (stdout, stderr string, rc int, err error) {
+	fn := lookupDirectCommand(args)
+	if fn == nil {
+		return "", "", 0, errNotDirect
+	}
+
+	stdout, handled, err := fn(ctx, args[2:])
+	if !handled {
+		return "", "", 0, errNotDirect
+	}
+	if err != nil && ctx.Err() == nil {
+		return stdout, "Error: " + strings.TrimSpace(err.Error()) + "\n", 1, nil
+	}
+	return stdout, "", 0, err
+}
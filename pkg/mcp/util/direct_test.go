@@ -0,0 +1,70 @@
+package util
+
+import (
+	"context"
+	"encoding/json"
+	"errors"
+	"os/exec"
+	"strings"
+	"testing"
+)
+
+func TestRunKubectlMTVCommand_DirectCommand(t *testing.T) {
+	falseBin, err := exec.LookPath("false")
+	if err != nil {
+		t.Skip("false binary not available")
+	}
+	origExe := selfExePath
+	selfExePath = falseBin // any process start fails the command
+	defer func() { selfExePath = origExe }()
+
+	origDirect := directCommands
+	directCommands = map[string]DirectCommand{}
+	defer func() { directCommands = origDirect }()
+
+	var gotArgs []string
+	RegisterDirectCommand("archive/plan", func(_ context.Context, args []string) (string, bool, error) {
+		gotArgs = args
+		switch args[len(args)-1] {
+		case "--all":
+			return "", false, nil
+		case "missing":
+			return "", true, errors.New("failed to get plan 'missing'")
+		}
+		return "Plan 'p1' archived\n", true, nil
+	})
+
+	run := func(args ...string) CommandResponse {
+		t.Helper()
+		result, err := RunKubectlMTVCommand(context.Background(), args)
+		if err != nil {
+			t.Fatalf("unexpected error: %v", err)
+		}
+		var response CommandResponse
+		if err := json.Unmarshal([]byte(result), &response); err != nil {
+			t.Fatalf("failed to parse response: %v", err)
+		}
+		return response
+	}
+
+	response := run("archive", "plan", "--name", "p1")
+	if response.ReturnValue != 0 || response.Stdout != "Plan 'p1' archived\n" {
+		t.Errorf("direct command should answer without a process, got %+v", response)
+	}
+	if strings.Join(gotArgs, " ") != "--name p1" {
+		t.Errorf("direct command should get the args after the command path, got %q", gotArgs)
+	}
+
+	response = run("archive", "plan", "--name", "missing")
+	if response.ReturnValue != 1 || response.Stderr != "Error: failed to get plan 'missing'\n" || response.Command == "" {
+		t.Errorf("direct command failure should be reported like the CLI, got %+v", response)
+	}
+
+	// Declined arguments and unregistered commands run in a process
+	if response = run("archive", "plan", "--all"); response.ReturnValue == 0 {
+		t.Errorf("declined direct command should run in a process, got %+v", response)
+	}
+	if response = run("unarchive", "plan", "--name", "p1"); response.ReturnValue == 0 {
+		t.Errorf("unregistered command should run in a process, got %+v", response)
+	}
+}
@@ -0,0 +1,76 @@
+package util
+
+import (
+	"errors"
+	"fmt"
+	"strings"
+)
+
+// DefaultMaxOutputBytes is the default largest stdout a command may produce.
+const DefaultMaxOutputBytes = 32 * 1024 * 1024
+
+// maxOutputBytes is the largest stdout kept for a command (0 = unlimited).
+var maxOutputBytes = DefaultMaxOutputBytes
+
+// SetMaxOutputBytes sets the largest stdout a command may produce. A command
+// producing more is stopped and fails with a message asking to narrow the
+// query, so one unbounded listing cannot pin hundreds of MB in the server.
+// A value <= 0 removes the limit.
+func SetMaxOutputBytes(n int) {
+	if n < 0 {
+		n = 0
+	}
+	maxOutputBytes = n
+}
+
+// GetMaxOutputBytes returns the largest stdout a command may produce (0 = unlimited).
+func GetMaxOutputBytes() int {
+	return maxOutputBytes
+}
+
+// errOutputTooLarge is returned by limitBuffer writes beyond its limit.
+var errOutputTooLarge = errors.New("command output too large")
+
+// outputTooLargeMessage is the error reported for a command whose stdout
+// exceeded max bytes.
+func outputTooLargeMessage(max int) string {
+	return fmt.Sprintf("output exceeded %d bytes and was discarded; narrow the command "+
+		"(namespace, name or query filter) or raise --max-output-bytes", max)
+}
+
+// limitBuffer is an outputBuffer that accepts at most max bytes. The write
+// that would exceed the limit fails and calls onExceed, which stops the
+// command, so the output is never buffered beyond the limit.
+type limitBuffer struct {
+	outputBuffer
+	max      int
+	n        int
+	exceeded bool
+	onExceed func()
+}
+
+// newLimitBuffer wraps buf so it accepts at most max bytes.
+func newLimitBuffer(buf outputBuffer, max int, onExceed func()) *limitBuffer {
+	return &limitBuffer{outputBuffer: buf, max: max, onExceed: onExceed}
+}
+
+// Write appends p, or fails once the output would exceed the limit.
+func (l *limitBuffer) Write(p []byte) (int, error) {
+	if l.exceeded || l.n+len(p) > l.max {
+		if !l.exceeded {
+			l.exceeded = true
+			l.onExceed()
+		}
+		return 0, errOutputTooLarge
+	}
+	l.n += len(p)
+	return l.outputBuffer.Write(p)
+}
+
+// appendLine appends line to text, on a new line when text is not empty.
+func appendLine(text, line string) string {
+	if text != "" && !strings.HasSuffix(text, "\n") {
+		text += "\n"
+	}
+	return text + line
+}
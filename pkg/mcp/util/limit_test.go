@@ -0,0 +1,49 @@
+package util
+
+import (
+	"context"
+	"os/exec"
+	"strings"
+	"testing"
+)
+
+func TestLimitBuffer(t *testing.T) {
+	stops := 0
+	l := newLimitBuffer(&strings.Builder{}, 8, func() { stops++ })
+
+	if n, err := l.Write([]byte("12345")); n != 5 || err != nil {
+		t.Fatalf("Write() within the limit = %d, %v", n, err)
+	}
+	if _, err := l.Write([]byte("6789")); err != errOutputTooLarge {
+		t.Fatalf("Write() beyond the limit error = %v, want errOutputTooLarge", err)
+	}
+	if _, err := l.Write([]byte("0")); err != errOutputTooLarge {
+		t.Fatalf("Write() after the limit was exceeded error = %v", err)
+	}
+	if !l.exceeded || stops != 1 {
+		t.Errorf("exceeded = %v, onExceed calls = %d, want true and 1", l.exceeded, stops)
+	}
+	if got := l.String(); got != "12345" {
+		t.Errorf("String() = %q, want only the output within the limit", got)
+	}
+}
+
+func TestRunProcess_StopsOversizedOutput(t *testing.T) {
+	yesBin, err := exec.LookPath("yes")
+	if err != nil {
+		t.Skip("yes binary not available")
+	}
+	origExe := selfExePath
+	selfExePath = yesBin // prints its arguments forever
+	defer func() { selfExePath = origExe }()
+	defer SetMaxOutputBytes(DefaultMaxOutputBytes)
+	SetMaxOutputBytes(64 * 1024)
+
+	stdout, stderr, rc, err := runProcess(context.Background(), []string{"get", "plan"}, 0)
+	if err != nil {
+		t.Fatalf("runProcess() error = %v", err)
+	}
+	if rc == 0 || stdout != "" || !strings.Contains(stderr, "output exceeded 65536 bytes") {
+		t.Errorf("runProcess() = stdout %d bytes, stderr %q, rc %d; want a failed command asking to narrow it", len(stdout), stderr, rc)
+	}
+}
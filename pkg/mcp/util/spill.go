@@ -0,0 +1,165 @@
+package util
+
+import (
+	"fmt"
+	"os"
+	"path/filepath"
+	"sort"
+	"time"
+	"unicode/utf8"
+
+	"k8s.io/klog/v2"
+)
+
+// DefaultSpillThreshold is the output size (bytes) above which output is
+// written to a file when a spill directory is configured.
+const DefaultSpillThreshold = 32 * 1024
+
+// spillPreviewBytes is how much of a spilled output is kept inline as a preview.
+const spillPreviewBytes = 2048
+
+// DefaultSpillMaxAge is how long a spilled output file is kept by default.
+const DefaultSpillMaxAge = time.Hour
+
+// spillMaxFiles is the largest number of spilled output files kept; the
+// oldest are removed first, so a burst of large outputs cannot fill the disk
+// before they expire.
+const spillMaxFiles = 100
+
+// spillFilePattern matches the files spillOutput creates. Only these are
+// pruned, so other files in the spill directory are left alone.
+const spillFilePattern = "kubectl-mtv-output-*"
+
+// spillDir is the directory large outputs are written to.
+// Empty disables spilling (default).
+var spillDir string
+
+// spillThreshold is the output size above which output is spilled.
+var spillThreshold = DefaultSpillThreshold
+
+// spillMaxAge is how long a spilled output file is kept.
+var spillMaxAge = DefaultSpillMaxAge
+
+// SetSpillDir sets the directory large outputs are written to, and removes
+// spilled files left there that are past retention (see SetSpillMaxAge).
+// An empty string disables spilling.
+func SetSpillDir(dir string) {
+	spillDir = dir
+	if dir != "" {
+		pruneSpillDir(dir, spillMaxFiles, time.Now())
+	}
+}
+
+// GetSpillDir returns the configured spill directory.
+func GetSpillDir() string {
+	return spillDir
+}
+
+// SetSpillThreshold sets the output size in bytes above which output is spilled.
+// Values < 1 restore the default.
+func SetSpillThreshold(n int) {
+	if n < 1 {
+		n = DefaultSpillThreshold
+	}
+	spillThreshold = n
+}
+
+// GetSpillThreshold returns the configured spill threshold.
+func GetSpillThreshold() int {
+	return spillThreshold
+}
+
+// SetSpillMaxAge sets how long a spilled output file is kept. Older files are
+// removed when the spill directory is set and before each new file is written.
+// Values <= 0 restore the default.
+func SetSpillMaxAge(age time.Duration) {
+	if age <= 0 {
+		age = DefaultSpillMaxAge
+	}
+	spillMaxAge = age
+}
+
+// GetSpillMaxAge returns how long a spilled output file is kept.
+func GetSpillMaxAge() time.Duration {
+	return spillMaxAge
+}
+
+// pruneSpillDir removes the spilled output files in dir older than
+// spillMaxAge, then the oldest of the rest until at most keep remain.
+// Files already removed by a concurrent prune are ignored.
+func pruneSpillDir(dir string, keep int, now time.Time) {
+	paths, err := filepath.Glob(filepath.Join(dir, spillFilePattern))
+	if err != nil {
+		return
+	}
+
+	type spillFile struct {
+		path    string
+		modTime time.Time
+	}
+	var files []spillFile
+	for _, path := range paths {
+		info, err := os.Lstat(path)
+		if err != nil || !info.Mode().IsRegular() {
+			continue
+		}
+		if now.Sub(info.ModTime()) > spillMaxAge {
+			_ = os.Remove(path)
+			continue
+		}
+		files = append(files, spillFile{path: path, modTime: info.ModTime()})
+	}
+
+	if len(files) <= keep {
+		return
+	}
+	sort.Slice(files, func(i, j int) bool {
+		return files[i].modTime.Before(files[j].modTime)
+	})
+	for _, f := range files[:len(files)-keep] {
+		_ = os.Remove(f.path)
+	}
+}
+
+// shouldSpill reports whether an output of size bytes is written to a file.
+func shouldSpill(size int) bool {
+	return spillDir != "" && size > spillThreshold
+}
+
+// spillOutput writes a large output to a new file with extension ext (".txt"
+// or ".json") in the spill directory and returns a short preview that points
+// to it. The second return value is false (and output is returned unchanged)
+// when spilling is disabled, the output is small, or the file could not be
+// written.
+func spillOutput(output, ext string) (string, bool) {
+	if !shouldSpill(len(output)) {
+		return output, false
+	}
+
+	// Make room for the new file within the retention limits
+	pruneSpillDir(spillDir, spillMaxFiles-1, time.Now())
+
+	f, err := os.CreateTemp(spillDir, spillFilePattern+ext)
+	if err != nil {
+		klog.Warningf("[spill] failed to create output file: %v", err)
+		return output, false
+	}
+	_, err = f.WriteString(output)
+	if closeErr := f.Close(); err == nil {
+		err = closeErr
+	}
+	if err != nil {
+		klog.Warningf("[spill] failed to write output file: %v", err)
+		_ = os.Remove(f.Name())
+		return output, false
+	}
+
+	// Cut the preview on a rune boundary. The threshold may be below the
+	// preview size, so the output can be shorter than the preview.
+	cut := min(spillPreviewBytes, len(output))
+	for cut > 0 && cut < len(output) && !utf8.RuneStart(output[cut]) {
+		cut--
+	}
+	return fmt.Sprintf("%s\n\n[output is %d bytes; the first %d are shown above. Full output saved to %s]",
+		output[:cut], len(output), cut, f.Name()), true
+}
@@ -0,0 +1,188 @@
+package util
+
+import (
+	"os"
+	"path/filepath"
+	"strings"
+	"testing"
+	"time"
+	"unicode/utf8"
+)
+
+func TestSpillOutput(t *testing.T) {
+	origDir, origThreshold := spillDir, spillThreshold
+	defer func() { spillDir, spillThreshold = origDir, origThreshold }()
+
+	dir := t.TempDir()
+	SetSpillDir(dir)
+	SetSpillThreshold(4096)
+
+	small := strings.Repeat("a", 100)
+	if got, spilled := spillOutput(small, ".txt"); spilled || got != small {
+		t.Errorf("small output should not be spilled")
+	}
+
+	large := strings.Repeat("line of output\n", 1000)
+	got, spilled := spillOutput(large, ".txt")
+	if !spilled {
+		t.Fatal("large output should be spilled")
+	}
+	if len(got) >= len(large) {
+		t.Errorf("preview should be shorter than output, got %d bytes", len(got))
+	}
+	if !strings.HasPrefix(got, large[:spillPreviewBytes]) {
+		t.Error("preview should start with the beginning of the output")
+	}
+
+	files, err := filepath.Glob(filepath.Join(dir, "kubectl-mtv-output-*.txt"))
+	if err != nil || len(files) != 1 {
+		t.Fatalf("expected 1 spill file, got %v (err %v)", files, err)
+	}
+	if !strings.Contains(got, files[0]) {
+		t.Errorf("preview should reference %s", files[0])
+	}
+	content, err := os.ReadFile(files[0])
+	if err != nil {
+		t.Fatalf("failed to read spill file: %v", err)
+	}
+	if string(content) != large {
+		t.Error("spill file should contain the full output")
+	}
+}
+
+func TestSpillOutput_Disabled(t *testing.T) {
+	origDir := spillDir
+	defer func() { spillDir = origDir }()
+
+	SetSpillDir("")
+	large := strings.Repeat("x", DefaultSpillThreshold+1)
+	if got, spilled := spillOutput(large, ".txt"); spilled || got != large {
+		t.Error("output should not be spilled when no spill directory is set")
+	}
+}
+
+func TestSpillOutput_PreviewOnRuneBoundary(t *testing.T) {
+	origDir, origThreshold := spillDir, spillThreshold
+	defer func() { spillDir, spillThreshold = origDir, origThreshold }()
+
+	SetSpillDir(t.TempDir())
+	SetSpillThreshold(1)
+
+	// "é" is two bytes; an odd offset puts byte spillPreviewBytes mid-rune
+	got, spilled := spillOutput("x"+strings.Repeat("é", spillPreviewBytes), ".txt")
+	if !spilled {
+		t.Fatal("output should be spilled")
+	}
+	preview := got[:strings.Index(got, "\n\n[output is")]
+	if !strings.HasPrefix(preview, "x") || !utf8.ValidString(preview) || len(preview) > spillPreviewBytes {
+		t.Errorf("preview not cut on a rune boundary: %d bytes", len(preview))
+	}
+}
+
+func TestRawResponseData_SpillsLargeJSON(t *testing.T) {
+	origDir, origThreshold := spillDir, spillThreshold
+	defer func() { spillDir, spillThreshold = origDir, origThreshold }()
+
+	dir := t.TempDir()
+	SetSpillDir(dir)
+	SetSpillThreshold(4096)
+
+	stdout := "[" + strings.Repeat(`{"name":"vm"},`, 1000) + `{"name":"last"}]`
+	data := RawResponseData(CommandResponse{Stdout: stdout})
+	if _, ok := data["data"]; ok {
+		t.Fatal("large JSON output should be moved out of the response")
+	}
+	output, _ := data["output"].(string)
+
+	files, err := filepath.Glob(filepath.Join(dir, "kubectl-mtv-output-*.json"))
+	if err != nil || len(files) != 1 {
+		t.Fatalf("expected 1 spill file, got %v (err %v)", files, err)
+	}
+	if !strings.Contains(output, files[0]) {
+		t.Errorf("preview should reference %s, got %q", files[0], output)
+	}
+	if content, _ := os.ReadFile(files[0]); string(content) != stdout {
+		t.Error("spill file should contain the full JSON output")
+	}
+
+	// With a threshold below the preview size, the preview is not spilled again
+	SetSpillThreshold(100)
+	data = RawResponseData(CommandResponse{Stdout: stdout})
+	files, _ = filepath.Glob(filepath.Join(dir, "kubectl-mtv-output-*"))
+	if len(files) != 2 {
+		t.Errorf("expected one more spill file, got %v", files)
+	}
+	if output, _ := data["output"].(string); !strings.Contains(output, ".json]") {
+		t.Errorf("preview should point at the JSON file, got %q", output[len(output)-80:])
+	}
+
+	// Small JSON output stays inline
+	if data := RawResponseData(CommandResponse{Stdout: `[{"name":"vm"}]`}); data["data"] == nil {
+		t.Error("small JSON output should stay in data")
+	}
+}
+
+func TestSpillOutput_ShorterThanPreview(t *testing.T) {
+	origDir, origThreshold := spillDir, spillThreshold
+	defer func() { spillDir, spillThreshold = origDir, origThreshold }()
+
+	SetSpillDir(t.TempDir())
+	SetSpillThreshold(100)
+
+	output := strings.Repeat("é", 750) // 1500 bytes, below spillPreviewBytes
+	got, spilled := spillOutput(output, ".txt")
+	if !spilled {
+		t.Fatal("output above the threshold should be spilled")
+	}
+	if !strings.HasPrefix(got, output+"\n\n[output is 1500 bytes; the first 1500 are shown above") {
+		t.Errorf("preview should hold the whole output, got %q", got[len(got)-120:])
+	}
+}
+
+func TestPruneSpillDir(t *testing.T) {
+	dir := t.TempDir()
+	now := time.Now()
+	write := func(name string, age time.Duration) string {
+		t.Helper()
+		path := filepath.Join(dir, name)
+		if err := os.WriteFile(path, []byte("output"), 0o600); err != nil {
+			t.Fatal(err)
+		}
+		if err := os.Chtimes(path, now.Add(-age), now.Add(-age)); err != nil {
+			t.Fatal(err)
+		}
+		return path
+	}
+
+	expired := write("kubectl-mtv-output-1.txt", 2*DefaultSpillMaxAge)
+	oldest := write("kubectl-mtv-output-2.txt", 3*time.Minute)
+	newer := write("kubectl-mtv-output-3.json", 2*time.Minute)
+	newest := write("kubectl-mtv-output-4.txt", time.Minute)
+	other := write("notes.txt", 2*DefaultSpillMaxAge)
+
+	pruneSpillDir(dir, 2, now)
+
+	for _, path := range []string{expired, oldest} {
+		if _, err := os.Stat(path); !os.IsNotExist(err) {
+			t.Errorf("%s should have been removed", filepath.Base(path))
+		}
+	}
+	for _, path := range []string{newer, newest, other} {
+		if _, err := os.Stat(path); err != nil {
+			t.Errorf("%s should have been kept: %v", filepath.Base(path), err)
+		}
+	}
+}
+
+func TestSetSpillMaxAge(t *testing.T) {
+	defer SetSpillMaxAge(DefaultSpillMaxAge)
+
+	SetSpillMaxAge(10 * time.Minute)
+	if got := GetSpillMaxAge(); got != 10*time.Minute {
+		t.Errorf("GetSpillMaxAge() = %v, want 10m", got)
+	}
+	SetSpillMaxAge(0)
+	if got := GetSpillMaxAge(); got != DefaultSpillMaxAge {
+		t.Errorf("SetSpillMaxAge(0) should restore the default, got %v", got)
+	}
+}
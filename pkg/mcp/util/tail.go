@@ -0,0 +1,32 @@
+package util
+
+import (
+	"context"
+	"io"
+)
+
+// outputTailKey is the context key for the stdout tail size of a command
+const outputTailKey contextKey = "output_tail"
+
+// WithOutputTail limits the stdout kept for a command to its last maxBytes
+// bytes. It is meant for commands whose useful output is a short confirmation
+// at the end (start, archive, cutover ...), so memory stays bounded no matter
+// how much progress output they print. A value <= 0 keeps the full output.
+func WithOutputTail(ctx context.Context, maxBytes int) context.Context {
+	return context.WithValue(ctx, outputTailKey, maxBytes)
+}
+
+// GetOutputTail retrieves the stdout tail size from the context (0 = unlimited).
+func GetOutputTail(ctx context.Context) int {
+	if ctx == nil {
+		return 0
+	}
+	n, _ := ctx.Value(outputTailKey).(int)
+	return n
+}
+
+// outputBuffer collects the output of a command.
+type outputBuffer interface {
+	io.Writer
+	String() string
+}
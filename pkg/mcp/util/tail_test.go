@@ -0,0 +1,15 @@
+package util
+
+import (
+	"context"
+	"testing"
+)
+
+func TestWithOutputTail(t *testing.T) {
+	if got := GetOutputTail(context.Background()); got != 0 {
+		t.Errorf("GetOutputTail() = %d, want 0 by default", got)
+	}
+	if got := GetOutputTail(WithOutputTail(context.Background(), 8192)); got != 8192 {
+		t.Errorf("GetOutputTail() = %d, want 8192", got)
+	}
+}
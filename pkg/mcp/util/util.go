@@ -4,15 +4,18 @@ import (
 	"bytes"
 	"context"
 	"encoding/json"
+	"errors"
 	"fmt"
 	"net/http"
 	"os"
 	"os/exec"
 	"regexp"
+	"strconv"
 	"strings"
 	"time"
 
 	shellquote "github.com/kballard/go-shellquote"
+	"github.com/yaacov/kubectl-mtv/pkg/mcp/worker"
 	"k8s.io/klog/v2"
 )
 
@@ -216,133 +219,347 @@ func GetDefaultVerbosity() int {
 
 // CommandResponse represents the structured response from command execution
 type CommandResponse struct {
+	// Command is the sanitized command line. It is only set in show-CLI mode
+	// and when the command fails.
 	Command     string `json:"command"`
 	ReturnValue int    `json:"return_value"`
 	Stdout      string `json:"stdout"`
 	Stderr      string `json:"stderr"`
 }
 
+// commandTimeout bounds the runtime of a single kubectl-mtv subprocess.
+const commandTimeout = 120 * time.Second
+
+// commandWaitDelay is how long to wait for the subprocess output pipes to close
+// after the process has exited or been killed.
+const commandWaitDelay = 5 * time.Second
+
 // selfExePath caches the path to the currently running executable.
 // This ensures the MCP server always calls its own binary rather than
 // whatever "kubectl-mtv" happens to be on PATH (which may be an older version).
-var selfExePath = func() string {
+var selfExePath, selfExeErr = func() (string, error) {
 	exe, err := os.Executable()
+	if err == nil {
+		return exe, nil
+	}
+	// Fall back to kubectl-mtv on PATH, looked up once here rather than by
+	// exec.Command on every call
+	path, err := exec.LookPath("kubectl-mtv")
 	if err != nil {
-		return "kubectl-mtv" // fallback to PATH lookup
+		return "kubectl-mtv", fmt.Errorf("kubectl-mtv executable not found: %w", err)
 	}
-	return exe
+	return path, nil
 }()
 
-// RunKubectlMTVCommand executes a kubectl-mtv command and returns structured JSON
-// It accepts a context which may contain a Kubernetes token and/or server URL for authentication.
-// If a token is present in the context, it will be passed via the --token flag.
-// If a server URL is present in the context, it will be passed via the --server flag.
-// If neither is present, it falls back to CLI default values, then to the default kubeconfig behavior.
-// Precedence: context (HTTP headers) > CLI defaults > kubeconfig (implicit).
-// If show-CLI mode is enabled in the context, it returns a teaching response instead of executing.
-func RunKubectlMTVCommand(ctx context.Context, args []string) (string, error) {
-	// Always disable ANSI color codes -- MCP consumers are LLMs, not terminals
-	args = append([]string{"--no-color"}, args...)
-
-	// Propagate verbosity level so subprocesses produce the same debug output
-	if defaultVerbosity > 0 {
-		args = append([]string{"--verbose", fmt.Sprintf("%d", defaultVerbosity)}, args...)
-	}
-
-	// Prepend --insecure-skip-tls-verify when configured (before server/token)
-	if defaultInsecureSkipTLS {
-		args = append([]string{"--insecure-skip-tls-verify"}, args...)
-	}
+// SelfExePath returns the path of the running kubectl-mtv executable,
+// resolved once at startup.
+func SelfExePath() string {
+	return selfExePath
+}
 
-	// Prepend --certificate-authority when a custom CA cert path is configured
-	if defaultKubeCACert != "" {
-		klog.V(2).Infof("[auth] using --certificate-authority from CLI flag: %s", defaultKubeCACert)
-		args = append([]string{"--certificate-authority", defaultKubeCACert}, args...)
-	}
+// KubeCredentials holds the Kubernetes connection settings for one command.
+// Empty fields mean the kubeconfig value is used.
+type KubeCredentials struct {
+	Server          string
+	Token           string
+	CACert          string
+	InsecureSkipTLS bool
+}
 
+// ResolveKubeCredentials returns the Kubernetes connection settings for a request.
+// Precedence for server and token: context (HTTP headers) > CLI defaults > kubeconfig (implicit).
+func ResolveKubeCredentials(ctx context.Context) KubeCredentials {
 	// Check context first (HTTP headers), then fall back to CLI defaults for --server flag
-	// Server flag is prepended first so it appears before --token in the final command
-	if server, ok := GetKubeServer(ctx); ok && server != "" {
+	server, ok := GetKubeServer(ctx)
+	if ok && server != "" {
 		klog.V(2).Infof("[auth] using --server from HTTP header: %s", server)
-		args = append([]string{"--server", server}, args...)
 	} else if defaultKubeServer != "" {
 		klog.V(2).Infof("[auth] using --server from CLI flag: %s", defaultKubeServer)
-		args = append([]string{"--server", defaultKubeServer}, args...)
+		server = defaultKubeServer
 	} else {
 		klog.V(2).Info("[auth] no explicit --server; falling back to kubeconfig")
+		server = ""
 	}
 
 	// Check context first (HTTP headers), then fall back to CLI defaults for --token flag
-	if token, ok := GetKubeToken(ctx); ok && token != "" {
+	token, ok := GetKubeToken(ctx)
+	if ok && token != "" {
 		klog.V(2).Info("[auth] using --token from HTTP header")
-		args = append([]string{"--token", token}, args...)
 	} else if defaultKubeToken != "" {
 		klog.V(2).Info("[auth] using --token from CLI flag")
-		args = append([]string{"--token", defaultKubeToken}, args...)
+		token = defaultKubeToken
 	} else {
 		klog.V(2).Info("[auth] no explicit --token; falling back to kubeconfig")
+		token = ""
+	}
+
+	if defaultKubeCACert != "" {
+		klog.V(2).Infof("[auth] using --certificate-authority from CLI flag: %s", defaultKubeCACert)
+	}
+
+	return KubeCredentials{
+		Server:          server,
+		Token:           token,
+		CACert:          defaultKubeCACert,
+		InsecureSkipTLS: defaultInsecureSkipTLS,
+	}
+}
+
+// buildCommandArgs returns the full argument vector for a kubectl-mtv invocation:
+// authentication flags first, then the global flags, then the command args.
+// Precedence for --server/--token: context (HTTP headers) > CLI defaults > kubeconfig (implicit).
+// The slice is allocated once at its final size rather than prepending each
+// global flag in turn, which copied the whole argument list for every flag.
+func buildCommandArgs(ctx context.Context, args []string) []string {
+	creds := ResolveKubeCredentials(ctx)
+
+	// Size the slice for the worst case: token, server, CA (2 each),
+	// insecure (1), verbose (2), --no-color and --compact-json (1 each).
+	fullArgs := make([]string, 0, len(args)+11)
+
+	// Token and server come first so they appear before the global flags
+	if creds.Token != "" {
+		fullArgs = append(fullArgs, "--token", creds.Token)
+	}
+	if creds.Server != "" {
+		fullArgs = append(fullArgs, "--server", creds.Server)
 	}
+	if creds.CACert != "" {
+		fullArgs = append(fullArgs, "--certificate-authority", creds.CACert)
+	}
+	if creds.InsecureSkipTLS {
+		fullArgs = append(fullArgs, "--insecure-skip-tls-verify")
+	}
+
+	// Propagate verbosity level so subprocesses produce the same debug output
+	if defaultVerbosity > 0 {
+		fullArgs = append(fullArgs, "--verbose", strconv.Itoa(defaultVerbosity))
+	}
+
+	// Always disable ANSI color codes and JSON indentation -- MCP consumers
+	// are LLMs, not terminals
+	fullArgs = append(fullArgs, "--no-color", "--compact-json")
+
+	return append(fullArgs, args...)
+}
+
+// RunKubectlMTVCommand executes a kubectl-mtv command and returns structured JSON
+// It accepts a context which may contain a Kubernetes token and/or server URL for authentication.
+// If a token is present in the context, it will be passed via the --token flag.
+// If a server URL is present in the context, it will be passed via the --server flag.
+// If neither is present, it falls back to CLI default values, then to the default kubeconfig behavior.
+// Precedence: context (HTTP headers) > CLI defaults > kubeconfig (implicit).
+// If show-CLI mode is enabled in the context, it returns a teaching response instead of executing.
+func RunKubectlMTVCommand(ctx context.Context, args []string) (string, error) {
+	response, err := RunCommand(ctx, args)
+	if err != nil {
+		return "", err
+	}
+	return marshalCommandResponse(response)
+}
+
+// RunCommand executes a kubectl-mtv command like RunKubectlMTVCommand, but
+// returns the response as a struct. Tools use it with ResponseData, so the
+// response is not encoded to JSON only to be decoded again.
+func RunCommand(ctx context.Context, args []string) (CommandResponse, error) {
+	cmdArgs := args
+	args = buildCommandArgs(ctx, args)
 
 	// Check if we're in show-CLI mode
 	if GetShowCLI(ctx) {
 		// In show-CLI mode, just return the command that would be executed
 		cmdStr := formatShellCommand("kubectl-mtv", args)
-		response := CommandResponse{
+		return CommandResponse{
 			Command:     cmdStr,
 			ReturnValue: 0,
 			Stdout:      cmdStr,
 			Stderr:      "",
+		}, nil
+	}
+
+	// Serve repeated identical commands from the response cache when enabled
+	cacheTTL := GetCacheTTL(ctx)
+	var key string
+	if cacheTTL > 0 {
+		key = cacheKey(args)
+		if cached, ok := commandCache.get(key, time.Now()); ok {
+			klog.V(2).Info("[cache] serving cached response")
+			return cached, nil
 		}
+	}
 
-		jsonData, err := json.MarshalIndent(response, "", "  ")
-		if err != nil {
-			return "", fmt.Errorf("failed to marshal response: %w", err)
+	// Note the cache generation before running: if a write clears the cache
+	// while this command runs, its response may predate the write, so it is
+	// not cached, and later calls do not join it
+	gen := commandCache.currentGeneration()
+
+	// Identical read commands running at the same time share one execution
+	var response CommandResponse
+	var err error
+	if GetCoalescing(ctx) {
+		if key == "" {
+			key = cacheKey(args)
 		}
+		inflightKey := key + "@" + strconv.FormatUint(gen, 10)
+		response, err = inflightCommands.do(ctx, inflightKey, func() (CommandResponse, error) {
+			return executeCommand(ctx, cmdArgs, args)
+		})
+	} else {
+		response, err = executeCommand(ctx, cmdArgs, args)
+	}
+	if err != nil {
+		return CommandResponse{}, err
+	}
 
-		return string(jsonData), nil
+	// A state-changing command makes every cached response potentially stale
+	if GetCacheInvalidation(ctx) {
+		commandCache.clear()
+	}
+	if cacheTTL > 0 && response.ReturnValue == 0 {
+		commandCache.putIfGeneration(gen, key, response, time.Now().Add(cacheTTL))
 	}
 
+	return response, nil
+}
+
+// executeCommand runs a kubectl-mtv command (args, with the global flags
+// added; cmdArgs without them) in-process, in the worker or in a new process.
+func executeCommand(ctx context.Context, cmdArgs, args []string) (CommandResponse, error) {
 	// Resolve environment variable references for sensitive flags (e.g., $VCENTER_PASSWORD)
 	// This is done after show-CLI check so show-CLI shows $VAR syntax, not resolved values
 	resolvedArgs, err := ResolveEnvVars(args)
 	if err != nil {
-		return "", fmt.Errorf("failed to resolve environment variables: %w", err)
+		return CommandResponse{}, fmt.Errorf("failed to resolve environment variables: %w", err)
 	}
 
-	cmd := exec.Command(selfExePath, resolvedArgs...)
-
-	var stdout, stderr bytes.Buffer
-	cmd.Stdout = &stdout
-	cmd.Stderr = &stderr
-
-	// Set timeout of 120 seconds
-	timer := time.AfterFunc(120*time.Second, func() {
-		_ = cmd.Process.Kill()
-	})
-	defer timer.Stop()
+	if ctx == nil {
+		ctx = context.Background()
+	}
 
-	err = cmd.Run()
+	// Commands with an in-process implementation skip kubectl-mtv entirely.
+	// Otherwise prefer the persistent worker, and fall back to a one-shot
+	// process when it is disabled, busy or could not be reached. Only the
+	// in-process and one-shot process runs take a subprocess slot.
+	stdout, stderr, rc, err := "", "", 0, errNotDirect
+	if lookupDirectCommand(cmdArgs) != nil {
+		stdout, stderr, rc, err = runWithSlot(ctx, func(runCtx context.Context) (string, string, int, error) {
+			return runDirect(runCtx, cmdArgs)
+		})
+	}
+	if errors.Is(err, errNotDirect) {
+		tail := GetOutputTail(ctx)
+		// The worker queue limits its own callers, so a queued call holds no
+		// subprocess slot, and its timeout starts once the worker runs it
+		stdout, stderr, rc, err = runInWorker(worker.WithRunTimeout(ctx, commandTimeout), resolvedArgs, tail)
+		if errors.Is(err, worker.ErrUnavailable) {
+			if persistentWorker != nil {
+				klog.V(2).Infof("[worker] %v; running command in a new process", err)
+			}
+			stdout, stderr, rc, err = runWithSlot(ctx, func(runCtx context.Context) (string, string, int, error) {
+				return runProcess(runCtx, resolvedArgs, tail)
+			})
+		}
+	}
 
 	response := CommandResponse{
-		Command: formatShellCommand("kubectl-mtv", args),
-		Stdout:  stdout.String(),
-		Stderr:  stderr.String(),
+		ReturnValue: rc,
+		Stdout:      stdout,
+		Stderr:      stderr,
 	}
 
 	if err != nil {
-		if exitErr, ok := err.(*exec.ExitError); ok {
-			response.ReturnValue = exitErr.ExitCode()
-		} else {
-			response.ReturnValue = -1
-			if response.Stderr == "" {
-				response.Stderr = err.Error()
-			}
+		response.ReturnValue = -1
+		// The command was stopped because the request was canceled or it timed out
+		msg := ""
+		if ctxErr := ctx.Err(); ctxErr != nil {
+			msg = "command canceled: " + ctxErr.Error()
+		} else if errors.Is(err, context.DeadlineExceeded) {
+			msg = fmt.Sprintf("command timed out after %s", commandTimeout)
 		}
-	} else {
-		response.ReturnValue = 0
+		if msg != "" {
+			response.Stderr = appendLine(response.Stderr, msg)
+		} else if response.Stderr == "" {
+			response.Stderr = err.Error()
+		}
+	}
+
+	// The command echo is only useful for diagnosing failures (tools strip it
+	// from responses), so the sanitized, shell-quoted form is only built then
+	if response.ReturnValue != 0 {
+		response.Command = formatShellCommand("kubectl-mtv", args)
 	}
 
-	jsonData, err := json.MarshalIndent(response, "", "  ")
+	return response, nil
+}
+
+// runWithSlot runs fn once a subprocess slot is free, with commandTimeout
+// counted from then: the wait for a slot is not counted against the timeout.
+// When fn fails after the timeout or cancellation, the context's error is
+// returned in place of fn's (e.g. "signal: killed").
+func runWithSlot(ctx context.Context, fn func(context.Context) (string, string, int, error)) (stdout, stderr string, rc int, err error) {
+	release, err := acquireCommandSlot(ctx)
+	if err != nil {
+		return "", "command canceled while waiting to run: " + err.Error(), -1, nil
+	}
+	defer release()
+
+	// Tie the subprocess to the request context and a fixed timeout, so a
+	// cancelled MCP request (client disconnect, HTTP timeout) also kills
+	// the kubectl-mtv process instead of leaving it running to completion.
+	runCtx, cancel := context.WithTimeout(ctx, commandTimeout)
+	defer cancel()
+
+	stdout, stderr, rc, err = fn(runCtx)
+	if err != nil && runCtx.Err() != nil {
+		err = runCtx.Err()
+	}
+	return stdout, stderr, rc, err
+}
+
+// runProcess runs kubectl-mtv as a one-shot subprocess.
+// When tail > 0 only the last tail bytes of stdout are kept in memory.
+// A non-zero exit code is returned as rc with a nil error; err is set only
+// when the process could not be started or was killed.
+func runProcess(ctx context.Context, args []string, tail int) (stdout, stderr string, rc int, err error) {
+	// Without an executable every call would fail the same way; skip the exec
+	if selfExeErr != nil {
+		return "", "", 0, selfExeErr
+	}
+
+	procCtx, stop := context.WithCancel(ctx)
+	defer stop()
+	cmd := exec.CommandContext(procCtx, selfExePath, args...)
+	// Don't wait forever for output pipes held open by orphaned grandchildren
+	cmd.WaitDelay = commandWaitDelay
+
+	// strings.Builder hands its bytes to String() without a copy, so large
+	// listings are not duplicated on their way into the response
+	var outBuf outputBuffer = &strings.Builder{}
+	var limited *limitBuffer
+	if tail > 0 {
+		outBuf = worker.NewTailBuffer(tail)
+	} else if max := GetMaxOutputBytes(); max > 0 {
+		// Stop the process as soon as its output passes the limit
+		limited = newLimitBuffer(outBuf, max, stop)
+		outBuf = limited
+	}
+	var errBuf bytes.Buffer
+	cmd.Stdout = outBuf
+	cmd.Stderr = &errBuf
+
+	err = cmd.Run()
+	if limited != nil && limited.exceeded && ctx.Err() == nil {
+		return "", appendLine(errBuf.String(), outputTooLargeMessage(limited.max)), 1, nil
+	}
+	if exitErr, ok := err.(*exec.ExitError); ok && ctx.Err() == nil {
+		return outBuf.String(), errBuf.String(), exitErr.ExitCode(), nil
+	}
+	return outBuf.String(), errBuf.String(), 0, err
+}
+
+// marshalCommandResponse encodes a CommandResponse as the JSON string returned to tools.
+func marshalCommandResponse(response CommandResponse) (string, error) {
+	jsonData, err := json.Marshal(response)
 	if err != nil {
 		return "", fmt.Errorf("failed to marshal response: %w", err)
 	}
@@ -430,8 +647,8 @@ func ResolveEnvVars(args []string) ([]string, error) {
 // which handles arguments directly without shell interpretation.
 func formatShellCommand(cmd string, args []string) string {
 
-	// Build the display command with sanitization
-	sanitizedArgs := []string{}
+	// Build the display command with sanitization; one output token per argument
+	sanitizedArgs := make([]string, 0, len(args))
 	sanitizeNext := false
 
 	for _, arg := range args {
@@ -443,6 +660,9 @@ func formatShellCommand(cmd string, args []string) string {
 			// This is a sensitive flag, add it and mark next arg for sanitization
 			sanitizedArgs = append(sanitizedArgs, arg)
 			sanitizeNext = true
+		} else if name, _, found := strings.Cut(arg, "="); found && sensitiveFlags[name] {
+			// A sensitive flag given as --flag=value
+			sanitizedArgs = append(sanitizedArgs, name+"=****")
 		} else {
 			// Normal argument
 			sanitizedArgs = append(sanitizedArgs, arg)
@@ -465,6 +685,9 @@ func formatShellCommand(cmd string, args []string) string {
 //   - The "command" field (full CLI command string) is stripped to prevent models
 //     from mimicking CLI syntax instead of using structured MCP tool calls.
 //   - Empty "stderr" is removed to reduce noise.
+//   - A large "output" field, or large JSON output kept undecoded by
+//     RawResponseData, is saved to a file in the spill directory (if
+//     configured), leaving a short preview and the file path inline.
 //   - The "output" field is truncated to maxResponseChars (if configured) to keep
 //     responses within manageable context window sizes.
 //
@@ -474,27 +697,46 @@ func UnmarshalJSONResponse(responseJSON string) (map[string]interface{}, error)
 	if err := json.Unmarshal([]byte(responseJSON), &cmdResponse); err != nil {
 		return nil, fmt.Errorf("failed to unmarshal JSON response: %w", err)
 	}
+	return processResponse(cmdResponse, parseJSONOutput), nil
+}
+
+// ResponseData converts a command response into the native object returned by
+// tools, with the same processing as UnmarshalJSONResponse.
+func ResponseData(response CommandResponse) map[string]interface{} {
+	return processResponse(responseMap(response), parseJSONOutput)
+}
+
+// RawResponseData is like ResponseData, but JSON output is kept in "data" as a
+// json.RawMessage instead of being decoded. It is for callers that only encode
+// the result again: the output is validated and spliced into the encoded
+// response, skipping a full decode and re-encode of large listings.
+func RawResponseData(response CommandResponse) map[string]interface{} {
+	return processResponse(responseMap(response), rawJSONOutput)
+}
+
+// responseMap returns the fields of a command response as a map.
+func responseMap(response CommandResponse) map[string]interface{} {
+	return map[string]interface{}{
+		"command":      response.Command,
+		"return_value": float64(response.ReturnValue),
+		"stdout":       response.Stdout,
+		"stderr":       response.Stderr,
+	}
+}
 
+// processResponse moves stdout into "data" when parse accepts it as JSON, or
+// renames it to "output", then cleans up the response (see UnmarshalJSONResponse).
+func processResponse(cmdResponse map[string]interface{}, parse func(string) (interface{}, bool)) map[string]interface{} {
 	// Try to parse stdout as JSON
 	if stdout, ok := cmdResponse["stdout"].(string); ok && stdout != "" {
 		stdout = strings.TrimSpace(stdout)
 
-		// Try parsing as JSON object
-		var jsonObj map[string]interface{}
-		if err := json.Unmarshal([]byte(stdout), &jsonObj); err == nil && jsonObj != nil {
-			delete(cmdResponse, "stdout")
-			cmdResponse["data"] = jsonObj
-			cleanupResponse(cmdResponse)
-			return cmdResponse, nil
-		}
-
-		// Try parsing as JSON array
-		var jsonArr []interface{}
-		if err := json.Unmarshal([]byte(stdout), &jsonArr); err == nil && jsonArr != nil {
+		// Parse JSON objects and arrays in a single pass
+		if data, ok := parse(stdout); ok {
 			delete(cmdResponse, "stdout")
-			cmdResponse["data"] = jsonArr
+			cmdResponse["data"] = data
 			cleanupResponse(cmdResponse)
-			return cmdResponse, nil
+			return cmdResponse
 		}
 
 		// Not JSON - rename to "output" for clarity (plain text)
@@ -503,13 +745,48 @@ func UnmarshalJSONResponse(responseJSON string) (map[string]interface{}, error)
 	}
 
 	cleanupResponse(cmdResponse)
-	return cmdResponse, nil
+	return cmdResponse
+}
+
+// parseJSONOutput decodes command output that is a JSON object or array.
+// The first byte decides whether the output can be JSON at all, so plain
+// text is never handed to the decoder and JSON is decoded exactly once.
+func parseJSONOutput(stdout string) (interface{}, bool) {
+	if stdout == "" || (stdout[0] != '{' && stdout[0] != '[') {
+		return nil, false
+	}
+
+	var data interface{}
+	if err := json.Unmarshal([]byte(stdout), &data); err != nil {
+		return nil, false
+	}
+	switch data.(type) {
+	case map[string]interface{}, []interface{}:
+		return data, true
+	}
+	return nil, false
+}
+
+// rawJSONOutput returns command output that is a JSON object or array as a
+// json.RawMessage, after validating it, without decoding it.
+func rawJSONOutput(stdout string) (interface{}, bool) {
+	if stdout == "" || (stdout[0] != '{' && stdout[0] != '[') {
+		return nil, false
+	}
+
+	raw := json.RawMessage(stdout)
+	if !json.Valid(raw) {
+		return nil, false
+	}
+	return raw, true
 }
 
 // cleanupResponse removes noise from tool responses to help small LLMs stay on track.
 //   - Strips the "command" field (full CLI echo like "kubectl-mtv get plan --namespace demo")
 //     which causes small models to mimic CLI syntax instead of using structured tool calls.
 //   - Removes empty "stderr" to reduce noise.
+//   - Saves a large "output" field, or large undecoded JSON output, to a file
+//     if a spill directory is configured.
 //   - Truncates the "output" field if maxResponseChars is configured.
 func cleanupResponse(data map[string]interface{}) {
 	// Strip CLI command echo — this is the #1 cause of small LLMs generating
@@ -521,6 +798,23 @@ func cleanupResponse(data map[string]interface{}) {
 		delete(data, "stderr")
 	}
 
+	// Move large JSON output that is passed through undecoded to a file; the
+	// response then holds a text preview and the file path instead
+	spilled := false
+	if raw, ok := data["data"].(json.RawMessage); ok && shouldSpill(len(raw)) {
+		var preview string
+		if preview, spilled = spillOutput(string(raw), ".json"); spilled {
+			delete(data, "data")
+			data["output"] = preview
+		}
+	}
+
+	// Move large text output to a file, keeping a preview inline. A preview
+	// of spilled JSON output is not spilled again.
+	if output, ok := data["output"].(string); ok && !spilled {
+		data["output"], _ = spillOutput(output, ".txt")
+	}
+
 	// Truncate long text output if configured
 	if maxResponseChars > 0 {
 		if output, ok := data["output"].(string); ok && len(output) > maxResponseChars {
@@ -2,8 +2,12 @@ package util
 
 import (
 	"context"
+	"encoding/json"
+	"errors"
 	"net/http"
 	"os"
+	"os/exec"
+	"reflect"
 	"strings"
 	"testing"
 )
@@ -213,6 +217,16 @@ func TestUnmarshalJSONResponse(t *testing.T) {
 			input:      `{"command":"test","return_value":0,"stdout":"NAME    STATUS\nplan1   Ready","stderr":""}`,
 			wantOutput: true,
 		},
+		{
+			name:       "stdout starts like JSON but is text",
+			input:      `{"command":"test","return_value":0,"stdout":"[warning] plan1 not ready","stderr":""}`,
+			wantOutput: true,
+		},
+		{
+			name:       "stdout is a JSON scalar",
+			input:      `{"command":"test","return_value":0,"stdout":"42","stderr":""}`,
+			wantOutput: true,
+		},
 		{
 			name:  "empty stdout",
 			input: `{"command":"test","return_value":0,"stdout":"","stderr":""}`,
@@ -278,6 +292,66 @@ func TestUnmarshalJSONResponse(t *testing.T) {
 	}
 }
 
+func TestResponseData_MatchesUnmarshalJSONResponse(t *testing.T) {
+	responses := []CommandResponse{
+		{ReturnValue: 0, Stdout: `[{"name":"plan1"}]`},
+		{ReturnValue: 0, Stdout: "Plan 'p1' archived\n"},
+		{Command: "kubectl-mtv get plan", ReturnValue: 1, Stderr: "Error: not found\n"},
+		{ReturnValue: 0},
+	}
+
+	for _, response := range responses {
+		encoded, err := json.Marshal(response)
+		if err != nil {
+			t.Fatalf("failed to marshal response: %v", err)
+		}
+		want, err := UnmarshalJSONResponse(string(encoded))
+		if err != nil {
+			t.Fatalf("UnmarshalJSONResponse() error = %v", err)
+		}
+
+		got := ResponseData(response)
+		gotJSON, _ := json.Marshal(got)
+		wantJSON, _ := json.Marshal(want)
+		if string(gotJSON) != string(wantJSON) {
+			t.Errorf("ResponseData(%+v) = %s, want %s", response, gotJSON, wantJSON)
+		}
+	}
+}
+
+func TestRawResponseData_EncodesLikeResponseData(t *testing.T) {
+	responses := []CommandResponse{
+		{ReturnValue: 0, Stdout: "[\n  {\n    \"name\": \"plan1\",\n    \"id\": 2\n  }\n]\n"},
+		{ReturnValue: 0, Stdout: `{"b":1,"a":{"c":[true,null]}}`},
+		{ReturnValue: 0, Stdout: `{"truncated":`},
+		{ReturnValue: 0, Stdout: "Plan 'p1' archived\n"},
+		{Command: "kubectl-mtv get plan", ReturnValue: 1, Stderr: "Error: not found\n"},
+	}
+
+	for _, response := range responses {
+		raw, err := json.Marshal(RawResponseData(response))
+		if err != nil {
+			t.Fatalf("failed to marshal raw response data: %v", err)
+		}
+		// The raw form keeps the command's key order, so compare decoded values
+		var got, want interface{}
+		wantJSON, _ := json.Marshal(ResponseData(response))
+		if err := json.Unmarshal(raw, &got); err != nil {
+			t.Fatalf("raw response data is not valid JSON: %v", err)
+		}
+		if err := json.Unmarshal(wantJSON, &want); err != nil {
+			t.Fatalf("response data is not valid JSON: %v", err)
+		}
+		if !reflect.DeepEqual(got, want) {
+			t.Errorf("RawResponseData(%+v) = %s, want %s", response, raw, wantJSON)
+		}
+	}
+
+	if _, ok := RawResponseData(responses[0])["data"].(json.RawMessage); !ok {
+		t.Error("JSON output should be kept as json.RawMessage")
+	}
+}
+
 // TestUnmarshalJSONResponse_ResponseTruncation verifies that long output is truncated
 // when maxResponseChars is configured.
 func TestUnmarshalJSONResponse_ResponseTruncation(t *testing.T) {
@@ -352,6 +426,19 @@ func TestFormatShellCommand(t *testing.T) {
 			wantContain: "--offload-vsphere-password",
 			wantMissing: "pass123",
 		},
+		{
+			name:        "password given as flag=value is sanitized",
+			cmd:         "kubectl-mtv",
+			args:        []string{"create", "provider", "--password=s3cret", "--url", "https://vcenter"},
+			wantContain: "--password=****",
+			wantMissing: "s3cret",
+		},
+		{
+			name:        "value with spaces is quoted",
+			cmd:         "kubectl-mtv",
+			args:        []string{"get", "plan", "--name", "my plan"},
+			wantContain: "--name 'my plan'",
+		},
 	}
 
 	for _, tt := range tests {
@@ -733,3 +820,117 @@ func TestOutputFormat(t *testing.T) {
 		t.Errorf("SetOutputFormat(\"invalid-format\") should default to \"markdown\", got %q", got)
 	}
 }
+
+func TestBuildCommandArgs(t *testing.T) {
+	origServer := GetDefaultKubeServer()
+	origToken := GetDefaultKubeToken()
+	origCACert := GetDefaultKubeCACert()
+	origInsecure := GetDefaultInsecureSkipTLS()
+	origVerbosity := GetDefaultVerbosity()
+	defer func() {
+		SetDefaultKubeServer(origServer)
+		SetDefaultKubeToken(origToken)
+		SetDefaultKubeCACert(origCACert)
+		SetDefaultInsecureSkipTLS(origInsecure)
+		SetDefaultVerbosity(origVerbosity)
+	}()
+
+	SetDefaultKubeServer("https://cli-default.example.com:6443")
+	SetDefaultKubeToken("cli-default-token")
+	SetDefaultKubeCACert("/tmp/ca.crt")
+	SetDefaultInsecureSkipTLS(true)
+	SetDefaultVerbosity(3)
+
+	got := buildCommandArgs(context.Background(), []string{"get", "plan"})
+	want := []string{
+		"--token", "cli-default-token",
+		"--server", "https://cli-default.example.com:6443",
+		"--certificate-authority", "/tmp/ca.crt",
+		"--insecure-skip-tls-verify",
+		"--verbose", "3",
+		"--no-color", "--compact-json",
+		"get", "plan",
+	}
+	if strings.Join(got, " ") != strings.Join(want, " ") {
+		t.Errorf("buildCommandArgs() = %v, want %v", got, want)
+	}
+
+	// No defaults: only --no-color and --compact-json are prepended
+	SetDefaultKubeServer("")
+	SetDefaultKubeToken("")
+	SetDefaultKubeCACert("")
+	SetDefaultInsecureSkipTLS(false)
+	SetDefaultVerbosity(0)
+
+	got = buildCommandArgs(context.Background(), []string{"get", "plan"})
+	if strings.Join(got, " ") != "--no-color --compact-json get plan" {
+		t.Errorf("buildCommandArgs() without defaults = %v, want [--no-color --compact-json get plan]", got)
+	}
+}
+
+func TestRunKubectlMTVCommand_CanceledContext(t *testing.T) {
+	ctx, cancel := context.WithCancel(context.Background())
+	cancel()
+
+	result, err := RunKubectlMTVCommand(ctx, []string{"get", "plan"})
+	if err != nil {
+		t.Fatalf("unexpected error: %v", err)
+	}
+
+	var response CommandResponse
+	if err := json.Unmarshal([]byte(result), &response); err != nil {
+		t.Fatalf("failed to parse response: %v", err)
+	}
+	if response.ReturnValue != -1 {
+		t.Errorf("ReturnValue = %d, want -1 for a canceled context", response.ReturnValue)
+	}
+	if !strings.Contains(response.Stderr, "canceled") {
+		t.Errorf("expected cancellation message in stderr, got: %q", response.Stderr)
+	}
+}
+
+func TestRunKubectlMTVCommand_CommandEchoOnlyOnFailure(t *testing.T) {
+	trueBin, errTrue := exec.LookPath("true")
+	falseBin, errFalse := exec.LookPath("false")
+	if errTrue != nil || errFalse != nil {
+		t.Skip("true/false binaries not available")
+	}
+	origExe := selfExePath
+	defer func() { selfExePath = origExe }()
+
+	run := func(exe string) CommandResponse {
+		t.Helper()
+		selfExePath = exe
+		result, err := RunKubectlMTVCommand(context.Background(), []string{"get", "plan"})
+		if err != nil {
+			t.Fatalf("unexpected error: %v", err)
+		}
+		var response CommandResponse
+		if err := json.Unmarshal([]byte(result), &response); err != nil {
+			t.Fatalf("failed to parse response: %v", err)
+		}
+		return response
+	}
+
+	if response := run(trueBin); response.ReturnValue != 0 || response.Command != "" {
+		t.Errorf("successful command should have no command echo, got %+v", response)
+	}
+	if response := run(falseBin); response.ReturnValue == 0 || !strings.Contains(response.Command, "kubectl-mtv") {
+		t.Errorf("failed command should echo the command line, got %+v", response)
+	}
+}
+
+func TestRunKubectlMTVCommand_MissingExecutable(t *testing.T) {
+	origExe, origErr := selfExePath, selfExeErr
+	defer func() { selfExePath, selfExeErr = origExe, origErr }()
+	selfExePath = "true" // would succeed if it were executed
+	selfExeErr = errors.New("kubectl-mtv executable not found")
+
+	response, err := RunCommand(context.Background(), []string{"get", "plan"})
+	if err != nil {
+		t.Fatalf("unexpected error: %v", err)
+	}
+	if response.ReturnValue != -1 || !strings.Contains(response.Stderr, "executable not found") {
+		t.Errorf("a missing executable should fail without running a command, got %+v", response)
+	}
+}
@@ -0,0 +1,38 @@
+package util
+
+import (
+	"context"
+	"sync"
+	"time"
+
+	"k8s.io/klog/v2"
+)
+
+// Warmup runs "kubectl-mtv version" once so the first tool call does not pay
+// for loading the binary, reading the kubeconfig and resolving the API server.
+// version also looks up the MTV operator and the inventory route, which the
+// persistent worker keeps cached for later calls. With a worker pool, one
+// version runs per worker at the same time, so each worker is started and
+// warmed rather than only the first. Failures are only logged; the server
+// runs commands normally either way.
+// It blocks until the commands complete, so callers run it in a goroutine.
+func Warmup(ctx context.Context) {
+	start := time.Now()
+	runs := GetPersistentWorker()
+	if runs < 1 {
+		runs = 1
+	}
+
+	var wg sync.WaitGroup
+	for i := 0; i < runs; i++ {
+		wg.Add(1)
+		go func() {
+			defer wg.Done()
+			if _, err := RunCommand(ctx, []string{"version"}); err != nil {
+				klog.V(2).Infof("[warmup] failed: %v", err)
+			}
+		}()
+	}
+	wg.Wait()
+	klog.V(2).Infof("[warmup] done in %s", time.Since(start))
+}
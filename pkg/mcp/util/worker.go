@@ -0,0 +1,67 @@
+package util
+
+import (
+	"context"
+	"fmt"
+
+	"github.com/yaacov/kubectl-mtv/pkg/mcp/worker"
+)
+
+// DefaultWorkerPoolSize is the default number of persistent worker processes.
+const DefaultWorkerPoolSize = 1
+
+// persistentWorker runs commands in long-lived "kubectl-mtv mcp-worker"
+// child processes when enabled; nil means every command gets its own process.
+var persistentWorker *worker.Pool
+
+// SetPersistentWorker enables the persistent worker with the given number of
+// worker processes, or disables it when workers < 1 or the kubectl-mtv
+// executable was not found.
+// Workers are started lazily, each on the first command it runs.
+func SetPersistentWorker(workers int) {
+	if persistentWorker != nil {
+		_ = persistentWorker.Close()
+		persistentWorker = nil
+	}
+	// Without an executable there is nothing to start the workers from
+	if workers > 0 && selfExeErr == nil {
+		persistentWorker = worker.NewPool(selfExePath, workers)
+	}
+}
+
+// GetPersistentWorker returns the number of persistent worker processes
+// (0 when the persistent worker is disabled).
+func GetPersistentWorker() int {
+	if persistentWorker == nil {
+		return 0
+	}
+	return persistentWorker.Size()
+}
+
+// runInWorker runs a command in the persistent worker. Like runProcess, when
+// tail > 0 the worker keeps only the last tail bytes of stdout; otherwise it
+// keeps at most GetMaxOutputBytes bytes, and a larger output fails the command.
+// It returns an error wrapping worker.ErrUnavailable when the worker is
+// disabled, busy or could not be reached; the command has not run in that case.
+func runInWorker(ctx context.Context, args []string, tail int) (stdout, stderr string, rc int, err error) {
+	if persistentWorker == nil {
+		return "", "", 0, fmt.Errorf("%w: disabled", worker.ErrUnavailable)
+	}
+
+	maxOutput := 0
+	if tail > 0 {
+		ctx = worker.WithOutputTail(ctx, tail)
+	} else {
+		maxOutput = GetMaxOutputBytes()
+		ctx = worker.WithMaxOutputBytes(ctx, maxOutput)
+	}
+
+	resp, err := persistentWorker.Run(ctx, args)
+	if err != nil {
+		return "", "", 0, err
+	}
+	if resp.OutputTooLarge {
+		return "", appendLine(resp.Stderr, outputTooLargeMessage(maxOutput)), 1, nil
+	}
+	return resp.Stdout, resp.Stderr, resp.ReturnValue, nil
+}
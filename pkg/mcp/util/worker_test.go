@@ -0,0 +1,97 @@
+package util
+
+import (
+	"context"
+	"fmt"
+	"os"
+	"strings"
+	"testing"
+	"time"
+
+	"github.com/yaacov/kubectl-mtv/pkg/mcp/worker"
+)
+
+// TestMain lets the test binary act as a persistent worker process.
+func TestMain(m *testing.M) {
+	if os.Getenv("MTV_UTIL_WORKER_HELPER") == "1" {
+		err := worker.Serve(os.Stdin, os.Stdout, func(args []string) int {
+			fmt.Fprint(os.Stdout, strings.Join(args, " "))
+			return 0
+		})
+		if err != nil {
+			os.Exit(1)
+		}
+		os.Exit(0)
+	}
+	os.Exit(m.Run())
+}
+
+// useTestWorker runs commands in a worker started from the test binary.
+func useTestWorker(t *testing.T) {
+	t.Helper()
+	t.Setenv("MTV_UTIL_WORKER_HELPER", "1")
+	orig := persistentWorker
+	persistentWorker = worker.NewPool(os.Args[0], 1)
+	t.Cleanup(func() {
+		_ = persistentWorker.Close()
+		persistentWorker = orig
+	})
+}
+
+func TestExecuteCommand_WorkerDoesNotWaitForSlot(t *testing.T) {
+	useTestWorker(t)
+
+	orig := GetMaxConcurrency()
+	defer SetMaxConcurrency(orig)
+	SetMaxConcurrency(1)
+
+	// Hold the only subprocess slot, as a long one-shot process would
+	release, err := acquireCommandSlot(context.Background())
+	if err != nil {
+		t.Fatalf("acquire failed: %v", err)
+	}
+	defer release()
+
+	ctx, cancel := context.WithTimeout(context.Background(), 10*time.Second)
+	defer cancel()
+	args := []string{"get", "plan"}
+	response, err := executeCommand(ctx, args, args)
+	if err != nil {
+		t.Fatalf("executeCommand() error = %v", err)
+	}
+	if response.ReturnValue != 0 || response.Stdout != "get plan" {
+		t.Errorf("worker call should complete while the slot is held, got %+v", response)
+	}
+}
+
+func TestExecuteCommand_WorkerStopsOversizedOutput(t *testing.T) {
+	useTestWorker(t)
+	defer SetMaxOutputBytes(DefaultMaxOutputBytes)
+	SetMaxOutputBytes(4)
+
+	ctx, cancel := context.WithTimeout(context.Background(), 10*time.Second)
+	defer cancel()
+	args := []string{"get", "plan"}
+	response, err := executeCommand(ctx, args, args)
+	if err != nil {
+		t.Fatalf("executeCommand() error = %v", err)
+	}
+	if response.ReturnValue != 1 || response.Stdout != "" || !strings.Contains(response.Stderr, "output exceeded 4 bytes") {
+		t.Errorf("worker output over the limit should fail the command, got %+v", response)
+	}
+}
+
+func TestExecuteCommand_WorkerKeepsOutputTail(t *testing.T) {
+	useTestWorker(t)
+
+	ctx, cancel := context.WithTimeout(context.Background(), 10*time.Second)
+	defer cancel()
+	args := []string{"get", "plan"}
+	response, err := executeCommand(WithOutputTail(ctx, 4), args, args)
+	if err != nil {
+		t.Fatalf("executeCommand() error = %v", err)
+	}
+	if response.Stdout != "[... 4 bytes of earlier output omitted]\nplan" {
+		t.Errorf("worker should send only the output tail, got %q", response.Stdout)
+	}
+}
@@ -0,0 +1,299 @@
+package worker
+
+import (
+	"context"
+	"encoding/json"
+	"errors"
+	"fmt"
+	"io"
+	"os"
+	"os/exec"
+	"sync"
+	"time"
+)
+
+// ErrUnavailable is returned (wrapped) when a command could not be delivered to
+// a worker. The command has not run, so the caller can safely fall back to
+// starting a one-shot process.
+var ErrUnavailable = errors.New("worker unavailable")
+
+// queueDepth is the number of calls a Client accepts at once: one running in
+// the worker plus the calls waiting for their turn. Waiting for a warm worker
+// is usually quicker than starting a new process, but a deep queue would
+// serialize a burst that separate processes could run in parallel.
+const queueDepth = 4
+
+// recycleAfter is the number of commands a worker process runs before it is
+// replaced by a fresh one on the next call. Commands share the process's
+// memory and package-level state, so recycling bounds what a long-running
+// server can accumulate while keeping process startup rare.
+var recycleAfter = 1000
+
+// Client sends commands to a persistent "kubectl-mtv mcp-worker" process.
+// The worker is started on first use and restarted after it exits.
+// It runs one command at a time; up to queueDepth calls queue for it, and a
+// call made while the queue is full gets ErrUnavailable, so bursts spill over
+// to one-shot processes.
+type Client struct {
+	path string
+
+	// queue admits up to queueDepth calls; turn is held by the call whose
+	// command is being sent to and run by the worker
+	queue chan struct{}
+	turn  chan struct{}
+
+	mu     sync.Mutex
+	proc   *exec.Cmd
+	stdin  io.WriteCloser
+	enc    *json.Encoder
+	dec    *json.Decoder
+	nextID uint64
+	// served counts responses received from the current process; a worker
+	// that exits before answering anything is treated as unavailable.
+	served int
+}
+
+// NewClient creates a client for the worker started from the given executable.
+func NewClient(path string) *Client {
+	return &Client{
+		path:  path,
+		queue: make(chan struct{}, queueDepth),
+		turn:  make(chan struct{}, 1),
+	}
+}
+
+// Run executes a command in the worker, waiting for the commands queued
+// before it. If ctx is done while the call waits, it leaves the queue without
+// having sent anything; if ctx is done while the command runs, the worker is
+// killed (it will be restarted on the next call). Either way ctx's error is
+// returned.
+func (c *Client) Run(ctx context.Context, args []string) (*Response, error) {
+	if !c.admit() {
+		return nil, fmt.Errorf("%w: busy", ErrUnavailable)
+	}
+	defer c.leave()
+	return c.run(ctx, args)
+}
+
+type runTimeoutKey struct{}
+
+// WithRunTimeout returns a context that limits how long a command may run in
+// the worker. Unlike a deadline on ctx itself, the limit starts when the
+// command reaches the worker, so time spent queued behind other calls is not
+// counted against it.
+func WithRunTimeout(ctx context.Context, d time.Duration) context.Context {
+	return context.WithValue(ctx, runTimeoutKey{}, d)
+}
+
+type maxOutputBytesKey struct{}
+
+// WithMaxOutputBytes returns a context that asks the worker to keep at most n
+// bytes of a command's stdout (see Request.MaxOutputBytes). A value <= 0
+// keeps the full output.
+func WithMaxOutputBytes(ctx context.Context, n int) context.Context {
+	return context.WithValue(ctx, maxOutputBytesKey{}, n)
+}
+
+type outputTailKey struct{}
+
+// WithOutputTail returns a context that asks the worker to keep only the last
+// n bytes of a command's stdout (see Request.OutputTail). A value <= 0 keeps
+// the full output.
+func WithOutputTail(ctx context.Context, n int) context.Context {
+	return context.WithValue(ctx, outputTailKey{}, n)
+}
+
+// admit takes a place in the queue, reporting false when the queue is full.
+// A successful admit must be followed by leave.
+func (c *Client) admit() bool {
+	select {
+	case c.queue <- struct{}{}:
+		return true
+	default:
+		return false
+	}
+}
+
+// leave gives back a place taken by admit.
+func (c *Client) leave() {
+	<-c.queue
+}
+
+// load returns the number of calls running in or queued for the worker.
+func (c *Client) load() int {
+	return len(c.queue)
+}
+
+// run executes a command for a call admitted to the queue (see Run).
+func (c *Client) run(ctx context.Context, args []string) (*Response, error) {
+	select {
+	case c.turn <- struct{}{}:
+		defer func() { <-c.turn }()
+	case <-ctx.Done():
+		return nil, ctx.Err()
+	}
+
+	if d, ok := ctx.Value(runTimeoutKey{}).(time.Duration); ok && d > 0 {
+		var cancel context.CancelFunc
+		ctx, cancel = context.WithTimeout(ctx, d)
+		defer cancel()
+	}
+
+	c.mu.Lock()
+	defer c.mu.Unlock()
+
+	if c.proc == nil {
+		if err := c.start(); err != nil {
+			return nil, fmt.Errorf("%w: %v", ErrUnavailable, err)
+		}
+	}
+
+	c.nextID++
+	req := Request{ID: c.nextID, Args: args}
+	if n, ok := ctx.Value(maxOutputBytesKey{}).(int); ok && n > 0 {
+		req.MaxOutputBytes = n
+	}
+	if n, ok := ctx.Value(outputTailKey{}).(int); ok && n > 0 {
+		req.OutputTail = n
+	}
+	if err := c.enc.Encode(&req); err != nil {
+		c.stop()
+		return nil, fmt.Errorf("%w: failed to send command: %v", ErrUnavailable, err)
+	}
+
+	type result struct {
+		resp Response
+		err  error
+	}
+	done := make(chan result, 1)
+	dec := c.dec
+	go func() {
+		var r result
+		r.err = dec.Decode(&r.resp)
+		done <- r
+	}()
+
+	select {
+	case r := <-done:
+		if r.err != nil {
+			firstRequest := c.served == 0
+			c.stop()
+			if firstRequest {
+				return nil, fmt.Errorf("%w: worker exited before answering: %v", ErrUnavailable, r.err)
+			}
+			return nil, fmt.Errorf("worker exited unexpectedly: %v", r.err)
+		}
+		if r.resp.ID != req.ID {
+			c.stop()
+			return nil, fmt.Errorf("worker returned response %d for request %d", r.resp.ID, req.ID)
+		}
+		c.served++
+		if c.served >= recycleAfter {
+			c.retire()
+		}
+		return &r.resp, nil
+	case <-ctx.Done():
+		c.stop()
+		return nil, ctx.Err()
+	}
+}
+
+// closeTimeout is how long Close waits for the worker to exit on its own
+// after its stdin is closed, before killing it.
+const closeTimeout = 2 * time.Second
+
+// Close stops the worker process, if running. The worker is asked to exit by
+// closing its stdin, so it can finish cleanly; it is killed if it has not
+// exited within closeTimeout. A command still running is waited for first.
+func (c *Client) Close() error {
+	c.mu.Lock()
+	defer c.mu.Unlock()
+
+	if c.proc == nil {
+		return nil
+	}
+
+	proc := c.proc
+	_ = c.stdin.Close()
+	exited := make(chan struct{})
+	go func() {
+		_ = proc.Wait()
+		close(exited)
+	}()
+
+	select {
+	case <-exited:
+	case <-time.After(closeTimeout):
+		_ = proc.Process.Kill()
+		<-exited
+	}
+	c.proc = nil
+	c.stdin = nil
+	c.enc = nil
+	c.dec = nil
+	return nil
+}
+
+// start launches the worker process. Must be called with c.mu held.
+func (c *Client) start() error {
+	proc := exec.Command(c.path, "mcp-worker")
+	proc.Stderr = os.Stderr
+
+	stdin, err := proc.StdinPipe()
+	if err != nil {
+		return err
+	}
+	stdout, err := proc.StdoutPipe()
+	if err != nil {
+		return err
+	}
+	if err := proc.Start(); err != nil {
+		return err
+	}
+
+	c.proc = proc
+	c.stdin = stdin
+	c.enc = json.NewEncoder(stdin)
+	c.dec = json.NewDecoder(stdout)
+	c.served = 0
+	return nil
+}
+
+// retire asks an idle worker process to exit by closing its stdin, and
+// detaches it so the next call starts a new one. The process is reaped in the
+// background. Must be called with c.mu held.
+func (c *Client) retire() {
+	proc := c.proc
+	_ = c.stdin.Close()
+	go func() {
+		exited := make(chan struct{})
+		go func() {
+			_ = proc.Wait()
+			close(exited)
+		}()
+		select {
+		case <-exited:
+		case <-time.After(closeTimeout):
+			_ = proc.Process.Kill()
+			<-exited
+		}
+	}()
+	c.proc = nil
+	c.stdin = nil
+	c.enc = nil
+	c.dec = nil
+}
+
+// stop kills the worker process and reaps it. Must be called with c.mu held.
+func (c *Client) stop() {
+	if c.proc == nil {
+		return
+	}
+	_ = c.stdin.Close()
+	_ = c.proc.Process.Kill()
+	_ = c.proc.Wait()
+	c.proc = nil
+	c.stdin = nil
+	c.enc = nil
+	c.dec = nil
+}
@@ -0,0 +1,228 @@
+package worker
+
+import (
+	"context"
+	"errors"
+	"fmt"
+	"os"
+	"strings"
+	"sync"
+	"testing"
+	"time"
+)
+
+// TestMain lets the test binary act as a worker process for Client tests.
+func TestMain(m *testing.M) {
+	if os.Getenv("MTV_WORKER_TEST_HELPER") == "1" {
+		err := Serve(os.Stdin, os.Stdout, func(args []string) int {
+			if len(args) > 0 && args[0] == "sleep" {
+				time.Sleep(time.Minute)
+			}
+			if len(args) > 0 && args[0] == "nap" {
+				time.Sleep(200 * time.Millisecond)
+			}
+			fmt.Fprint(os.Stdout, strings.Join(args, " "))
+			return 0
+		})
+		if err != nil {
+			os.Exit(1)
+		}
+		os.Exit(0)
+	}
+	os.Exit(m.Run())
+}
+
+func TestClient_Run(t *testing.T) {
+	t.Setenv("MTV_WORKER_TEST_HELPER", "1")
+	c := NewClient(os.Args[0])
+	defer c.Close()
+
+	for _, args := range [][]string{{"get", "plan"}, {"get", "provider"}} {
+		resp, err := c.Run(context.Background(), args)
+		if err != nil {
+			t.Fatalf("Run(%v) error = %v", args, err)
+		}
+		if want := strings.Join(args, " "); resp.Stdout != want || resp.ReturnValue != 0 {
+			t.Errorf("Run(%v) = %+v, want stdout %q", args, resp, want)
+		}
+	}
+}
+
+func TestClient_RunCanceled(t *testing.T) {
+	t.Setenv("MTV_WORKER_TEST_HELPER", "1")
+	c := NewClient(os.Args[0])
+	defer c.Close()
+
+	ctx, cancel := context.WithTimeout(context.Background(), 100*time.Millisecond)
+	defer cancel()
+	if _, err := c.Run(ctx, []string{"sleep"}); !errors.Is(err, context.DeadlineExceeded) {
+		t.Fatalf("Run() error = %v, want deadline exceeded", err)
+	}
+
+	// The killed worker is restarted on the next call
+	resp, err := c.Run(context.Background(), []string{"get", "plan"})
+	if err != nil {
+		t.Fatalf("Run() after cancel error = %v", err)
+	}
+	if resp.Stdout != "get plan" {
+		t.Errorf("Stdout = %q, want %q", resp.Stdout, "get plan")
+	}
+}
+
+func TestClient_QueuesConcurrentCalls(t *testing.T) {
+	t.Setenv("MTV_WORKER_TEST_HELPER", "1")
+	c := NewClient(os.Args[0])
+	defer c.Close()
+
+	// Start the worker so its startup time does not count
+	if _, err := c.Run(context.Background(), []string{"version"}); err != nil {
+		t.Fatalf("Run() error = %v", err)
+	}
+
+	errs := make([]error, queueDepth+1)
+	var wg sync.WaitGroup
+	for i := range errs {
+		wg.Add(1)
+		go func(i int) {
+			defer wg.Done()
+			var resp *Response
+			resp, errs[i] = c.Run(context.Background(), []string{"nap", fmt.Sprint(i)})
+			if errs[i] == nil && resp.Stdout != fmt.Sprintf("nap %d", i) {
+				t.Errorf("call %d got stdout %q", i, resp.Stdout)
+			}
+		}(i)
+	}
+	wg.Wait()
+
+	// Calls up to the queue depth wait for the worker; the one beyond it spills over
+	unavailable := 0
+	for i, err := range errs {
+		switch {
+		case errors.Is(err, ErrUnavailable):
+			unavailable++
+		case err != nil:
+			t.Errorf("call %d error = %v", i, err)
+		}
+	}
+	if unavailable != 1 {
+		t.Errorf("expected exactly 1 call rejected as busy, got %d", unavailable)
+	}
+}
+
+func TestClient_CanceledWhileQueued(t *testing.T) {
+	t.Setenv("MTV_WORKER_TEST_HELPER", "1")
+	c := NewClient(os.Args[0])
+	defer c.Close()
+
+	first := make(chan error, 1)
+	go func() {
+		_, err := c.Run(context.Background(), []string{"nap"})
+		first <- err
+	}()
+	waitRunning(c)
+
+	ctx, cancel := context.WithTimeout(context.Background(), 20*time.Millisecond)
+	defer cancel()
+	if _, err := c.Run(ctx, []string{"get", "plan"}); !errors.Is(err, context.DeadlineExceeded) {
+		t.Fatalf("queued Run() error = %v, want deadline exceeded", err)
+	}
+
+	// Leaving the queue does not disturb the running command
+	if err := <-first; err != nil {
+		t.Fatalf("running command error = %v", err)
+	}
+}
+
+func TestClient_RunTimeoutStartsWhenRunning(t *testing.T) {
+	t.Setenv("MTV_WORKER_TEST_HELPER", "1")
+	c := NewClient(os.Args[0])
+	defer c.Close()
+
+	first := make(chan error, 1)
+	go func() {
+		_, err := c.Run(context.Background(), []string{"nap"})
+		first <- err
+	}()
+	waitRunning(c)
+
+	// Queued behind the nap for longer than its timeout, but runs quickly once started
+	ctx := WithRunTimeout(context.Background(), 150*time.Millisecond)
+	resp, err := c.Run(ctx, []string{"get", "plan"})
+	if err != nil {
+		t.Fatalf("queued Run() error = %v, want success", err)
+	}
+	if resp.Stdout != "get plan" {
+		t.Errorf("queued Run() stdout = %q, want %q", resp.Stdout, "get plan")
+	}
+	if err := <-first; err != nil {
+		t.Fatalf("running command error = %v", err)
+	}
+
+	ctx = WithRunTimeout(context.Background(), 50*time.Millisecond)
+	if _, err := c.Run(ctx, []string{"sleep"}); !errors.Is(err, context.DeadlineExceeded) {
+		t.Fatalf("Run() error = %v, want deadline exceeded", err)
+	}
+}
+
+// waitRunning waits until a call holds the client's turn to run in the worker.
+func waitRunning(c *Client) {
+	deadline := time.Now().Add(time.Second)
+	for len(c.turn) == 0 && time.Now().Before(deadline) {
+		time.Sleep(time.Millisecond)
+	}
+}
+
+func TestClient_CloseLetsWorkerExit(t *testing.T) {
+	t.Setenv("MTV_WORKER_TEST_HELPER", "1")
+	c := NewClient(os.Args[0])
+
+	if _, err := c.Run(context.Background(), []string{"get", "plan"}); err != nil {
+		t.Fatalf("Run() error = %v", err)
+	}
+	proc := c.proc
+
+	if err := c.Close(); err != nil {
+		t.Fatalf("Close() error = %v", err)
+	}
+	if !proc.ProcessState.Success() {
+		t.Errorf("worker should exit cleanly when its stdin is closed, got %v", proc.ProcessState)
+	}
+
+	// Closing again is a no-op
+	if err := c.Close(); err != nil {
+		t.Fatalf("second Close() error = %v", err)
+	}
+}
+
+func TestClient_Unavailable(t *testing.T) {
+	c := NewClient("/nonexistent/kubectl-mtv")
+	defer c.Close()
+
+	if _, err := c.Run(context.Background(), []string{"get", "plan"}); !errors.Is(err, ErrUnavailable) {
+		t.Fatalf("Run() error = %v, want ErrUnavailable", err)
+	}
+}
+
+func TestClient_RecyclesWorker(t *testing.T) {
+	t.Setenv("MTV_WORKER_TEST_HELPER", "1")
+	defer func(n int) { recycleAfter = n }(recycleAfter)
+	recycleAfter = 2
+
+	c := NewClient(os.Args[0])
+	defer c.Close()
+
+	var procs []*os.Process
+	for i := 0; i < 3; i++ {
+		if _, err := c.Run(context.Background(), []string{"get", "plan"}); err != nil {
+			t.Fatalf("Run() error = %v", err)
+		}
+		if c.proc != nil {
+			procs = append(procs, c.proc.Process)
+		}
+	}
+
+	// The worker is retired after 2 commands; the third starts a new one
+	if len(procs) != 2 || procs[0].Pid == procs[1].Pid {
+		t.Errorf("expected the third command to run in a new worker, got processes %v", procs)
+	}
+}
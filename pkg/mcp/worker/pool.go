@@ -0,0 +1,66 @@
+package worker
+
+import (
+	"context"
+	"errors"
+	"fmt"
+	"sync"
+)
+
+// Pool spreads commands over several persistent workers, so concurrent tool
+// calls run in parallel warm processes instead of queueing for a single one.
+// Each worker is started on first use.
+type Pool struct {
+	// mu makes picking a worker and taking its queue place one step, so
+	// concurrent calls see each other's load
+	mu      sync.Mutex
+	clients []*Client
+}
+
+// NewPool creates a pool of size workers started from the given executable.
+// A size below 1 creates a single worker.
+func NewPool(path string, size int) *Pool {
+	if size < 1 {
+		size = 1
+	}
+	p := &Pool{clients: make([]*Client, size)}
+	for i := range p.clients {
+		p.clients[i] = NewClient(path)
+	}
+	return p
+}
+
+// Size returns the number of workers in the pool.
+func (p *Pool) Size() int {
+	return len(p.clients)
+}
+
+// Run executes a command in the least busy worker. Like Client.Run, it
+// returns an error wrapping ErrUnavailable when every worker's queue is full,
+// so the caller can fall back to a one-shot process.
+func (p *Pool) Run(ctx context.Context, args []string) (*Response, error) {
+	p.mu.Lock()
+	best := p.clients[0]
+	for _, c := range p.clients[1:] {
+		if c.load() < best.load() {
+			best = c
+		}
+	}
+	admitted := best.admit()
+	p.mu.Unlock()
+
+	if !admitted {
+		return nil, fmt.Errorf("%w: busy", ErrUnavailable)
+	}
+	defer best.leave()
+	return best.run(ctx, args)
+}
+
+// Close stops all workers.
+func (p *Pool) Close() error {
+	var errs []error
+	for _, c := range p.clients {
+		errs = append(errs, c.Close())
+	}
+	return errors.Join(errs...)
+}
@@ -0,0 +1,52 @@
+package worker
+
+import (
+	"context"
+	"fmt"
+	"os"
+	"sync"
+	"testing"
+)
+
+func TestPool_SpreadsConcurrentCalls(t *testing.T) {
+	t.Setenv("MTV_WORKER_TEST_HELPER", "1")
+	p := NewPool(os.Args[0], 2)
+	defer p.Close()
+
+	if p.Size() != 2 {
+		t.Fatalf("Size() = %d, want 2", p.Size())
+	}
+
+	errs := make([]error, 2)
+	var wg sync.WaitGroup
+	for i := range errs {
+		wg.Add(1)
+		go func(i int) {
+			defer wg.Done()
+			var resp *Response
+			resp, errs[i] = p.Run(context.Background(), []string{"nap", fmt.Sprint(i)})
+			if errs[i] == nil && resp.Stdout != fmt.Sprintf("nap %d", i) {
+				t.Errorf("call %d got stdout %q", i, resp.Stdout)
+			}
+		}(i)
+	}
+	wg.Wait()
+
+	for i, err := range errs {
+		if err != nil {
+			t.Errorf("call %d error = %v", i, err)
+		}
+	}
+	// Two concurrent calls go to two different workers
+	for i, c := range p.clients {
+		if c.proc == nil {
+			t.Errorf("worker %d was never started", i)
+		}
+	}
+}
+
+func TestNewPool_MinimumSize(t *testing.T) {
+	if p := NewPool("/nonexistent/kubectl-mtv", 0); p.Size() != 1 {
+		t.Errorf("NewPool(0).Size() = %d, want 1", p.Size())
+	}
+}
@@ -0,0 +1,43 @@
+// Package worker implements a persistent kubectl-mtv helper process for the MCP server.
+//
+// Instead of starting a new kubectl-mtv process for every tool call, the MCP
+// server can keep one "kubectl-mtv mcp-worker" child alive and send it command
+// lines over stdin. The worker runs each command in-process and writes the
+// captured output back over stdout. Messages are newline-delimited JSON.
+package worker
+
+// Request asks the worker to run one kubectl-mtv command line.
+type Request struct {
+	// ID correlates the response with the request
+	ID uint64 `json:"id"`
+
+	// Args are the command-line arguments, without the program name
+	Args []string `json:"args"`
+
+	// MaxOutputBytes is the largest stdout the worker keeps for the command
+	// (0 = unlimited); beyond it the output is discarded and OutputTooLarge set
+	MaxOutputBytes int `json:"max_output_bytes,omitempty"`
+
+	// OutputTail, when > 0, keeps only the last OutputTail bytes of stdout
+	// (see TailBuffer); it takes precedence over MaxOutputBytes
+	OutputTail int `json:"output_tail,omitempty"`
+}
+
+// Response carries the result of one command.
+type Response struct {
+	// ID is the ID of the request this response answers
+	ID uint64 `json:"id"`
+
+	// ReturnValue is the command's exit code
+	ReturnValue int `json:"return_value"`
+
+	// Stdout is everything the command wrote to standard output
+	Stdout string `json:"stdout"`
+
+	// Stderr is everything the command wrote to standard error
+	Stderr string `json:"stderr"`
+
+	// OutputTooLarge reports that stdout exceeded the request's MaxOutputBytes;
+	// Stdout is empty then
+	OutputTooLarge bool `json:"output_too_large,omitempty"`
+}
@@ -0,0 +1,137 @@
+package worker
+
+import (
+	"bytes"
+	"encoding/json"
+	"errors"
+	"fmt"
+	"io"
+	"os"
+	"runtime/debug"
+	"strings"
+	"sync"
+)
+
+// RunFunc executes one command line in-process and returns its exit code.
+// Output must go to os.Stdout and os.Stderr, which Serve redirects per command.
+type RunFunc func(args []string) int
+
+// Serve reads requests from in, runs them one at a time and writes a response
+// for each to out. It returns nil when in is closed.
+//
+// out must not be os.Stdout itself at the time a command runs, since Serve
+// swaps os.Stdout and os.Stderr to capture each command's output; callers pass
+// the original stdout file captured before serving starts.
+func Serve(in io.Reader, out io.Writer, run RunFunc) error {
+	dec := json.NewDecoder(in)
+	enc := json.NewEncoder(out)
+
+	for {
+		var req Request
+		if err := dec.Decode(&req); err != nil {
+			if errors.Is(err, io.EOF) {
+				return nil
+			}
+			return fmt.Errorf("failed to read request: %w", err)
+		}
+
+		stdout, stderr, rc, tooLarge := captureOutput(req.MaxOutputBytes, req.OutputTail, func() int {
+			return run(req.Args)
+		})
+
+		resp := Response{ID: req.ID, ReturnValue: rc, Stdout: stdout, Stderr: stderr, OutputTooLarge: tooLarge}
+		if err := enc.Encode(&resp); err != nil {
+			return fmt.Errorf("failed to write response: %w", err)
+		}
+	}
+}
+
+// captureOutput runs fn with os.Stdout and os.Stderr redirected to pipes and
+// returns what was written to them. When tail > 0 only the last tail bytes of
+// stdout are kept. Otherwise, when maxStdout > 0 and stdout grows past it,
+// stdout is dropped and tooLarge reported instead, so the worker never
+// buffers or sends more than the limit. A panic in fn is reported as exit
+// code 2 with the stack trace on stderr, so one bad command does not kill the worker.
+func captureOutput(maxStdout, tail int, fn func() int) (string, string, int, bool) {
+	origStdout, origStderr := os.Stdout, os.Stderr
+
+	outR, outW, err := os.Pipe()
+	if err != nil {
+		return "", fmt.Sprintf("failed to capture stdout: %v", err), 1, false
+	}
+	errR, errW, err := os.Pipe()
+	if err != nil {
+		outR.Close()
+		outW.Close()
+		return "", fmt.Sprintf("failed to capture stderr: %v", err), 1, false
+	}
+
+	var stdout interface {
+		io.Writer
+		String() string
+	}
+	limited := &limitBuffer{max: maxStdout}
+	stdout = limited
+	if tail > 0 {
+		stdout = NewTailBuffer(tail)
+	}
+	var stderr bytes.Buffer
+	var wg sync.WaitGroup
+	wg.Add(2)
+	go func() {
+		defer wg.Done()
+		_, _ = io.Copy(stdout, outR)
+	}()
+	go func() {
+		defer wg.Done()
+		_, _ = io.Copy(&stderr, errR)
+	}()
+
+	os.Stdout, os.Stderr = outW, errW
+	rc := func() (rc int) {
+		defer func() {
+			if r := recover(); r != nil {
+				fmt.Fprintf(os.Stderr, "panic: %v\n%s", r, debug.Stack())
+				rc = 2
+			}
+		}()
+		return fn()
+	}()
+	os.Stdout, os.Stderr = origStdout, origStderr
+
+	outW.Close()
+	errW.Close()
+	wg.Wait()
+	outR.Close()
+	errR.Close()
+
+	return stdout.String(), stderr.String(), rc, limited.exceeded
+}
+
+// limitBuffer collects stdout up to max bytes (0 = unlimited). Output beyond
+// the limit is drained and discarded rather than failing the write, since the
+// command runs in-process and cannot be stopped; a blocked pipe would hang it.
+type limitBuffer struct {
+	// buf is a strings.Builder so String() does not copy large listings
+	buf      strings.Builder
+	max      int
+	exceeded bool
+}
+
+// Write appends p, or drops all output once it would exceed the limit.
+func (l *limitBuffer) Write(p []byte) (int, error) {
+	if l.exceeded {
+		return len(p), nil
+	}
+	if l.max > 0 && l.buf.Len()+len(p) > l.max {
+		l.exceeded = true
+		l.buf = strings.Builder{}
+		return len(p), nil
+	}
+	return l.buf.Write(p)
+}
+
+// String returns the collected output, empty when the limit was exceeded.
+func (l *limitBuffer) String() string {
+	return l.buf.String()
+}
@@ -0,0 +1,129 @@
+package worker
+
+import (
+	"bytes"
+	"encoding/json"
+	"fmt"
+	"os"
+	"strings"
+	"testing"
+)
+
+func TestServe(t *testing.T) {
+	in := strings.NewReader(`{"id":1,"args":["get","plan"]}` + "\n" + `{"id":2,"args":["fail"]}` + "\n")
+	var out bytes.Buffer
+
+	err := Serve(in, &out, func(args []string) int {
+		if args[0] == "fail" {
+			fmt.Fprintln(os.Stderr, "Error: failed")
+			return 1
+		}
+		fmt.Fprintln(os.Stdout, strings.Join(args, " "))
+		return 0
+	})
+	if err != nil {
+		t.Fatalf("Serve() error = %v", err)
+	}
+
+	dec := json.NewDecoder(&out)
+	want := []Response{
+		{ID: 1, ReturnValue: 0, Stdout: "get plan\n"},
+		{ID: 2, ReturnValue: 1, Stderr: "Error: failed\n"},
+	}
+	for _, w := range want {
+		var got Response
+		if err := dec.Decode(&got); err != nil {
+			t.Fatalf("failed to decode response: %v", err)
+		}
+		if got != w {
+			t.Errorf("response = %+v, want %+v", got, w)
+		}
+	}
+}
+
+func TestServe_InvalidRequest(t *testing.T) {
+	var out bytes.Buffer
+	err := Serve(strings.NewReader("not json\n"), &out, func([]string) int { return 0 })
+	if err == nil {
+		t.Fatal("Serve() expected error for invalid request")
+	}
+}
+
+func TestCaptureOutput_RecoversPanic(t *testing.T) {
+	origStdout, origStderr := os.Stdout, os.Stderr
+
+	stdout, stderr, rc, _ := captureOutput(0, 0, func() int {
+		fmt.Fprint(os.Stdout, "partial")
+		panic("boom")
+	})
+
+	if rc != 2 {
+		t.Errorf("rc = %d, want 2", rc)
+	}
+	if stdout != "partial" {
+		t.Errorf("stdout = %q, want %q", stdout, "partial")
+	}
+	if !strings.Contains(stderr, "panic: boom") {
+		t.Errorf("stderr = %q, want panic message", stderr)
+	}
+	if os.Stdout != origStdout || os.Stderr != origStderr {
+		t.Error("captureOutput did not restore os.Stdout and os.Stderr")
+	}
+}
+
+func TestCaptureOutput_MaxStdout(t *testing.T) {
+	chunk := strings.Repeat("x", 1024)
+	stdout, stderr, rc, tooLarge := captureOutput(4096, 0, func() int {
+		for i := 0; i < 64; i++ {
+			fmt.Fprint(os.Stdout, chunk)
+		}
+		fmt.Fprint(os.Stderr, "done")
+		return 0
+	})
+
+	if !tooLarge || stdout != "" {
+		t.Errorf("captureOutput() = %d bytes, tooLarge %v; want no output and tooLarge", len(stdout), tooLarge)
+	}
+	if rc != 0 || stderr != "done" {
+		t.Errorf("rc = %d, stderr = %q; the command should still run to completion", rc, stderr)
+	}
+
+	stdout, _, _, tooLarge = captureOutput(4096, 0, func() int {
+		fmt.Fprint(os.Stdout, chunk)
+		return 0
+	})
+	if tooLarge || stdout != chunk {
+		t.Errorf("output within the limit should be kept, got %d bytes, tooLarge %v", len(stdout), tooLarge)
+	}
+}
+
+func TestCaptureOutput_Tail(t *testing.T) {
+	stdout, _, _, tooLarge := captureOutput(16, 64, func() int {
+		for i := 0; i < 1000; i++ {
+			fmt.Fprintln(os.Stdout, "progress line")
+		}
+		fmt.Fprintln(os.Stdout, "Plan 'p' started")
+		return 0
+	})
+
+	if tooLarge {
+		t.Error("a tailed output should not be reported as too large")
+	}
+	if !strings.HasSuffix(stdout, "Plan 'p' started\n") || !strings.HasPrefix(stdout, "[... ") {
+		t.Errorf("captureOutput() should keep only the tail, got %q", stdout)
+	}
+}
+
+func TestLimitBuffer(t *testing.T) {
+	l := &limitBuffer{max: 8}
+	if n, err := l.Write([]byte("12345")); n != 5 || err != nil {
+		t.Fatalf("Write() within the limit = %d, %v", n, err)
+	}
+	// Writes beyond the limit succeed, so the command's pipe keeps draining
+	if n, err := l.Write([]byte("6789")); n != 4 || err != nil {
+		t.Fatalf("Write() beyond the limit = %d, %v", n, err)
+	}
+	if !l.exceeded || l.String() != "" {
+		t.Errorf("exceeded = %v, String() = %q; want true and no output", l.exceeded, l.String())
+	}
+}
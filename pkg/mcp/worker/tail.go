@@ -0,0 +1,49 @@
+package worker
+
+import (
+	"bytes"
+	"fmt"
+)
+
+// TailBuffer is an io.Writer that keeps only the last max bytes written to it.
+type TailBuffer struct {
+	max     int
+	buf     []byte
+	dropped int
+}
+
+// NewTailBuffer creates a buffer keeping the last max bytes.
+func NewTailBuffer(max int) *TailBuffer {
+	return &TailBuffer{max: max, buf: make([]byte, 0, max)}
+}
+
+// Write appends p, discarding the oldest bytes beyond the limit.
+func (t *TailBuffer) Write(p []byte) (int, error) {
+	n := len(p)
+	if len(p) >= t.max {
+		t.dropped += len(t.buf) + len(p) - t.max
+		t.buf = append(t.buf[:0], p[len(p)-t.max:]...)
+		return n, nil
+	}
+	if over := len(t.buf) + len(p) - t.max; over > 0 {
+		t.dropped += over
+		t.buf = t.buf[:copy(t.buf, t.buf[over:])]
+	}
+	t.buf = append(t.buf, p...)
+	return n, nil
+}
+
+// String returns the kept output. When earlier output was dropped, the
+// partial first line is removed and a note with the omitted size is prepended.
+func (t *TailBuffer) String() string {
+	if t.dropped == 0 {
+		return string(t.buf)
+	}
+	kept := t.buf
+	omitted := t.dropped
+	if i := bytes.IndexByte(kept, '\n'); i >= 0 && i < len(kept)-1 {
+		omitted += i + 1
+		kept = kept[i+1:]
+	}
+	return fmt.Sprintf("[... %d bytes of earlier output omitted]\n%s", omitted, kept)
+}
@@ -0,0 +1,35 @@
+package worker
+
+import (
+	"strings"
+	"testing"
+)
+
+func TestTailBuffer(t *testing.T) {
+	tb := NewTailBuffer(16)
+	for _, chunk := range []string{"progress 1\n", "progress 2\n", "Plan 'p' started\n"} {
+		if n, err := tb.Write([]byte(chunk)); err != nil || n != len(chunk) {
+			t.Fatalf("Write(%q) = %d, %v", chunk, n, err)
+		}
+	}
+
+	got := tb.String()
+	if !strings.HasSuffix(got, "'p' started\n") {
+		t.Errorf("tail should end with the last output, got %q", got)
+	}
+	if !strings.HasPrefix(got, "[... ") || !strings.Contains(got, "bytes of earlier output omitted]") {
+		t.Errorf("tail should note omitted output, got %q", got)
+	}
+	if len(tb.buf) > 16 {
+		t.Errorf("buffer grew beyond its limit: %d bytes", len(tb.buf))
+	}
+}
+
+func TestTailBuffer_SmallOutputUnchanged(t *testing.T) {
+	tb := NewTailBuffer(64)
+	_, _ = tb.Write([]byte("Plan 'a' archived\n"))
+	_, _ = tb.Write([]byte("Plan 'b' archived\n"))
+	if got := tb.String(); got != "Plan 'a' archived\nPlan 'b' archived\n" {
+		t.Errorf("String() = %q", got)
+	}
+}
@@ -0,0 +1,98 @@
+package client
+
+import (
+	"crypto/sha256"
+	"encoding/hex"
+	"fmt"
+	"sync"
+	"time"
+
+	"k8s.io/cli-runtime/pkg/genericclioptions"
+	"k8s.io/client-go/dynamic"
+	"k8s.io/client-go/kubernetes"
+	"k8s.io/client-go/rest"
+)
+
+// ttlCache caches discovery results that rarely change (operator namespace,
+// inventory route) and API clients. Discovery takes several API round-trips, and long-lived
+// processes such as the MCP worker would otherwise repeat them for every command.
+type ttlCache[V any] struct {
+	ttl     time.Duration
+	entries sync.Map // key -> ttlCacheEntry[V]
+}
+
+type ttlCacheEntry[V any] struct {
+	value   V
+	expires time.Time
+}
+
+func (c *ttlCache[V]) get(key string) (V, bool) {
+	if v, ok := c.entries.Load(key); ok {
+		entry := v.(ttlCacheEntry[V])
+		if time.Now().Before(entry.expires) {
+			return entry.value, true
+		}
+		c.entries.Delete(key)
+	}
+	var zero V
+	return zero, false
+}
+
+func (c *ttlCache[V]) set(key string, value V) {
+	c.entries.Store(key, ttlCacheEntry[V]{value: value, expires: time.Now().Add(c.ttl)})
+}
+
+// ClusterCacheKey returns a cache key for the cluster and credentials
+// configFlags connect with (see restConfigKey), extended with parts. Results
+// discovered under one identity are never served to another, which may not be
+// allowed to see them. It returns "" (do not cache) when the client config
+// cannot be loaded or cannot be captured in a key.
+func ClusterCacheKey(configFlags *genericclioptions.ConfigFlags, parts ...string) string {
+	restConfig, err := configFlags.ToRESTConfig()
+	if err != nil {
+		return ""
+	}
+	key := restConfigKey(restConfig)
+	if key == "" {
+		return ""
+	}
+	for _, part := range parts {
+		key += "|" + part
+	}
+	return key
+}
+
+// clientTTL is how long API clients are reused. Clients are safe for
+// concurrent use; reusing them spares long-lived processes such as the MCP
+// worker building a clientset (one REST client per API group) for every command.
+const clientTTL = 5 * time.Minute
+
+var (
+	clientsets     = ttlCache[*kubernetes.Clientset]{ttl: clientTTL}
+	dynamicClients = ttlCache[dynamic.Interface]{ttl: clientTTL}
+)
+
+// restConfigKey returns a cache key identifying the cluster and credentials of
+// a REST config. It returns "" (do not cache) for configs whose behavior
+// cannot be captured in a key: custom transports, dialers or proxies, and
+// auth or exec plugins.
+func restConfigKey(config *rest.Config) string {
+	if config.Transport != nil || config.WrapTransport != nil || config.Dial != nil ||
+		config.Proxy != nil || config.AuthProvider != nil || config.ExecProvider != nil ||
+		config.TLSClientConfig.NextProtos != nil || config.RateLimiter != nil {
+		return ""
+	}
+
+	tls := config.TLSClientConfig
+	h := sha256.New()
+	fmt.Fprintf(h, "%q %q %q %q %q %q %q %v\n",
+		config.Host, config.APIPath, config.BearerToken, config.BearerTokenFile,
+		config.Username, config.Password, config.UserAgent, config.Timeout)
+	fmt.Fprintf(h, "%v %q %q %q %q %q %q %q\n",
+		tls.Insecure, tls.ServerName, tls.CertFile, tls.KeyFile, tls.CAFile,
+		tls.CertData, tls.KeyData, tls.CAData)
+	fmt.Fprintf(h, "%q %q %q %v\n",
+		config.Impersonate.UserName, config.Impersonate.UID, config.Impersonate.Groups, config.Impersonate.Extra)
+	fmt.Fprintf(h, "%v %d %v\n", config.QPS, config.Burst, config.DisableCompression)
+	return hex.EncodeToString(h.Sum(nil))
+}
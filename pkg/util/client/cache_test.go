@@ -0,0 +1,88 @@
+package client
+
+import (
+	"testing"
+
+	"k8s.io/client-go/rest"
+	clientcmdapi "k8s.io/client-go/tools/clientcmd/api"
+)
+
+// baseRESTConfig returns a config with credentials set, for restConfigKey tests.
+func baseRESTConfig() *rest.Config {
+	return &rest.Config{
+		Host:        "https://api.example.com:6443",
+		BearerToken: "token-a",
+		TLSClientConfig: rest.TLSClientConfig{
+			CAData: []byte("ca-a"),
+		},
+	}
+}
+
+func TestRestConfigKey_SameForIdenticalConfigs(t *testing.T) {
+	a, b := restConfigKey(baseRESTConfig()), restConfigKey(baseRESTConfig())
+	if a == "" {
+		t.Fatal("restConfigKey() should cache a plain config")
+	}
+	if a != b {
+		t.Errorf("identical configs should share a key, got %q and %q", a, b)
+	}
+}
+
+func TestRestConfigKey_DiffersByClusterAndCredentials(t *testing.T) {
+	base := restConfigKey(baseRESTConfig())
+
+	tests := []struct {
+		name   string
+		modify func(c *rest.Config)
+	}{
+		{"host", func(c *rest.Config) { c.Host = "https://other.example.com:6443" }},
+		{"bearer token", func(c *rest.Config) { c.BearerToken = "token-b" }},
+		{"bearer token file", func(c *rest.Config) { c.BearerTokenFile = "/var/run/token" }},
+		{"CA data", func(c *rest.Config) { c.TLSClientConfig.CAData = []byte("ca-b") }},
+		{"CA file", func(c *rest.Config) { c.TLSClientConfig.CAFile = "/etc/ca.crt" }},
+		{"client cert data", func(c *rest.Config) { c.TLSClientConfig.CertData = []byte("cert") }},
+		{"client key data", func(c *rest.Config) { c.TLSClientConfig.KeyData = []byte("key") }},
+		{"client cert file", func(c *rest.Config) { c.TLSClientConfig.CertFile = "/etc/tls.crt" }},
+		{"client key file", func(c *rest.Config) { c.TLSClientConfig.KeyFile = "/etc/tls.key" }},
+		{"insecure", func(c *rest.Config) { c.TLSClientConfig.Insecure = true }},
+		{"basic auth", func(c *rest.Config) { c.Username, c.Password = "admin", "secret" }},
+		{"impersonated user", func(c *rest.Config) { c.Impersonate.UserName = "alice" }},
+		{"impersonated groups", func(c *rest.Config) { c.Impersonate.Groups = []string{"admins"} }},
+	}
+
+	seen := map[string]string{base: "base"}
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			config := baseRESTConfig()
+			tt.modify(config)
+			key := restConfigKey(config)
+			if key == "" {
+				t.Fatal("restConfigKey() should cache the config")
+			}
+			if other, ok := seen[key]; ok {
+				t.Errorf("config with a different %s has the same key as %s", tt.name, other)
+			}
+			seen[key] = tt.name
+		})
+	}
+}
+
+func TestRestConfigKey_UncacheableConfigs(t *testing.T) {
+	tests := []struct {
+		name   string
+		modify func(c *rest.Config)
+	}{
+		{"exec plugin", func(c *rest.Config) { c.ExecProvider = &clientcmdapi.ExecConfig{Command: "aws"} }},
+		{"auth provider", func(c *rest.Config) { c.AuthProvider = &clientcmdapi.AuthProviderConfig{Name: "oidc"} }},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			config := baseRESTConfig()
+			tt.modify(config)
+			if key := restConfigKey(config); key != "" {
+				t.Errorf("restConfigKey() = %q, want \"\" (do not cache)", key)
+			}
+		})
+	}
+}
@@ -111,10 +111,18 @@ func GetDynamicClient(configFlags *genericclioptions.ConfigFlags) (dynamic.Inter
 		return nil, fmt.Errorf("failed to get REST config: %v", err)
 	}
 
+	key := restConfigKey(config)
+	if client, ok := dynamicClients.get(key); ok {
+		return client, nil
+	}
+
 	client, err := dynamic.NewForConfig(config)
 	if err != nil {
 		return nil, fmt.Errorf("failed to create dynamic client: %v", err)
 	}
+	if key != "" {
+		dynamicClients.set(key, client)
+	}
 
 	return client, nil
 }
@@ -126,10 +134,18 @@ func GetKubernetesClientset(configFlags *genericclioptions.ConfigFlags) (*kubern
 		return nil, fmt.Errorf("failed to get REST config: %v", err)
 	}
 
+	key := restConfigKey(config)
+	if clientset, ok := clientsets.get(key); ok {
+		return clientset, nil
+	}
+
 	clientset, err := kubernetes.NewForConfig(config)
 	if err != nil {
 		return nil, fmt.Errorf("failed to create kubernetes clientset: %v", err)
 	}
+	if key != "" {
+		clientsets.set(key, clientset)
+	}
 
 	return clientset, nil
 }
@@ -6,6 +6,7 @@ import (
 	"fmt"
 	"net/url"
 	"strings"
+	"time"
 
 	metav1 "k8s.io/apimachinery/pkg/apis/meta/v1"
 	"k8s.io/apimachinery/pkg/apis/meta/v1/unstructured"
@@ -204,13 +205,28 @@ func FetchAAPJobTemplatesWithInsecure(ctx context.Context, configFlags *genericc
 	return parseJSONResponse(responseBytes)
 }
 
-// DiscoverInventoryURL tries to discover the inventory URL from an OpenShift Route
+// inventoryURLCache holds discovered inventory URLs by API server, credentials
+// and namespace.
+var inventoryURLCache = ttlCache[string]{ttl: time.Minute}
+
+// DiscoverInventoryURL tries to discover the inventory URL from an OpenShift Route.
+// Successful discoveries are cached per API server, credentials and namespace
+// for a minute.
 func DiscoverInventoryURL(ctx context.Context, configFlags *genericclioptions.ConfigFlags, namespace string) string {
+	cacheKey := ClusterCacheKey(configFlags, namespace)
+	if inventoryURL, ok := inventoryURLCache.get(cacheKey); ok {
+		return inventoryURL
+	}
+
 	route, err := GetForkliftInventoryRoute(ctx, configFlags, namespace)
 	if err == nil && route != nil {
 		host, found, _ := unstructured.NestedString(route.Object, "spec", "host")
 		if found && host != "" {
-			return fmt.Sprintf("https://%s", host)
+			inventoryURL := fmt.Sprintf("https://%s", host)
+			if cacheKey != "" {
+				inventoryURLCache.set(cacheKey, inventoryURL)
+			}
+			return inventoryURL
 		}
 	}
 	return ""
@@ -3,6 +3,7 @@ package client
 import (
 	"context"
 	"strings"
+	"time"
 
 	metav1 "k8s.io/apimachinery/pkg/apis/meta/v1"
 	"k8s.io/apimachinery/pkg/apis/meta/v1/unstructured"
@@ -18,10 +19,32 @@ type MTVOperatorInfo struct {
 	Error     string
 }
 
+// operatorInfoCache holds operator discovery results by API server and
+// credentials. The operator version and namespace only change when the
+// operator is upgraded or reinstalled, so found operators are kept for several
+// minutes.
+var operatorInfoCache = ttlCache[MTVOperatorInfo]{ttl: 5 * time.Minute}
+
 // GetMTVOperatorInfo discovers information about the MTV Operator installation
 // by examining the providers.forklift.konveyor.io CRD annotations.
 // Returns operator version, namespace, whether the operator was found, and any error.
+// Found operators are cached per API server and credentials; errors and "not found" results
+// are not, so a newly installed operator is seen right away.
 func GetMTVOperatorInfo(ctx context.Context, configFlags *genericclioptions.ConfigFlags) MTVOperatorInfo {
+	cacheKey := ClusterCacheKey(configFlags)
+	if info, ok := operatorInfoCache.get(cacheKey); ok {
+		return info
+	}
+
+	info := discoverMTVOperatorInfo(ctx, configFlags)
+	if info.Found && info.Error == "" && cacheKey != "" {
+		operatorInfoCache.set(cacheKey, info)
+	}
+	return info
+}
+
+// discoverMTVOperatorInfo reads the operator information from the cluster.
+func discoverMTVOperatorInfo(ctx context.Context, configFlags *genericclioptions.ConfigFlags) MTVOperatorInfo {
 	info := MTVOperatorInfo{
 		Version:   "unknown",
 		Namespace: "",
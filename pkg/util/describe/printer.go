@@ -1,7 +1,6 @@
 package describe
 
 import (
-	"encoding/json"
 	"fmt"
 	"os"
 	"strings"
@@ -42,7 +41,7 @@ func Format(desc *Description, format string) (string, error) {
 // ---------------------------------------------------------------------------
 
 func formatJSON(desc *Description) (string, error) {
-	data, err := json.MarshalIndent(desc, "", "  ")
+	data, err := output.MarshalJSON(desc)
 	if err != nil {
 		return "", fmt.Errorf("failed to marshal description as JSON: %w", err)
 	}
@@ -2,8 +2,12 @@ package flags
 
 import (
 	"fmt"
+	"strings"
 )
 
+// esxiCloneMethods is the single source of truth for valid ESXi clone methods.
+var esxiCloneMethods = []string{"vib", "ssh"}
+
 // EsxiCloneMethodFlag implements pflag.Value interface for ESXi clone method validation
 type EsxiCloneMethodFlag struct {
 	value string
@@ -14,22 +18,13 @@ func (e *EsxiCloneMethodFlag) String() string {
 }
 
 func (e *EsxiCloneMethodFlag) Set(value string) error {
-	validMethods := []string{"vib", "ssh"}
-
-	isValid := false
-	for _, m := range validMethods {
-		if value == m {
-			isValid = true
-			break
+	for _, valid := range esxiCloneMethods {
+		if value == valid {
+			e.value = value
+			return nil
 		}
 	}
-
-	if !isValid {
-		return fmt.Errorf("invalid ESXi clone method: %s. Valid methods are: vib, ssh", value)
-	}
-
-	e.value = value
-	return nil
+	return fmt.Errorf("invalid ESXi clone method: %s. Valid methods are: %s", value, strings.Join(esxiCloneMethods, ", "))
 }
 
 func (e *EsxiCloneMethodFlag) Type() string {
@@ -43,7 +38,7 @@ func (e *EsxiCloneMethodFlag) GetValue() string {
 
 // GetValidValues returns all valid ESXi clone method values for auto-completion
 func (e *EsxiCloneMethodFlag) GetValidValues() []string {
-	return []string{"vib", "ssh"}
+	return esxiCloneMethods
 }
 
 // NewEsxiCloneMethodFlag creates a new ESXi clone method flag
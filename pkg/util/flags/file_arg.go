@@ -0,0 +1,60 @@
+package flags
+
+import (
+	"os"
+	"sync"
+	"time"
+)
+
+// fileArgCacheLimit bounds the number of files kept by ReadFileArg.
+const fileArgCacheLimit = 32
+
+// fileArgMaxCachedSize is the largest file ReadFileArg keeps in memory.
+// Certificates and playbooks are a few KB; anything larger is read each time.
+const fileArgMaxCachedSize = 1 << 20
+
+type fileArgEntry struct {
+	size    int64
+	modTime time.Time
+	content string
+}
+
+var (
+	fileArgMu    sync.Mutex
+	fileArgCache = map[string]fileArgEntry{}
+)
+
+// ReadFileArg returns the content of the file named by an "@filename" flag
+// value (the path without the "@"). Contents are cached by path, size and
+// modification time, so a long-lived process such as the MCP worker, which
+// runs many commands, only re-reads a file when it changes.
+func ReadFileArg(path string) (string, error) {
+	info, err := os.Stat(path)
+	if err != nil {
+		return "", err
+	}
+
+	fileArgMu.Lock()
+	entry, ok := fileArgCache[path]
+	fileArgMu.Unlock()
+	if ok && entry.size == info.Size() && entry.modTime.Equal(info.ModTime()) {
+		return entry.content, nil
+	}
+
+	data, err := os.ReadFile(path)
+	if err != nil {
+		return "", err
+	}
+	content := string(data)
+	if info.Size() > fileArgMaxCachedSize {
+		return content, nil
+	}
+
+	fileArgMu.Lock()
+	if len(fileArgCache) >= fileArgCacheLimit {
+		clear(fileArgCache)
+	}
+	fileArgCache[path] = fileArgEntry{size: info.Size(), modTime: info.ModTime(), content: content}
+	fileArgMu.Unlock()
+	return content, nil
+}
@@ -0,0 +1,38 @@
+package flags
+
+import (
+	"os"
+	"path/filepath"
+	"testing"
+	"time"
+)
+
+func TestReadFileArg(t *testing.T) {
+	path := filepath.Join(t.TempDir(), "ca.pem")
+	if err := os.WriteFile(path, []byte("cert-1"), 0o600); err != nil {
+		t.Fatal(err)
+	}
+
+	for i := 0; i < 2; i++ {
+		got, err := ReadFileArg(path)
+		if err != nil || got != "cert-1" {
+			t.Fatalf("ReadFileArg() = %q, %v, want %q", got, err, "cert-1")
+		}
+	}
+
+	// A changed file is read again
+	if err := os.WriteFile(path, []byte("cert-22"), 0o600); err != nil {
+		t.Fatal(err)
+	}
+	later := time.Now().Add(time.Minute)
+	if err := os.Chtimes(path, later, later); err != nil {
+		t.Fatal(err)
+	}
+	if got, err := ReadFileArg(path); err != nil || got != "cert-22" {
+		t.Fatalf("ReadFileArg() after change = %q, %v, want %q", got, err, "cert-22")
+	}
+
+	if _, err := ReadFileArg(filepath.Join(t.TempDir(), "missing.pem")); err == nil {
+		t.Fatal("ReadFileArg() of a missing file should fail")
+	}
+}
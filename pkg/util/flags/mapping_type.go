@@ -2,8 +2,12 @@ package flags
 
 import (
 	"fmt"
+	"strings"
 )
 
+// mappingTypes is the single source of truth for valid mapping types.
+var mappingTypes = []string{"network", "storage"}
+
 // MappingTypeFlag implements pflag.Value interface for mapping type validation
 type MappingTypeFlag struct {
 	value string
@@ -14,22 +18,13 @@ func (m *MappingTypeFlag) String() string {
 }
 
 func (m *MappingTypeFlag) Set(value string) error {
-	validTypes := []string{"network", "storage"}
-
-	isValid := false
-	for _, validType := range validTypes {
-		if value == validType {
-			isValid = true
-			break
+	for _, valid := range mappingTypes {
+		if value == valid {
+			m.value = value
+			return nil
 		}
 	}
-
-	if !isValid {
-		return fmt.Errorf("invalid mapping type: %s. Valid types are: network, storage", value)
-	}
-
-	m.value = value
-	return nil
+	return fmt.Errorf("invalid mapping type: %s. Valid types are: %s", value, strings.Join(mappingTypes, ", "))
 }
 
 func (m *MappingTypeFlag) Type() string {
@@ -43,7 +38,7 @@ func (m *MappingTypeFlag) GetValue() string {
 
 // GetValidValues returns all valid mapping type values for auto-completion
 func (m *MappingTypeFlag) GetValidValues() []string {
-	return []string{"network", "storage"}
+	return mappingTypes
 }
 
 // NewMappingTypeFlag creates a new mapping type flag with default value "network"
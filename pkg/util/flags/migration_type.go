@@ -6,6 +6,9 @@ import (
 	"github.com/kubev2v/forklift/pkg/apis/forklift/v1beta1"
 )
 
+// migrationTypes lists the valid migration types.
+var migrationTypes = []v1beta1.MigrationType{v1beta1.MigrationCold, v1beta1.MigrationWarm, v1beta1.MigrationLive, v1beta1.MigrationOnlyConversion}
+
 // MigrationTypeFlag implements pflag.Value interface for migration type validation
 type MigrationTypeFlag struct {
 	value v1beta1.MigrationType
@@ -16,10 +19,8 @@ func (m *MigrationTypeFlag) String() string {
 }
 
 func (m *MigrationTypeFlag) Set(value string) error {
-	validTypes := []v1beta1.MigrationType{v1beta1.MigrationCold, v1beta1.MigrationWarm, v1beta1.MigrationLive, v1beta1.MigrationOnlyConversion}
-
 	isValid := false
-	for _, validType := range validTypes {
+	for _, validType := range migrationTypes {
 		if v1beta1.MigrationType(value) == validType {
 			isValid = true
 			break
@@ -2,8 +2,12 @@ package flags
 
 import (
 	"fmt"
+	"strings"
 )
 
+// sdkEndpointTypes is the single source of truth for valid SDK endpoint types.
+var sdkEndpointTypes = []string{"vcenter", "esxi"}
+
 // SdkEndpointTypeFlag implements pflag.Value interface for SDK endpoint type validation
 type SdkEndpointTypeFlag struct {
 	value string
@@ -14,22 +18,13 @@ func (s *SdkEndpointTypeFlag) String() string {
 }
 
 func (s *SdkEndpointTypeFlag) Set(value string) error {
-	validTypes := []string{"vcenter", "esxi"}
-
-	isValid := false
-	for _, validType := range validTypes {
-		if value == validType {
-			isValid = true
-			break
+	for _, valid := range sdkEndpointTypes {
+		if value == valid {
+			s.value = value
+			return nil
 		}
 	}
-
-	if !isValid {
-		return fmt.Errorf("invalid SDK endpoint type: %s. Valid types are: vcenter, esxi", value)
-	}
-
-	s.value = value
-	return nil
+	return fmt.Errorf("invalid SDK endpoint type: %s. Valid types are: %s", value, strings.Join(sdkEndpointTypes, ", "))
 }
 
 func (s *SdkEndpointTypeFlag) Type() string {
@@ -43,7 +38,7 @@ func (s *SdkEndpointTypeFlag) GetValue() string {
 
 // GetValidValues returns all valid SDK endpoint type values for auto-completion
 func (s *SdkEndpointTypeFlag) GetValidValues() []string {
-	return []string{"vcenter", "esxi"}
+	return sdkEndpointTypes
 }
 
 // NewSdkEndpointTypeFlag creates a new SDK endpoint type flag
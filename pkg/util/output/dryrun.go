@@ -1,7 +1,6 @@
 package output
 
 import (
-	"encoding/json"
 	"fmt"
 
 	"sigs.k8s.io/yaml"
@@ -26,7 +25,7 @@ func OutputResource(obj interface{}, format string) error {
 		fmt.Print(string(data))
 		return nil
 	case "json":
-		data, err := json.MarshalIndent(obj, "", "  ")
+		data, err := MarshalJSON(obj)
 		if err != nil {
 			return fmt.Errorf("failed to marshal resource to JSON: %v", err)
 		}
@@ -23,16 +23,33 @@ func PrintJSONWithEmpty(data interface{}, emptyMessage string) error {
 		printer.AddItem(item)
 	} else {
 		// Fallback: marshal any data
-		b, err := json.MarshalIndent(data, "", "  ")
-		if err != nil {
-			return err
-		}
-		_, err = fmt.Fprintln(os.Stdout, string(b))
-		return err
+		return printer.encode(data)
 	}
 	return printer.Print()
 }
 
+// jsonIndentEnabled controls whether pretty-printed JSON output is indented.
+// Defaults to true; the MCP server turns it off with the hidden
+// --compact-json flag, since its consumers do not read the layout and
+// compact output is smaller and faster to encode and parse.
+var jsonIndentEnabled = true
+
+// SetJSONIndentEnabled globally enables or disables indentation of
+// pretty-printed JSON output.
+func SetJSONIndentEnabled(enabled bool) { jsonIndentEnabled = enabled }
+
+// IsJSONIndentEnabled reports whether pretty-printed JSON output is indented.
+func IsJSONIndentEnabled() bool { return jsonIndentEnabled }
+
+// MarshalJSON encodes v as JSON, indented unless indentation is disabled
+// with SetJSONIndentEnabled.
+func MarshalJSON(v interface{}) ([]byte, error) {
+	if !jsonIndentEnabled {
+		return json.Marshal(v)
+	}
+	return json.MarshalIndent(v, "", "  ")
+}
+
 // JSONPrinter prints data as JSON
 type JSONPrinter struct {
 	items       []map[string]interface{}
@@ -75,52 +92,31 @@ func (j *JSONPrinter) AddItems(items []map[string]interface{}) *JSONPrinter {
 
 // Print outputs the items as JSON
 func (j *JSONPrinter) Print() error {
-	var data []byte
-	var err error
-
-	if j.prettyPrint {
-		data, err = json.MarshalIndent(j.items, "", "  ")
-	} else {
-		data, err = json.Marshal(j.items)
-	}
-
-	if err != nil {
-		return fmt.Errorf("failed to marshal JSON: %v", err)
-	}
-
-	_, err = fmt.Fprintln(j.writer, string(data))
-	return err
+	return j.encode(j.items)
 }
 
 // PrintEmpty outputs an empty JSON array or a message when there are no items
 func (j *JSONPrinter) PrintEmpty(message string) error {
-	var data []byte
-	var err error
-
 	if message == "" {
 		// If no message, just print an empty array
-		if j.prettyPrint {
-			data, err = json.MarshalIndent([]interface{}{}, "", "  ")
-		} else {
-			data, err = json.Marshal([]interface{}{})
-		}
-	} else {
-		// If message provided, print only the message
-		result := map[string]interface{}{
-			"message": message,
-		}
-
-		if j.prettyPrint {
-			data, err = json.MarshalIndent(result, "", "  ")
-		} else {
-			data, err = json.Marshal(result)
-		}
+		return j.encode([]interface{}{})
 	}
 
-	if err != nil {
+	// If message provided, print only the message
+	return j.encode(map[string]interface{}{
+		"message": message,
+	})
+}
+
+// encode writes data as JSON followed by a newline. The encoder writes its
+// buffer to the writer directly, so large outputs are not copied into a string.
+func (j *JSONPrinter) encode(data interface{}) error {
+	encoder := json.NewEncoder(j.writer)
+	if j.prettyPrint && jsonIndentEnabled {
+		encoder.SetIndent("", "  ")
+	}
+	if err := encoder.Encode(data); err != nil {
 		return fmt.Errorf("failed to marshal JSON: %v", err)
 	}
-
-	_, err = fmt.Fprintln(j.writer, string(data))
-	return err
+	return nil
 }
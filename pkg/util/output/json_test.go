@@ -0,0 +1,65 @@
+package output
+
+import (
+	"bytes"
+	"encoding/json"
+	"testing"
+)
+
+func TestJSONPrinter_Print(t *testing.T) {
+	items := []map[string]interface{}{
+		{"name": "plan1", "source": "<vsphere>"},
+		{"name": "plan2", "vms": []interface{}{"vm-1", "vm-2"}},
+	}
+
+	for _, pretty := range []bool{false, true} {
+		var buf bytes.Buffer
+		if err := NewJSONPrinter().WithWriter(&buf).WithPrettyPrint(pretty).AddItems(items).Print(); err != nil {
+			t.Fatalf("Print() error = %v", err)
+		}
+
+		want, _ := json.Marshal(items)
+		if pretty {
+			want, _ = json.MarshalIndent(items, "", "  ")
+		}
+		if got := buf.String(); got != string(want)+"\n" {
+			t.Errorf("Print(pretty=%v) = %q, want %q", pretty, got, string(want)+"\n")
+		}
+	}
+}
+
+func TestJSONPrinter_PrintEmpty(t *testing.T) {
+	var buf bytes.Buffer
+	if err := NewJSONPrinter().WithWriter(&buf).PrintEmpty(""); err != nil {
+		t.Fatalf("PrintEmpty() error = %v", err)
+	}
+	if got := buf.String(); got != "[]\n" {
+		t.Errorf("PrintEmpty(\"\") = %q, want %q", got, "[]\n")
+	}
+
+	buf.Reset()
+	if err := NewJSONPrinter().WithWriter(&buf).PrintEmpty("No plans found"); err != nil {
+		t.Fatalf("PrintEmpty() error = %v", err)
+	}
+	if got := buf.String(); got != `{"message":"No plans found"}`+"\n" {
+		t.Errorf("PrintEmpty(message) = %q", got)
+	}
+}
+
+func TestJSONPrinter_IndentDisabled(t *testing.T) {
+	defer SetJSONIndentEnabled(true)
+	SetJSONIndentEnabled(false)
+
+	items := []map[string]interface{}{{"name": "plan1"}}
+	var buf bytes.Buffer
+	if err := NewJSONPrinter().WithWriter(&buf).WithPrettyPrint(true).AddItems(items).Print(); err != nil {
+		t.Fatalf("Print() error = %v", err)
+	}
+	if got := buf.String(); got != `[{"name":"plan1"}]`+"\n" {
+		t.Errorf("Print() with indentation disabled = %q, want compact JSON", got)
+	}
+
+	if data, _ := MarshalJSON(items[0]); string(data) != `{"name":"plan1"}` {
+		t.Errorf("MarshalJSON() with indentation disabled = %q, want compact JSON", data)
+	}
+}
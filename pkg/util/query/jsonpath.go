@@ -7,6 +7,13 @@ import (
 	"strings"
 )
 
+// Path part matchers for wildcard [*], array index [i] and map key [key] notation
+var (
+	wildcardPartRegexp = regexp.MustCompile(`(.*)\[\*\]$`)
+	arrayPartRegexp    = regexp.MustCompile(`(.*)\[(\d+)\]$`)
+	mapPartRegexp      = regexp.MustCompile(`(.*)\[([^\]]+)\]$`)
+)
+
 // GetValueByPathString gets a value from an object using a string path
 // The path can use dot notation (e.g. "metadata.name") and array indexing (e.g. "spec.containers[0].name")
 func GetValueByPathString(obj interface{}, path string) (interface{}, error) {
@@ -72,10 +79,13 @@ func getValueByPath(obj interface{}, pathParts []string) (interface{}, error) {
 	mapKey := ""
 	isWildcard := false
 
-	// Run regex matchers
-	wildcardMatch := regexp.MustCompile(`(.*)\[\*\]$`).FindStringSubmatch(part)
-	arrayMatch := regexp.MustCompile(`(.*)\[(\d+)\]$`).FindStringSubmatch(part)
-	mapMatch := regexp.MustCompile(`(.*)\[([^\]]+)\]$`).FindStringSubmatch(part)
+	// Run regex matchers (only a part ending in "]" can have an index)
+	var wildcardMatch, arrayMatch, mapMatch []string
+	if strings.HasSuffix(part, "]") {
+		wildcardMatch = wildcardPartRegexp.FindStringSubmatch(part)
+		arrayMatch = arrayPartRegexp.FindStringSubmatch(part)
+		mapMatch = mapPartRegexp.FindStringSubmatch(part)
+	}
 
 	// Then use flat if conditions to process matches
 	if len(wildcardMatch) == 2 {
@@ -9,6 +9,9 @@ import (
 
 var selectRegexp = regexp.MustCompile(`(?i)^(?:(sum|len|any|all)\s*\(?\s*([^)\s]+)\s*\)?|(.+?))\s*(?:as\s+(.+))?$`)
 
+// limitRegexp extracts the row count of a LIMIT clause
+var limitRegexp = regexp.MustCompile(`(?i)limit\s+(\d+)`)
+
 // parseSelectClause splits and parses a select clause into SelectOptions entries.
 func parseSelectClause(selectClause string) []SelectOption {
 	var opts []SelectOption
@@ -193,8 +196,7 @@ func ParseQueryString(query string) (*QueryOptions, error) {
 	}
 
 	// Extract LIMIT clause using regex (for simplicity with number extraction)
-	limitRegex := regexp.MustCompile(`(?i)limit\s+(\d+)`)
-	limitMatches := limitRegex.FindStringSubmatch(query)
+	limitMatches := limitRegexp.FindStringSubmatch(query)
 	if len(limitMatches) > 1 {
 		limit, err := strconv.Atoi(limitMatches[1])
 		if err != nil {
@@ -22,6 +22,9 @@ var keywords = []QueryKeyword{
 	{"LIMIT", regexp.MustCompile(`(?i)\blimit\b`), 4},
 }
 
+// wordRegexp splits a query into words for typo checks
+var wordRegexp = regexp.MustCompile(`\b\w+\b`)
+
 // Common typos and their corrections
 var typoCorrections = map[string]string{
 	"selct":  "SELECT",
@@ -105,7 +108,7 @@ func ValidateQuerySyntax(query string) error {
 // checkTypos looks for common keyword typos and suggests corrections
 func checkTypos(query string) error {
 	queryLower := strings.ToLower(query)
-	words := regexp.MustCompile(`\b\w+\b`).FindAllString(queryLower, -1)
+	words := wordRegexp.FindAllString(queryLower, -1)
 
 	for _, word := range words {
 		if correction, found := typoCorrections[word]; found && word != strings.ToLower(correction) {
@@ -251,9 +254,7 @@ func checkEmptyClauses(query string, occurrences []KeywordOccurrence) error {
 		keywordEndPos := pos + len(keywordName)
 		if strings.Contains(keywordName, " ") {
 			// For multi-word keywords like "ORDER BY", we need to be more careful
-			pattern := strings.ReplaceAll(keywordName, " ", `\s+`)
-			regex := regexp.MustCompile(`(?i)` + pattern)
-			match := regex.FindStringIndex(queryLower[pos:])
+			match := occ.Keyword.Pattern.FindStringIndex(queryLower[pos:])
 			if match != nil {
 				keywordEndPos = pos + match[1]
 			}